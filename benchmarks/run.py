@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Ge-ez Benchmark Runner
+Times the lexer, parser and interpreter over the benchmark workloads
+
+Usage:
+    python benchmarks/run.py                           # run and print
+    python benchmarks/run.py --output baseline.json    # save results
+    python benchmarks/run.py --compare baseline.json   # flag regressions
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Run from a checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geez import __version__  # noqa: E402
+from geez.lexer import GeEzLexer  # noqa: E402
+from geez.parser import GeEzParser  # noqa: E402
+from geez.interpreter import GeEzInterpreter  # noqa: E402
+from geez.vm import GeEzVM  # noqa: E402
+from workloads import WORKLOADS, Workload  # noqa: E402
+
+STAGES = ("lex", "parse", "interpret")
+
+# A regression must be slower than the baseline by this fraction...
+DEFAULT_THRESHOLD = 0.10
+# ...and by more than this many standard deviations of either run
+NOISE_DEVIATIONS = 2.0
+
+
+def measure(
+    operation: Callable[[], Any], repeat: int, min_time: float
+) -> Dict[str, Any]:
+    """Time an operation: repeat rounds, each running it for at least min_time"""
+    operation()  # warm up caches and compiled code
+
+    # Calibrate how many calls make a round last min_time
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    rates = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            operation()
+        rates.append(number / (time.perf_counter() - start))
+
+    return {
+        "ops_per_sec": statistics.mean(rates),
+        "stdev": statistics.stdev(rates) if len(rates) > 1 else 0.0,
+        "rounds": rates,
+        "calls_per_round": number,
+    }
+
+
+def stage_operations(workload: Workload, backend: type) -> Dict[str, Callable[[], Any]]:
+    """Zero-argument callables running each stage of a workload"""
+    source = workload.source
+    # The compact token buffer the interpreter parses (geez.cache.parse_source)
+    tokens = GeEzLexer().tokenize_buffer(source)
+
+    def interpret():
+        interpreter = backend()
+        # Imports read modules from the working directory on every run
+        interpreter.use_geezc_cache = False
+        interpreter.interpret(source)
+
+    return {
+        "lex": lambda: GeEzLexer().tokenize_buffer(source),
+        "parse": lambda: GeEzParser(tokens).parse(),
+        "interpret": interpret,
+    }
+
+
+def check_workload(name: str, workload: Workload, backend: type) -> None:
+    """Run a workload once so that errors are raised instead of printed"""
+    from geez.cache import parse_source
+
+    interpreter = backend()
+    interpreter.use_geezc_cache = False
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            try:
+                interpreter.run(parse_source(workload.source))
+            except Exception as e:
+                raise RuntimeError(f"Workload {name} failed: {e}") from e
+
+
+def run_workload(
+    name: str, args: argparse.Namespace, backend: type
+) -> Dict[str, Dict[str, Any]]:
+    """Benchmark every stage of one workload"""
+    workload = WORKLOADS[name](args.scale)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for module_name, module_source in workload.modules.items():
+            path = os.path.join(directory, f"{module_name}.geez")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(module_source)
+
+        previous = os.getcwd()
+        os.chdir(directory)
+        try:
+            check_workload(name, workload, backend)
+            operations = stage_operations(workload, backend)
+            with open(os.devnull, "w", encoding="utf-8") as devnull:
+                with contextlib.redirect_stdout(devnull):
+                    for stage in args.stages:
+                        results[stage] = measure(
+                            operations[stage], args.repeat, args.min_time
+                        )
+        finally:
+            os.chdir(previous)
+    return results
+
+
+def format_rate(result: Dict[str, Any]) -> str:
+    """ops/sec with its relative standard deviation"""
+    rate = result["ops_per_sec"]
+    spread = 100 * result["stdev"] / rate if rate else 0.0
+    return f"{rate:12.2f} ops/s ±{spread:5.1f}%"
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Print the change against a baseline and return the regressions"""
+    regressions = []
+    version = baseline.get("version", "?")
+    print(f"\nCompared with {version} ({baseline.get('timestamp', '?')}):")
+    for name, stages in results["workloads"].items():
+        for stage, result in stages.items():
+            old = baseline.get("workloads", {}).get(name, {}).get(stage)
+            if old is None:
+                continue
+            change = result["ops_per_sec"] / old["ops_per_sec"] - 1
+            noise = NOISE_DEVIATIONS * max(result["stdev"], old["stdev"])
+            slower = old["ops_per_sec"] - result["ops_per_sec"]
+            status = ""
+            if change < -threshold and slower > noise:
+                status = "  REGRESSION"
+                regressions.append(f"{name}/{stage}")
+            elif change > threshold and -slower > noise:
+                status = "  faster"
+            print(f"  {name:<22}{stage:<11}{change:+8.1%}{status}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark runner entry point; returns 1 when regressions were found"""
+    parser = argparse.ArgumentParser(description="Ge-ez benchmarks")
+    parser.add_argument(
+        "workloads",
+        nargs="*",
+        help=f"Workloads to run (default: all of {', '.join(WORKLOADS)})",
+    )
+    parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=STAGES,
+        default=list(STAGES),
+        help="Stages to time (default: all)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["interpreter", "vm"],
+        default="interpreter",
+        help="Execution backend for the interpret stage",
+    )
+    parser.add_argument("--scale", type=int, default=1, help="Workload size multiplier")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds per measurement")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Minimum seconds per round"
+    )
+    parser.add_argument("--output", metavar="FILE", help="Save results as JSON")
+    parser.add_argument(
+        "--compare", metavar="BASELINE", help="Flag regressions against saved results"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Slowdown that counts as a regression (default: 0.10 for 10%%)",
+    )
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.workloads if name not in WORKLOADS]
+    if unknown:
+        parser.error(f"unknown workload: {', '.join(unknown)}")
+
+    backend = GeEzVM if args.backend == "vm" else GeEzInterpreter
+    names = args.workloads or list(WORKLOADS)
+    results: Dict[str, Any] = {
+        "version": __version__,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": args.backend,
+        "scale": args.scale,
+        "workloads": {},
+    }
+
+    for name in names:
+        stages = run_workload(name, args, backend)
+        results["workloads"][name] = stages
+        for stage, result in stages.items():
+            print(f"{name:<22}{stage:<11}{format_rate(result)}")
+            sys.stdout.flush()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\nSaved results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+        print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Ge-ez Benchmark Workloads
+Synthetic programs exercising one kind of work each
+"""
+
+import os
+from typing import Callable, Dict, NamedTuple
+
+# Repository examples that run to completion and read no input
+EXAMPLES_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples"
+)
+
+
+class Workload(NamedTuple):
+    """A program plus the modules it imports, by module name"""
+
+    source: str
+    modules: Dict[str, str] = {}
+
+
+def loops(scale: int) -> Workload:
+    """Nested while and for loops doing arithmetic on globals"""
+    return Workload(
+        f"""
+አስተዋውቅ ድምር = 0
+አስተዋውቅ i = 0
+በመሆኑ i < {200 * scale} {{
+    ለ j በ ወሰን(50) {{
+        ድምር = ድምር + i * j - j / 2
+    }}
+    i = i + 1
+}}
+ማተም ድምር
+"""
+    )
+
+
+def recursion(scale: int) -> Workload:
+    """Recursive function calls with returns"""
+    depth = 14 + min(scale, 6)
+    return Workload(
+        f"""
+ተግባር ፊቦ(n) {{
+    ከሆነ n < 2 {{
+        ተመለስ n
+    }}
+    ተመለስ ፊቦ(n - 1) + ፊቦ(n - 2)
+}}
+ማተም ፊቦ({depth})
+"""
+    )
+
+
+def strings(scale: int) -> Workload:
+    """Building strings by repeated concatenation"""
+    return Workload(
+        f"""
+አስተዋውቅ ጽሑፍ = ""
+ለ i በ ወሰን({2000 * scale}) {{
+    ጽሑፍ = ጽሑፍ + "ሀ" + i
+}}
+ማተም ጽሑፍ
+"""
+    )
+
+
+def dictionaries(scale: int) -> Workload:
+    """Inserting into and reading from dictionaries"""
+    return Workload(
+        f"""
+አስተዋውቅ መዝገብ = {{"ጀምር": 0}}
+ለ i በ ወሰን({2000 * scale}) {{
+    ጨምር_ወደ መዝገብ i i * 2
+}}
+አስተዋውቅ ድምር = 0
+ለ i በ ወሰን({2000 * scale}) {{
+    ድምር = ድምር + መዝገብ[i]
+}}
+ማተም ድምር
+"""
+    )
+
+
+def classes(scale: int) -> Workload:
+    """Creating instances and calling methods that update properties"""
+    return Workload(
+        f"""
+ክፍል ቆጣሪ {{
+    ዘዴ መጀመሪያ(ራሱ, ጅምር) {{
+        ራሱ.ዋጋ = ጅምር
+    }}
+    ዘዴ አሳድግ(መጠን) {{
+        ራሱ.ዋጋ = ራሱ.ዋጋ + መጠን
+    }}
+}}
+አስተዋውቅ ድምር = 0
+ለ i በ ወሰን({300 * scale}) {{
+    አስተዋውቅ ቆ = አዲስ ቆጣሪ(i)
+    ቆ.አሳድግ(1)
+    ቆ.አሳድግ(2)
+    ድምር = ድምር + ቆ.ዋጋ
+}}
+ማተም ድምር
+"""
+    )
+
+
+def imports(scale: int) -> Workload:
+    """Importing several modules and calling their functions"""
+    count = 10
+    modules = {
+        f"bench_module_{index}": f"""
+አስተዋውቅ መሠረት = {index}
+ተግባር አባዛ(x) {{
+    x * 2 + {index}
+}}
+ተግባር ደምር(x, y) {{
+    x + y
+}}
+"""
+        for index in range(count)
+    }
+    lines = [f"አመጣ bench_module_{index}" for index in range(count)]
+    lines.append("ከ bench_module_0 አመጣ ደምር")
+    lines.append("አስተዋውቅ ድምር = 0")
+    lines.append(f"ለ i በ ወሰን({50 * scale}) {{")
+    for index in range(count):
+        lines.append(f"    ድምር = ድምር + bench_module_{index}.አባዛ(i)")
+    lines.append("    ድምር = ደምር(ድምር, 1)")
+    lines.append("}")
+    lines.append("ማተም ድምር")
+    return Workload("\n".join(lines) + "\n", modules)
+
+
+def example(filename: str) -> Callable[[int], Workload]:
+    """Workload running an example program from the repository as is"""
+
+    def load(scale: int) -> Workload:
+        with open(os.path.join(EXAMPLES_DIRECTORY, filename), encoding="utf-8") as f:
+            return Workload(f.read())
+
+    load.__doc__ = f"examples/{filename}"
+    return load
+
+
+WORKLOADS: Dict[str, Callable[[int], Workload]] = {
+    "loops": loops,
+    "recursion": recursion,
+    "strings": strings,
+    "dictionaries": dictionaries,
+    "classes": classes,
+    "imports": imports,
+    "example_performance": example("performance_test.geez"),
+}
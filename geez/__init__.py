@@ -22,8 +22,25 @@ __version__ = "0.1.0"
 __author__ = "Mighty Shambel"
 __description__ = "Amharic Programming Language"
 
-from .lexer import GeEzLexer, Token
-from .parser import GeEzParser
-from .interpreter import GeEzInterpreter
+__all__ = ["GeEzLexer", "Token", "GeEzParser", "GeEzInterpreter", "GeEzVM"]
 
-__all__ = ["GeEzLexer", "Token", "GeEzParser", "GeEzInterpreter"]
+# Module of each export; they are imported on first use, so that commands
+# like `geez run --client` start without loading the interpreter
+_EXPORTS = {
+    "GeEzLexer": "lexer",
+    "Token": "lexer",
+    "GeEzParser": "parser",
+    "GeEzInterpreter": "interpreter",
+    "GeEzVM": "vm",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,321 @@
+"""
+Ge-ez Batch Runner
+Runs many programs in parallel for `geez batch` and reports how each went
+
+Programs run on a pool of worker processes, one per core by default.
+Each worker imports the package and warms its backend up once, then
+runs program after program with a fresh interpreter, so programs do not
+see each other's variables. They share the worker's parsed files but not
+its loaded modules: every program runs the top-level code of the modules
+it imports, whichever worker it lands on.
+"""
+
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import json
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+from .modules import MODULE_SUFFIX
+
+# Columns of CSV reports, in order
+REPORT_FIELDS = ("path", "status", "error", "seconds", "stdout", "stderr")
+
+# Seconds a program may go over --timeout before the worker interrupts it,
+# which catches programs stuck where the limits are not checked (parsing)
+_ALARM_GRACE = 1.0
+
+# Options of the batch, set once in each worker
+_worker_options: Dict[str, Any] = {}
+
+
+def collect_programs(sources: List[str]) -> List[str]:
+    """Files named by globs and manifests, in order and each once
+
+    A source that is an existing file without the .geez suffix is a
+    manifest: one path or glob per line, relative to the manifest's
+    directory, with blank lines and lines starting with # skipped.
+    """
+    programs: List[str] = []
+    seen = set()
+    for source in sources:
+        if os.path.isfile(source) and not source.endswith(MODULE_SUFFIX):
+            directory = os.path.dirname(source)
+            with open(source, "r", encoding="utf-8") as f:
+                patterns = [line.strip() for line in f]
+            patterns = [
+                os.path.join(directory, pattern)
+                for pattern in patterns
+                if pattern and not pattern.startswith("#")
+            ]
+        else:
+            patterns = [source]
+        for pattern in patterns:
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches and not glob.has_magic(pattern):
+                # Reported as a program that cannot be found
+                matches = [pattern]
+            for path in matches:
+                if path not in seen:
+                    seen.add(path)
+                    programs.append(path)
+    return programs
+
+
+def _start_worker(options: Dict[str, Any]) -> None:
+    """Keep the batch options and warm the backend up in a new worker"""
+    from .server import WARM_UP_PROGRAM
+
+    _worker_options.update(options)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _new_interpreter(None).interpret(WARM_UP_PROGRAM)
+
+
+def _new_interpreter(output: Any) -> Any:
+    """Interpreter for one program, configured by the batch options"""
+    from .interpreter import GeEzInterpreter
+    from .limits import Limits
+    from .vm import GeEzVM
+
+    options = _worker_options
+    limits = Limits(*options.get("limits", (None, None, None)))
+    if not (limits.counts_steps or limits.counts_memory):
+        limits = None
+    backend = GeEzVM if options.get("backend") == "vm" else GeEzInterpreter
+    interpreter = backend(output, limits)
+    interpreter.use_geezc_cache = not options.get("no_cache", False)
+    interpreter.use_optimizer = options.get("optimize", False)
+    # Module state must not carry over from the worker's previous programs
+    interpreter.share_modules = False
+    return interpreter
+
+
+def _interrupt(signum: int, frame: Any) -> None:
+    """Stop a program that went over its timeout without the limits noticing"""
+    from .errors import AmharicErrorMessages
+    from .limits import ResourceLimitError
+
+    raise ResourceLimitError(
+        AmharicErrorMessages.get_interpreter_error(
+            "time_limit_exceeded", limit=_worker_options["limits"][2]
+        )
+    )
+
+
+def run_program(path: str) -> Dict[str, Any]:
+    """Run one program in this worker; returns its report entry
+
+    The status is 0 when the program ran to the end and 1 when it failed,
+    in which case its output ends with the error as `geez` prints it.
+    """
+    from .output import StdoutSink
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    stdin = io.StringIO(_worker_options.get("input") or "")
+    status = 0
+    error = None
+    start = time.perf_counter()
+    timeout = _worker_options.get("limits", (None, None, None))[2]
+    alarm = timeout is not None and hasattr(signal, "setitimer")
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        saved_stdin = sys.stdin
+        sys.stdin = stdin
+        interpreter = _new_interpreter(StdoutSink("size"))
+        if alarm:
+            signal.signal(signal.SIGALRM, _interrupt)
+            signal.setitimer(signal.ITIMER_REAL, timeout + _ALARM_GRACE)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                code = f.read()
+        except OSError as e:
+            print(f"ፋይል አልተገኘም: {path}")
+            status, error = 1, type(e).__name__
+        else:
+            try:
+                interpreter.run_source(code, filename=path)
+            except Exception as e:
+                interpreter.report_error(e)
+                status, error = 1, type(e).__name__
+        finally:
+            if alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            interpreter.output.flush()
+            sys.stdin = saved_stdin
+    return {
+        "path": path,
+        "status": status,
+        "error": error,
+        "seconds": round(time.perf_counter() - start, 6),
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def run_batch(
+    programs: List[str], options: Dict[str, Any], jobs: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Run programs on a pool of workers; returns their entries in order
+
+    Programs left unfinished when a worker dies (killed for memory, for
+    instance) get status -1.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    # Small chunks keep workers busy when a few programs are slow
+    chunksize = max(1, min(32, len(programs) // (jobs * 8)))
+    results: List[Dict[str, Any]] = []
+    pool = ProcessPoolExecutor(jobs, initializer=_start_worker, initargs=(options,))
+    with pool:
+        try:
+            for result in pool.map(run_program, programs, chunksize=chunksize):
+                results.append(result)
+        except BrokenProcessPool as e:
+            for path in programs[len(results) :]:
+                results.append(
+                    {
+                        "path": path,
+                        "status": -1,
+                        "error": type(e).__name__,
+                        "seconds": 0.0,
+                        "stdout": "",
+                        "stderr": str(e),
+                    }
+                )
+    return results
+
+
+def write_report(
+    results: List[Dict[str, Any]],
+    summary: Dict[str, Any],
+    target: str,
+    report_format: str,
+) -> None:
+    """Write the report to a file or - as JSON (summary and results) or CSV"""
+    if target == "-":
+        stream = contextlib.nullcontext(sys.stdout)
+    else:
+        stream = open(target, "w", encoding="utf-8", newline="")
+    with stream as f:
+        if report_format == "csv":
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+        else:
+            json.dump(dict(summary, results=results), f, ensure_ascii=False, indent=2)
+            f.write("\n")
+
+
+def batch_main(argv: List[str]) -> int:
+    """Entry point of `geez batch`"""
+    from .cli import memory_size
+
+    parser = argparse.ArgumentParser(
+        prog="geez batch", description="Run many Ge-ez programs in parallel"
+    )
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        metavar="GLOB|MANIFEST",
+        help="Programs to run: globs (** included) or files listing one per line",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["interpreter", "vm"],
+        default="interpreter",
+        help="Execution backend: tree-walking interpreter or bytecode VM",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write parsed programs in __geezcache__",
+    )
+    parser.add_argument(
+        "-O",
+        "--optimize",
+        action="store_true",
+        help="Fold constant expressions and drop dead branches before running",
+    )
+    parser.add_argument(
+        "--input",
+        metavar="FILE",
+        help="Input every program reads with ግብአት (default: none)",
+    )
+    parser.add_argument(
+        "--max-steps", type=int, metavar="N", help="Statements each program may run"
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=memory_size,
+        metavar="SIZE",
+        help="Bytes of strings, lists and dictionaries each program may create",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Wall-clock time of each program",
+    )
+    parser.add_argument(
+        "--report",
+        default="-",
+        metavar="FILE",
+        help="Where to write the report (default: stdout)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "csv"],
+        help="Report format (default: csv for a .csv report, json otherwise)",
+    )
+    args = parser.parse_args(argv)
+
+    programs = collect_programs(args.sources)
+    if not programs:
+        print("geez batch: no programs found", file=sys.stderr)
+        return 1
+    input_text = None
+    if args.input is not None:
+        with open(args.input, "r", encoding="utf-8") as f:
+            input_text = f.read()
+    options = {
+        "backend": args.backend,
+        "no_cache": args.no_cache,
+        "optimize": args.optimize,
+        "input": input_text,
+        "limits": (args.max_steps, args.max_memory, args.timeout),
+    }
+
+    start = time.perf_counter()
+    results = run_batch(programs, options, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    failed = sum(1 for result in results if result["status"] != 0)
+    summary = {
+        "programs": len(results),
+        "passed": len(results) - failed,
+        "failed": failed,
+        "seconds": round(elapsed, 3),
+        "backend": args.backend,
+        "jobs": args.jobs or os.cpu_count() or 1,
+    }
+    report_format = args.format or ("csv" if args.report.endswith(".csv") else "json")
+    write_report(results, summary, args.report, report_format)
+    print(
+        f"geez batch: {summary['passed']} passed, {failed} failed "
+        f"in {elapsed:.2f}s",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
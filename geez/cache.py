@@ -0,0 +1,98 @@
+"""
+Ge-ez Compilation Cache
+Stores parsed programs on disk as .geezc files, like Python's __pycache__
+"""
+
+import hashlib
+import os
+import pickle
+from typing import List, Optional
+from . import __version__
+from .parser import ASTNode
+
+# Cache files live next to the source in this directory
+CACHE_DIRECTORY = "__geezcache__"
+CACHE_SUFFIX = ".geezc"
+
+# Bump when the pickled layout changes
+CACHE_MAGIC = b"GEEZC\x02"
+
+# Set to any non-empty value to disable the cache
+CACHE_DISABLE_ENV = "GEEZ_NO_CACHE"
+
+
+def cache_enabled() -> bool:
+    """Check whether the cache is allowed by the environment"""
+    return not os.environ.get(CACHE_DISABLE_ENV)
+
+
+def source_hash(code: str) -> str:
+    """Hash source text together with the interpreter version"""
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(code.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def cache_path(filename: str) -> str:
+    """Get the .geezc path for a source file"""
+    directory, base = os.path.split(os.path.abspath(filename))
+    stem = os.path.splitext(base)[0]
+    return os.path.join(directory, CACHE_DIRECTORY, stem + CACHE_SUFFIX)
+
+
+def parse_source(code: str) -> List[ASTNode]:
+    """Tokenize and parse source text"""
+    from .lexer import GeEzLexer
+    from .parser import GeEzParser
+
+    lexer = GeEzLexer()
+    tokens = lexer.tokenize_buffer(code)
+    parser = GeEzParser(tokens)
+    return parser.parse()
+
+
+def load_cached(filename: str, code: str) -> Optional[List[ASTNode]]:
+    """Load a cached AST, or None if it is missing, stale or unreadable"""
+    try:
+        with open(cache_path(filename), "rb") as f:
+            if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                return None
+            if f.readline().rstrip(b"\n").decode("ascii") != source_hash(code):
+                return None
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def store_cached(filename: str, code: str, ast: List[ASTNode]) -> bool:
+    """Write an AST to the cache; failures (read-only trees, ...) are ignored"""
+    path = cache_path(filename)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temporary, "wb") as f:
+            f.write(CACHE_MAGIC)
+            f.write(source_hash(code).encode("ascii") + b"\n")
+            pickle.dump(ast, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Readers never see a half-written file
+        os.replace(temporary, path)
+        return True
+    except Exception:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        return False
+
+
+def parse_file(filename: str, code: str, use_cache: bool = True) -> List[ASTNode]:
+    """Parse the source of a file, going through the .geezc cache when allowed"""
+    if not (use_cache and cache_enabled()):
+        return parse_source(code)
+
+    ast = load_cached(filename, code)
+    if ast is None:
+        ast = parse_source(code)
+        store_cached(filename, code, ast)
+    return ast
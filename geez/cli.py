@@ -5,20 +5,172 @@ Provides a command-line interface for running Amharic programs
 """
 
 import argparse
-from .interpreter import GeEzInterpreter
+import os
+import sys
 
 
-def main():
+def memory_size(text: str) -> int:
+    """Parse a byte count such as 65536, 64K, 512M or 2G"""
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    text = text.strip().upper()
+    scale = units.get(text[-1:], 1)
+    if scale != 1:
+        text = text[:-1]
+    try:
+        return int(float(text) * scale)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+
+
+def main(argv=None):
     """Main CLI entry point"""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "serve":
+        from .server import serve_main
+
+        sys.exit(serve_main(argv[1:]))
+    if argv and argv[0] == "batch":
+        from .batch import batch_main
+
+        sys.exit(batch_main(argv[1:]))
+    if argv and argv[0] == "run":
+        argv = argv[1:]
+
     parser = argparse.ArgumentParser(description="Ge-ez: Amharic Programming Language")
     parser.add_argument("file", nargs="?", help="Amharic program file to execute")
     parser.add_argument(
         "-i", "--interactive", action="store_true", help="Start interactive mode"
     )
+    parser.add_argument(
+        "--backend",
+        choices=["interpreter", "vm"],
+        default="interpreter",
+        help="Execution backend: tree-walking interpreter or bytecode VM",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write parsed programs in __geezcache__",
+    )
+    parser.add_argument(
+        "-O",
+        "--optimize",
+        action="store_true",
+        help="Fold constant expressions and drop dead branches before running",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Parse and run the file one statement at a time (for very large files)",
+    )
+
+    parser.add_argument(
+        "--memoize",
+        action="store_true",
+        help="Cache the results of functions that only depend on their arguments",
+    )
+    parser.add_argument(
+        "--memo-size",
+        type=int,
+        default=1024,
+        metavar="N",
+        help="Number of results kept by --memoize (default: 1024)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the program and print its hottest functions and lines",
+    )
+    parser.add_argument(
+        "--profile-mode",
+        choices=["deterministic", "sampling"],
+        default="deterministic",
+        help="Record every call and line, or sample the call stack "
+        "for lower overhead",
+    )
+    parser.add_argument(
+        "--profile-output",
+        metavar="FILE",
+        help="Where to write collapsed stacks for flamegraph tools "
+        "(default: the program name with a .collapsed suffix)",
+    )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--output",
+        metavar="FILE",
+        help="Write what the program prints to FILE instead of stdout",
+    )
+    parser.add_argument(
+        "--flush",
+        choices=["line", "size", "exit"],
+        help="Write printed output at every line, when the buffer is full, "
+        "or when the program ends (default: line on a terminal, size otherwise)",
+    )
+
+    parser.add_argument(
+        "--max-steps",
+        type=int,
+        metavar="N",
+        help="Stop the program after it runs N statements",
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=memory_size,
+        metavar="SIZE",
+        help="Stop the program once its strings, lists and dictionaries "
+        "take SIZE bytes (K, M and G suffixes allowed)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Stop the program after SECONDS of wall-clock time",
+    )
+
+    parser.add_argument(
+        "--client",
+        action="store_true",
+        help="Run the file in a `geez serve` server if one is listening",
+    )
+    parser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Socket of the server used by --client",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.client and args.file:
+        from .client import client_request, run_client
 
-    interpreter = GeEzInterpreter()
+        status = run_client(client_request(args), args.socket)
+        if status is not None:
+            sys.exit(status)
+        print("geez: no server is listening, running the file here", file=sys.stderr)
+
+    # Imported here so that a client does not load the interpreter
+    from .interpreter import GeEzInterpreter
+    from .output import create_output
+    from .vm import GeEzVM
+
+    try:
+        output = create_output(args.output, args.flush)
+    except OSError as e:
+        parser.error(f"cannot open {args.output}: {e.strerror}")
+    from .limits import Limits
+
+    limits = Limits(args.max_steps, args.max_memory, args.timeout)
+    if not (limits.counts_steps or limits.counts_memory):
+        limits = None
+    if args.backend == "vm":
+        interpreter = GeEzVM(output, limits)
+    else:
+        interpreter = GeEzInterpreter(output, limits)
+    interpreter.use_geezc_cache = not args.no_cache
+    interpreter.use_optimizer = args.optimize
+    interpreter.memoize = args.memoize
+    interpreter.memo.maxsize = args.memo_size
 
     if args.interactive:
         print("Ge-ez Interactive Mode (ተገልጋይ ሁነት)")
@@ -49,14 +201,40 @@ def main():
                 print(f"ስህተት: {e}")
 
     elif args.file:
+        profiler = None
+        if args.profile:
+            from .profiler import create_profiler
+
+            profiler = create_profiler(args.profile_mode)
+            interpreter.set_profiler(profiler)
         try:
-            with open(args.file, "r", encoding="utf-8") as f:
-                code = f.read()
-            interpreter.interpret(code)
+            if args.stream:
+                with open(args.file, "rb") as f:
+                    if profiler:
+                        profiler.start()
+                    interpreter.interpret_stream(f)
+            else:
+                with open(args.file, "r", encoding="utf-8") as f:
+                    code = f.read()
+                if profiler:
+                    profiler.start()
+                interpreter.interpret(code, filename=args.file)
         except FileNotFoundError:
             print(f"ፋይል አልተገኘም: {args.file}")
         except Exception as e:
             print(f"ስህተት: {e}")
+        finally:
+            output.close()
+            if profiler:
+                profiler.stop()
+
+        if profiler and profiler.functions:
+            collapsed = args.profile_output
+            if collapsed is None:
+                collapsed = os.path.splitext(args.file)[0] + ".collapsed"
+            print(profiler.report(), file=sys.stderr)
+            profiler.write_collapsed(collapsed)
+            print(f"\ncollapsed stacks: {collapsed}", file=sys.stderr)
 
     else:
         parser.print_help()
@@ -0,0 +1,90 @@
+"""
+Ge-ez Client
+Sends programs to a `geez serve` server and copies their output
+
+Protocol: the client sends one JSON line with the request; the server
+answers with JSON lines of {"stdout": text} or {"stderr": text} as the
+program prints, then {"exit": status}. When the program reads input the
+server sends {"read": true} and the client answers with {"stdin": line},
+an empty line meaning end of input.
+
+Only the standard library is imported here, so that a client starts
+without loading the interpreter.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Any, BinaryIO, Dict, Optional
+from .modules import GEEZPATH_VARIABLE
+
+# Overrides the default socket path of both the server and the client
+SOCKET_VARIABLE = "GEEZ_SOCKET"
+
+
+def default_socket_path() -> str:
+    """Socket path from GEEZ_SOCKET, or one per user in the temp directory"""
+    path = os.environ.get(SOCKET_VARIABLE)
+    if path:
+        return path
+    # TMPDIR as tempfile.gettempdir() reads it; tempfile itself is slow to import
+    directory = os.environ.get("TMPDIR") or "/tmp"
+    return os.path.join(directory, f"geez-{os.getuid()}.sock")
+
+
+def send_frame(output: BinaryIO, frame: Dict[str, Any]) -> None:
+    """Write one JSON line and flush it"""
+    output.write(json.dumps(frame, ensure_ascii=False).encode("utf-8") + b"\n")
+    output.flush()
+
+
+def run_client(request: Dict[str, Any], path: Optional[str] = None) -> Optional[int]:
+    """Send a request to a running server and copy its output
+
+    Returns the program's exit status, or None when no server is listening.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path or default_socket_path())
+    except OSError:
+        client.close()
+        return None
+
+    with client:
+        output = client.makefile("wb")
+        send_frame(output, request)
+        for line in client.makefile("rb"):
+            frame = json.loads(line)
+            if "stdout" in frame:
+                sys.stdout.write(frame["stdout"])
+                sys.stdout.flush()
+            elif "stderr" in frame:
+                sys.stderr.write(frame["stderr"])
+                sys.stderr.flush()
+            elif "read" in frame:
+                send_frame(output, {"stdin": sys.stdin.readline() if sys.stdin else ""})
+            elif "exit" in frame:
+                return frame["exit"]
+    return 1
+
+
+def client_request(args: argparse.Namespace) -> Dict[str, Any]:
+    """Request running a file with the options given to `geez run`"""
+    return {
+        "path": os.path.abspath(args.file),
+        "cwd": os.getcwd(),
+        # Modules are searched for as if the program ran in the client
+        "env": {GEEZPATH_VARIABLE: os.environ.get(GEEZPATH_VARIABLE)},
+        "backend": args.backend,
+        "no_cache": args.no_cache,
+        "optimize": args.optimize,
+        "memoize": args.memoize,
+        "memo_size": args.memo_size,
+        "output": args.output and os.path.abspath(args.output),
+        "flush": args.flush,
+        "max_steps": args.max_steps,
+        "max_memory": args.max_memory,
+        "timeout": args.timeout,
+    }
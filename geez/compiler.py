@@ -0,0 +1,1000 @@
+"""
+Ge-ez Bytecode Compiler
+Lowers the Abstract Syntax Tree (AST) to stack-based bytecode
+"""
+
+import operator
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+from .parser import (
+    ASTNode,
+    NumberNode,
+    StringNode,
+    BooleanNode,
+    IdentifierNode,
+    BinaryOpNode,
+    UnaryOpNode,
+    AssignmentNode,
+    PrintNode,
+    IfNode,
+    WhileNode,
+    FunctionNode,
+    CallNode,
+    ReturnNode,
+    ForNode,
+    ListNode,
+    IndexNode,
+    InputNode,
+    StringMethodNode,
+    BuiltinFunctionNode,
+    TryCatchNode,
+    ThrowNode,
+    FileOperationNode,
+    DictNode,
+    DictAccessNode,
+    DictOperationNode,
+    ClassNode,
+    NewNode,
+    AccessNode,
+    CallMethodNode,
+    PropertyAssignmentNode,
+    TupleNode,
+    SetNode,
+    BreakNode,
+    ContinueNode,
+    ConstantNode,
+)
+from .errors import AmharicErrorMessages
+from .limits import allocates
+from .resolver import Resolver
+
+# Opcodes. Every instruction is an (opcode, argument) pair of ints; jump
+# targets are instruction indexes.
+#
+# Opcodes are grouped by how often they run, hottest first, so the VM
+# finds a group with one comparison. Binary operations come first.
+# Their argument indexes an (operation, left, right, consumes) constant:
+# the opcode says where the operands come from, the stack or a frame
+# slot, a name or a literal held in the constant, and operation is the
+# function applied to them. The result is pushed, or when consumes is
+# set, handed to the STORE_FAST, STORE_NAME or POP_JUMP_IF_* instruction
+# that follows, which is then skipped.
+BINARY_FAST_CONST = 1  # slot and literal
+BINARY_OP = 2  # pop right, pop left
+BINARY_FAST_FAST = 3  # slot and slot
+BINARY_NAME_CONST = 4  # name and literal
+BINARY_CONST = 5  # pop left, literal
+BINARY_FAST = 6  # pop left, slot
+BINARY_NAME = 7  # pop left, name
+BINARY_NAME_NAME = 8  # name and name
+# Loads, stores and jumps
+LOAD_FAST = 9  # push frame slot arg of the current call
+STORE_FAST = 10  # pop into frame slot arg of the current call
+LOAD_CONST = 11  # push constants[arg]
+LOAD_NAME = 12  # push variables[names[arg]]
+STORE_NAME = 13  # pop into variables[names[arg]]
+POP_JUMP_IF_FALSE = 14  # pop; if falsy pc = arg
+POP_JUMP_IF_TRUE = 15  # pop; if truthy pc = arg
+JUMP = 16  # pc = arg
+# Store the next item with the STORE_FAST at arg and go on after it, or pop
+# the exhausted iterator
+FOR_ITER_FAST = 17
+FOR_ITER_NAME = 18  # the same with the STORE_NAME at arg
+# Calls, returns, lookups and the try stack
+POP_TOP = 19
+CALL_FUNCTION = 20  # constants[arg] is (function name, argument count)
+RETURN_VALUE = 21  # return TOS from the current code object
+CALL_METHOD = 22  # constants[arg] is a MethodCallSite
+GET_PROPERTY = 23
+DICT_ACCESS = 24
+INDEX = 25
+STEP = 26  # count a statement against the step budget and deadline
+SETUP_TRY = 27  # push an exception handler at pc = arg
+POP_TRY = 28
+# The rest, run by the VM's table of handlers
+DUP_TOP = 29
+UNARY_NEGATIVE = 30
+UNARY_NOT = 31
+GET_ITER = 32  # replace TOS with an iterator over it
+PRINT = 33  # pop and print TOS
+BUILD_LIST = 34  # pop arg items into a list
+BUILD_TUPLE = 35
+BUILD_SET = 36
+BUILD_DICT = 37  # pop arg key/value pairs into a dictionary
+NEW_INSTANCE = 38  # constants[arg] is (class name, argument count)
+SET_PROPERTY = 39  # pop value and object, set property, push value
+MAKE_FUNCTION = 40  # register constants[arg] as a function
+MAKE_CLASS = 41  # register constants[arg] as a class
+BUILTIN_FUNCTION = 42  # constants[arg] is (function, argument count)
+STRING_METHOD = 43  # constants[arg] is (method, argument count)
+FILE_OPERATION = 44  # constants[arg] is (operation, has_content)
+INPUT = 45  # arg is 1 when a prompt is on the stack
+THROW = 46
+MATCH_EXCEPTION = 47  # push whether the exception at TOS matches constants[arg]
+STORE_EXCEPTION = 48  # pop exception, store its message in names[arg]
+RERAISE = 49  # pop exception and raise it
+RAISE_COMPLETION = 50  # raise a break (0), continue (1) or return of TOS (2)
+EVAL_NODE = 51  # evaluate constants[arg] with the tree-walking interpreter
+LOAD_CONST_COPY = 52  # constants[arg] is (list or set, elements); push a new one
+LINE = 53  # report that source line arg starts running to the profiler
+CHARGE = 54  # count the size of TOS against the memory ceiling
+CHECK_DICT = 55  # raise the Amharic error unless TOS1 is a dictionary
+# constants[arg] is ADD, REMOVE or HAS: pop the value for ADD, then the
+# key, and replace the dictionary with the result
+DICT_OPERATION = 56
+
+OPCODE_NAMES = {
+    value: name
+    for name, value in globals().items()
+    if name.isupper() and isinstance(value, int)
+}
+
+
+def add_values(left: Any, right: Any) -> Any:
+    """The + operator: text is joined with anything"""
+    if isinstance(left, str) or isinstance(right, str):
+        return str(left) + str(right)
+    return left + right
+
+
+def divide_values(left: Any, right: Any) -> Any:
+    """The / operator, with the Amharic error for a zero divisor"""
+    if right == 0:
+        error_msg = AmharicErrorMessages.format_error_with_suggestion(
+            "division_by_zero",
+            AmharicErrorMessages.get_interpreter_error("division_by_zero"),
+        )
+        raise RuntimeError(error_msg)
+    return left / right
+
+
+def and_values(left: Any, right: Any) -> Any:
+    """The እና operator; both operands are always evaluated"""
+    return left and right
+
+
+def or_values(left: Any, right: Any) -> Any:
+    """The ወይም operator; both operands are always evaluated"""
+    return left or right
+
+
+def retry_operation(operation: Any, left: Any, right: Any) -> Any:
+    """Apply an operation that raised TypeError the way the language does
+
+    + runs as operator.add, which is faster than add_values but refuses
+    to join text with a number; anything else raises its TypeError again.
+    """
+    if operation is operator.add:
+        return add_values(left, right)
+    return operation(left, right)
+
+
+# The function the binary instructions call for each operator
+BINARY_OPERATIONS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": divide_values,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+    "እና": and_values,
+    "ወይም": or_values,
+}
+
+UNARY_OPCODES = {
+    "-": UNARY_NEGATIVE,
+    "አይደለም": UNARY_NOT,
+}
+
+# Instructions a binary instruction right before them can carry out
+_CONSUMERS = {STORE_FAST, STORE_NAME, POP_JUMP_IF_FALSE, POP_JUMP_IF_TRUE}
+
+# Marks an operand that is not a literal
+_NOT_CONSTANT = object()
+
+
+def _is_text(node: ASTNode) -> bool:
+    """Whether an expression always evaluates to text"""
+    kind = type(node)
+    if kind is StringNode:
+        return True
+    if kind is ConstantNode:
+        return isinstance(node.value, str)
+    if kind is BinaryOpNode and node.operator == "+":
+        return _is_text(node.left) or _is_text(node.right)
+    return False
+
+
+def _constant_operand(node: ASTNode) -> Any:
+    """The value of a literal operand, or _NOT_CONSTANT"""
+    kind = type(node)
+    if kind is NumberNode or kind is StringNode or kind is BooleanNode:
+        return node.value
+    if kind is ConstantNode and not isinstance(node.value, (list, set)):
+        return node.value
+    return _NOT_CONSTANT
+
+
+_CONSTANT_ARGUMENT = {
+    BINARY_FAST_CONST,
+    BINARY_OP,
+    BINARY_FAST_FAST,
+    BINARY_NAME_CONST,
+    BINARY_CONST,
+    BINARY_FAST,
+    BINARY_NAME,
+    BINARY_NAME_NAME,
+    LOAD_CONST,
+    CALL_FUNCTION,
+    CALL_METHOD,
+    NEW_INSTANCE,
+    MAKE_FUNCTION,
+    MAKE_CLASS,
+    BUILTIN_FUNCTION,
+    STRING_METHOD,
+    FILE_OPERATION,
+    MATCH_EXCEPTION,
+    EVAL_NODE,
+    LOAD_CONST_COPY,
+    DICT_OPERATION,
+}
+_NAME_ARGUMENT = {LOAD_NAME, STORE_NAME, STORE_EXCEPTION, GET_PROPERTY, SET_PROPERTY}
+_SLOT_ARGUMENT = {LOAD_FAST, STORE_FAST}
+
+
+class CodeObject:
+    """Compiled bytecode: an array-backed instruction stream plus its pools"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.instructions = array("i")
+        # The instructions decoded for the VM, built by decode()
+        self.program: Tuple[Tuple[int, Any, int], ...] = ()
+        self.constants: List[Any] = []
+        self.names: List[str] = []
+        self.layout: Dict[str, int] = {}  # slot of each local, for frames
+        self.varnames: List[str] = []  # local variable of each frame slot
+
+    def __repr__(self):
+        return f"CodeObject({self.name}, {len(self.instructions) // 2} instructions)"
+
+    def decode(self) -> None:
+        """Build program: (opcode, argument, next position) per instruction
+
+        Constant and name arguments are replaced by the constant or name
+        itself. The VM reads one tuple per instruction, where indexing the
+        array would box a new int for each half.
+        """
+        program = []
+        instructions = self.instructions
+        for position in range(0, len(instructions), 2):
+            opcode, arg = instructions[position], instructions[position + 1]
+            if opcode in _CONSTANT_ARGUMENT:
+                arg = self.constants[arg]
+            elif opcode in _NAME_ARGUMENT:
+                arg = self.names[arg]
+            program.append((opcode, arg, position // 2 + 1))
+        self.program = tuple(program)
+
+
+class MethodCallSite:
+    """Operand of CALL_METHOD: the call plus its monomorphic inline cache
+
+    The VM stores the method table of the last receiver's class and the
+    method found in it, and reuses that method while receivers share the
+    table.
+    """
+
+    __slots__ = ("name", "count", "methods", "method")
+
+    def __init__(self, name: str, count: int):
+        self.name = name
+        self.count = count
+        self.methods = None
+        self.method = None
+
+    def __repr__(self):
+        return repr((self.name, self.count))
+
+
+def disassemble(code: CodeObject) -> str:
+    """Render a code object as human-readable text"""
+    lines = []
+    instructions = code.instructions
+    for pc in range(len(instructions) // 2):
+        opcode, arg = instructions[2 * pc], instructions[2 * pc + 1]
+        name = OPCODE_NAMES.get(opcode, str(opcode))
+        if opcode in _CONSTANT_ARGUMENT:
+            detail = f" ({code.constants[arg]!r})"
+        elif opcode in _NAME_ARGUMENT:
+            detail = f" ({code.names[arg]})"
+        elif opcode in _SLOT_ARGUMENT:
+            detail = f" ({code.varnames[arg]})"
+        else:
+            detail = ""
+        lines.append(f"{pc:6d} {name:<22}{arg}{detail}")
+    return "\n".join(lines)
+
+
+class _Loop:
+    """Compile-time record of an enclosing loop"""
+
+    def __init__(self, is_for: bool):
+        self.is_for = is_for
+        self.break_jumps: List[int] = []
+        self.continue_jumps: List[int] = []
+
+
+class _Try:
+    """Compile-time record of an enclosing try, catch or finally block"""
+
+
+def _loop_exits(statements: List[ASTNode], found: Dict[type, ASTNode]) -> None:
+    """Collect the break and continue statements that leave the enclosing loop"""
+    for statement in statements:
+        kind = type(statement)
+        if kind is BreakNode or kind is ContinueNode:
+            found.setdefault(kind, statement)
+        elif kind is IfNode:
+            _loop_exits(statement.then_block, found)
+            for _, block in statement.elif_blocks:
+                _loop_exits(block, found)
+            if statement.else_block:
+                _loop_exits(statement.else_block, found)
+        elif kind is TryCatchNode:
+            _loop_exits(statement.try_block, found)
+            for _, _, block in statement.catch_blocks:
+                _loop_exits(block, found)
+            if statement.finally_block:
+                _loop_exits(statement.finally_block, found)
+
+
+class BytecodeCompiler:
+    """Compiles Ge-ez AST nodes into CodeObject bytecode"""
+
+    def __init__(self, resolver: Optional[Resolver] = None):
+        self.resolver = resolver if resolver is not None else Resolver()
+        self.code: Optional[CodeObject] = None
+        self._blocks: List[Any] = []
+        self._const_index: Dict[Tuple[type, Any], int] = {}
+        self._name_index: Dict[str, int] = {}
+        self._locals: Dict[str, int] = {}  # slot layout of the function being compiled
+        self._in_function = False  # a return leaves the code object directly
+        self._binary = -1  # position of the last binary instruction
+        self.line_events = False  # emit LINE before each statement for the profiler
+        self.count_steps = False  # emit STEP before each statement for the limits
+        self.count_memory = False  # emit CHARGE after expressions that allocate
+        # Statements leave nothing on the stack
+        self._statements = {
+            AssignmentNode: self.compile_assignment_statement,
+            PrintNode: self.compile_print_statement,
+            IfNode: self.compile_if,
+            WhileNode: self.compile_while,
+            ForNode: self.compile_for,
+            BreakNode: self.compile_break,
+            ContinueNode: self.compile_continue,
+            ReturnNode: self.compile_return,
+            TryCatchNode: self.compile_try_catch,
+            ThrowNode: self.compile_throw,
+            FunctionNode: self.compile_function_declaration,
+            ClassNode: self.compile_class_declaration,
+        }
+        # Expressions leave exactly one value on the stack
+        self._compilers = {
+            NumberNode: self.compile_constant,
+            StringNode: self.compile_constant,
+            BooleanNode: self.compile_constant,
+            ConstantNode: self.compile_precomputed,
+            IdentifierNode: self.compile_identifier,
+            BinaryOpNode: self.compile_binary_op,
+            UnaryOpNode: self.compile_unary_op,
+            AssignmentNode: self.compile_assignment,
+            PrintNode: self.compile_print,
+            ListNode: self.compile_list,
+            TupleNode: self.compile_tuple,
+            SetNode: self.compile_set,
+            DictNode: self.compile_dict,
+            IndexNode: self.compile_index,
+            DictAccessNode: self.compile_dict_access,
+            DictOperationNode: self.compile_dict_operation,
+            CallNode: self.compile_call,
+            NewNode: self.compile_new_instance,
+            CallMethodNode: self.compile_call_method,
+            AccessNode: self.compile_access,
+            PropertyAssignmentNode: self.compile_property_assignment,
+            BuiltinFunctionNode: self.compile_builtin_function,
+            StringMethodNode: self.compile_string_method,
+            FileOperationNode: self.compile_file_operation,
+            InputNode: self.compile_input,
+        }
+
+    def compile_program(
+        self, statements: List[ASTNode], name: str = "<ፕሮግራም>"
+    ) -> CodeObject:
+        """Compile top-level statements; the code returns the last statement's value"""
+        return self._compile_code(name, lambda: self.compile_body(statements))
+
+    def compile_function(self, node: ASTNode) -> CodeObject:
+        """Compile a function or method body; its locals live in frame slots"""
+        return self._compile_code(
+            node.name,
+            lambda: self.compile_body(node.body),
+            self.resolver.resolve(node),
+        )
+
+    def compile_expression(self, node: ASTNode) -> CodeObject:
+        """Compile a standalone expression, e.g. a property initializer"""
+
+        def emit_expression():
+            self.compile_node(node)
+            self.emit(RETURN_VALUE)
+
+        return self._compile_code("<ገለጻ>", emit_expression)
+
+    def _compile_code(
+        self, name: str, emit_body, local_names: Optional[Dict[str, int]] = None
+    ) -> CodeObject:
+        """Compile into a fresh code object, restoring compiler state afterwards"""
+        saved = (
+            self.code,
+            self._blocks,
+            self._const_index,
+            self._name_index,
+            self._locals,
+            self._in_function,
+            self._binary,
+        )
+        self.code = CodeObject(name)
+        self._blocks = []
+        self._const_index = {}
+        self._name_index = {}
+        self._locals = local_names or {}
+        self._in_function = local_names is not None
+        self._binary = -1
+        self.code.layout = self._locals
+        self.code.varnames = list(self._locals)
+        try:
+            emit_body()
+            self.code.decode()
+            return self.code
+        finally:
+            (
+                self.code,
+                self._blocks,
+                self._const_index,
+                self._name_index,
+                self._locals,
+                self._in_function,
+                self._binary,
+            ) = saved
+
+    # Emission helpers
+
+    def emit(self, opcode: int, arg: int = 0) -> int:
+        """Append an instruction and return its position"""
+        position = len(self.code.instructions) // 2
+        if opcode in _CONSUMERS and self._binary == position - 1:
+            # The binary instruction before hands its result over itself
+            index = self.code.instructions[2 * self._binary + 1]
+            self.code.constants[index] = self.code.constants[index][:3] + (True,)
+        self.code.instructions.append(opcode)
+        self.code.instructions.append(arg)
+        return position
+
+    def position(self) -> int:
+        """Position of the next instruction"""
+        return len(self.code.instructions) // 2
+
+    def patch(self, position: int, target: Optional[int] = None) -> None:
+        """Point the jump at position to target (default: the next instruction)"""
+        self.code.instructions[2 * position + 1] = (
+            self.position() if target is None else target
+        )
+
+    def constant(self, value: Any, shared: bool = True) -> int:
+        """Index of value in the constant pool; shared values are pooled once"""
+        try:
+            key = (type(value), value) if shared else None
+            hash(key)
+        except TypeError:
+            key = None
+        if key is not None and key in self._const_index:
+            return self._const_index[key]
+        self.code.constants.append(value)
+        index = len(self.code.constants) - 1
+        if key is not None:
+            self._const_index[key] = index
+        return index
+
+    def name(self, name: str) -> int:
+        """Index of name in the name pool"""
+        if name not in self._name_index:
+            self.code.names.append(name)
+            self._name_index[name] = len(self.code.names) - 1
+        return self._name_index[name]
+
+    def load(self, name: str) -> None:
+        """Emit a variable read, from a frame slot when the name is local"""
+        slot = self._locals.get(name)
+        if slot is None:
+            self.emit(LOAD_NAME, self.name(name))
+        else:
+            self.emit(LOAD_FAST, slot)
+
+    def store(self, name: str) -> None:
+        """Emit a variable write, to a frame slot when the name is local"""
+        slot = self._locals.get(name)
+        if slot is None:
+            self.emit(STORE_NAME, self.name(name))
+        else:
+            self.emit(STORE_FAST, slot)
+
+    # Statements
+
+    def compile_body(self, statements: List[ASTNode]) -> None:
+        """Compile statements, returning the value of the last one"""
+        for statement in statements[:-1]:
+            self.compile_statement(statement)
+        if statements:
+            self.compile_line(statements[-1])
+            self.compile_node(statements[-1])
+        else:
+            self.emit(LOAD_CONST, self.constant(None))
+        self.emit(RETURN_VALUE)
+
+    def compile_block(self, statements: List[ASTNode]) -> None:
+        """Compile statements whose values are discarded"""
+        if not statements and self.count_steps:
+            # An empty loop body still counts a step per iteration
+            self.emit(STEP)
+        for statement in statements:
+            self.compile_statement(statement)
+
+    def compile_statement(self, node: ASTNode) -> None:
+        """Compile a node whose value is discarded; it leaves the stack unchanged"""
+        self.compile_line(node)
+        statement = self._statements.get(type(node))
+        if statement is None:
+            self.compile_node(node)
+            self.emit(POP_TOP)
+        else:
+            statement(node)
+
+    def compile_line(self, node: ASTNode) -> None:
+        """Emit a statement's line event when profiling and its step under limits"""
+        if node.line:
+            if self.line_events:
+                self.emit(LINE, node.line)
+            if self.count_steps:
+                self.emit(STEP)
+
+    def compile_node(self, node: ASTNode) -> None:
+        """Compile a node; it leaves exactly one value on the stack"""
+        compiler = self._compilers.get(type(node))
+        if compiler is not None:
+            compiler(node)
+            if self.count_memory and allocates(node):
+                self.emit(CHARGE)
+        elif type(node) in self._statements:
+            # Statements without a value of their own evaluate to None
+            self._statements[type(node)](node)
+            self.emit(LOAD_CONST, self.constant(None))
+        else:
+            # Anything else (imports, dictionary operations, ...) is delegated
+            self.emit(EVAL_NODE, self.constant(node))
+
+    def compile_assignment(self, node: AssignmentNode) -> None:
+        """Compile assignment, keeping the assigned value"""
+        self.compile_node(node.value)
+        self.emit(DUP_TOP)
+        self.store(node.identifier)
+
+    def compile_assignment_statement(self, node: AssignmentNode) -> None:
+        """Compile assignment statement"""
+        self.compile_node(node.value)
+        self.store(node.identifier)
+
+    def compile_print(self, node: PrintNode) -> None:
+        """Compile print, keeping the printed value"""
+        self.compile_node(node.expression)
+        self.emit(DUP_TOP)
+        self.emit(PRINT)
+
+    def compile_print_statement(self, node: PrintNode) -> None:
+        """Compile print statement"""
+        self.compile_node(node.expression)
+        self.emit(PRINT)
+
+    def compile_if(self, node: IfNode) -> None:
+        """Compile if statement with elif and else blocks"""
+        end_jumps = []
+        branches = [(node.condition, node.then_block)] + list(node.elif_blocks)
+        for index, (condition, block) in enumerate(branches):
+            self.compile_node(condition)
+            next_branch = self.emit(POP_JUMP_IF_FALSE)
+            self.compile_block(block)
+            if index < len(branches) - 1 or node.else_block:
+                end_jumps.append(self.emit(JUMP))
+            self.patch(next_branch)
+        if node.else_block:
+            self.compile_block(node.else_block)
+        for jump in end_jumps:
+            self.patch(jump)
+
+    def compile_while(self, node: WhileNode) -> None:
+        """Compile while loop
+
+        The condition is tested at the bottom, so an iteration runs no
+        unconditional jump.
+        """
+        loop = _Loop(is_for=False)
+        condition_jump = self.emit(JUMP)
+        body = self.position()
+        self._compile_loop_body(loop, node.block, condition_jump)
+        self.compile_node(node.condition)
+        self.emit(POP_JUMP_IF_TRUE, body)
+        for jump in loop.break_jumps:
+            self.patch(jump)
+
+    def compile_for(self, node: ForNode) -> None:
+        """Compile for loop, fetching the next item at the bottom"""
+        self.compile_node(node.iterable)
+        self.emit(GET_ITER)
+        loop = _Loop(is_for=True)
+        next_jump = self.emit(JUMP)
+        body = self.position()
+        self.store(node.variable)
+        self._compile_loop_body(loop, node.body, next_jump)
+        if node.variable in self._locals:
+            self.emit(FOR_ITER_FAST, body)
+        else:
+            self.emit(FOR_ITER_NAME, body)
+        for jump in loop.break_jumps:
+            self.patch(jump)
+
+    def _compile_loop_body(
+        self, loop: _Loop, statements: List[ASTNode], *entry_jumps: int
+    ) -> None:
+        """Compile a loop body; continue jumps to the code after it"""
+        self._blocks.append(loop)
+        self.compile_block(statements)
+        self._blocks.pop()
+        for jump in loop.continue_jumps + list(entry_jumps):
+            self.patch(jump)
+
+    def compile_break(self, node: BreakNode) -> None:
+        """Compile break statement"""
+        loop, crosses_try = self._innermost_loop()
+        if loop is None:
+            # Outside a loop: let the interpreter raise at run time
+            self.emit(EVAL_NODE, self.constant(node))
+            self.emit(POP_TOP)
+        elif crosses_try:
+            # As in the interpreter, the catch clauses in between see a
+            # BreakException; compile_try_catch turns it back into a jump
+            self.emit(RAISE_COMPLETION, 0)
+        else:
+            if loop.is_for:
+                self.emit(POP_TOP)  # the loop iterator
+            loop.break_jumps.append(self.emit(JUMP))
+
+    def compile_continue(self, node: ContinueNode) -> None:
+        """Compile continue statement"""
+        loop, crosses_try = self._innermost_loop()
+        if loop is None:
+            self.emit(EVAL_NODE, self.constant(node))
+            self.emit(POP_TOP)
+        elif crosses_try:
+            self.emit(RAISE_COMPLETION, 1)
+        else:
+            loop.continue_jumps.append(self.emit(JUMP))
+
+    def compile_return(self, node: ReturnNode) -> None:
+        """Compile return statement"""
+        if node.value:
+            self.compile_node(node.value)
+        else:
+            self.emit(LOAD_CONST, self.constant(None))
+        if self._in_function and not any(
+            isinstance(block, _Try) for block in self._blocks
+        ):
+            self.emit(RETURN_VALUE)
+        else:
+            # Through try blocks, or outside a function, a return is a
+            # ReturnException as in the interpreter; run_in_frame takes it
+            self.emit(RAISE_COMPLETION, 2)
+
+    def _innermost_loop(self) -> Tuple[Optional[_Loop], bool]:
+        """The innermost loop, and whether a try block lies between it and here"""
+        crosses_try = False
+        for block in reversed(self._blocks):
+            if isinstance(block, _Loop):
+                return block, crosses_try
+            crosses_try = True
+        return None, crosses_try
+
+    def compile_try_catch(self, node: TryCatchNode) -> None:
+        """Compile try-catch-finally statement
+
+        A break or continue inside it that leaves the enclosing loop is
+        raised, so the catch clauses can take it; if it comes out of the
+        statement it is caught again here and jumps like a plain one.
+        """
+        exits: Dict[type, ASTNode] = {}
+        if self._innermost_loop()[0] is not None:
+            _loop_exits([node], exits)
+        if not exits:
+            self._compile_try(node)
+            return
+        exit_setup = self.emit(SETUP_TRY)
+        self._compile_try(node)
+        self.emit(POP_TRY)
+        done_jump = self.emit(JUMP)
+        self.patch(exit_setup)
+        for kind, name in (
+            (BreakNode, "BreakException"),
+            (ContinueNode, "ContinueException"),
+        ):
+            if kind in exits:
+                self.emit(MATCH_EXCEPTION, self.constant(name))
+                other_exception = self.emit(POP_JUMP_IF_FALSE)
+                self.emit(POP_TOP)
+                self._statements[kind](exits[kind])
+                self.patch(other_exception)
+        self.emit(RERAISE)
+        self.patch(done_jump)
+
+    def _compile_try(self, node: TryCatchNode) -> None:
+        """Compile the try, catch and finally blocks of a try statement"""
+        handler_setup = self.emit(SETUP_TRY)
+        self._blocks.append(_Try())
+        self.compile_block(node.try_block)
+        self._blocks.pop()
+        self.emit(POP_TRY)
+        normal_jumps = [self.emit(JUMP)]
+
+        # Exception handler: the exception object is on the stack
+        self.patch(handler_setup)
+        reraise_jumps = []
+        for exception_type, variable_name, catch_block in node.catch_blocks:
+            clean_type = exception_type
+            if (
+                isinstance(exception_type, str)
+                and exception_type.startswith('"')
+                and exception_type.endswith('"')
+            ):
+                clean_type = exception_type[1:-1]
+            self.emit(MATCH_EXCEPTION, self.constant(clean_type))
+            next_clause = self.emit(POP_JUMP_IF_FALSE)
+
+            if variable_name:
+                self.emit(STORE_EXCEPTION, self.name(variable_name))
+            else:
+                self.emit(POP_TOP)
+            cleanup_setup = None
+            if node.finally_block:
+                cleanup_setup = self.emit(SETUP_TRY)
+            self._blocks.append(_Try())
+            self.compile_block(catch_block)
+            self._blocks.pop()
+            if cleanup_setup is not None:
+                self.emit(POP_TRY)
+                reraise_jumps.append(cleanup_setup)
+            normal_jumps.append(self.emit(JUMP))
+            self.patch(next_clause)
+
+        # No clause matched, or a catch block raised: run finally and re-raise
+        for setup in reraise_jumps:
+            self.patch(setup)
+        self._blocks.append(_Try())
+        if node.finally_block:
+            self.compile_block(node.finally_block)
+        self.emit(RERAISE)
+
+        for jump in normal_jumps:
+            self.patch(jump)
+        if node.finally_block:
+            self.compile_block(node.finally_block)
+        self._blocks.pop()
+
+    def compile_throw(self, node: ThrowNode) -> None:
+        """Compile throw statement"""
+        self.compile_node(node.expression)
+        self.emit(THROW)
+
+    def compile_function_declaration(self, node: FunctionNode) -> None:
+        """Compile function declaration"""
+        self.emit(MAKE_FUNCTION, self.constant(node))
+
+    def compile_class_declaration(self, node: ClassNode) -> None:
+        """Compile class declaration"""
+        self.emit(MAKE_CLASS, self.constant(node))
+
+    # Expressions
+
+    def compile_constant(self, node: ASTNode) -> None:
+        """Compile number, string and boolean literals"""
+        self.emit(LOAD_CONST, self.constant(node.value))
+
+    def compile_precomputed(self, node: ConstantNode) -> None:
+        """Compile precomputed constant; lists and sets are copied each time"""
+        # Not pooled: (1, 2) and (True, 2) would compare equal
+        value = node.value
+        if isinstance(value, set):
+            self.emit(
+                LOAD_CONST_COPY, self.constant((set, node.elements), shared=False)
+            )
+        elif isinstance(value, list):
+            self.emit(
+                LOAD_CONST_COPY, self.constant((list, tuple(value)), shared=False)
+            )
+        else:
+            self.emit(LOAD_CONST, self.constant(value, shared=False))
+
+    def compile_identifier(self, node: IdentifierNode) -> None:
+        """Compile variable lookup"""
+        self.load(node.name)
+
+    def compile_binary_op(self, node: BinaryOpNode) -> None:
+        """Compile binary operation, loading simple operands in the same instruction"""
+        operation = BINARY_OPERATIONS.get(node.operator)
+        if operation is None:
+            raise RuntimeError(f"Unknown binary operator: {node.operator}")
+        left, right = node.left, node.right
+        if operation is operator.add and (_is_text(left) or _is_text(right)):
+            operation = add_values  # joins text without a TypeError first
+        value = _constant_operand(right)
+        if type(left) is IdentifierNode:
+            left_slot = self._locals.get(left.name)
+            if value is not _NOT_CONSTANT:
+                if left_slot is None:
+                    self.emit_binary(BINARY_NAME_CONST, operation, left.name, value)
+                else:
+                    self.emit_binary(BINARY_FAST_CONST, operation, left_slot, value)
+                return
+            if type(right) is IdentifierNode:
+                right_slot = self._locals.get(right.name)
+                if left_slot is not None and right_slot is not None:
+                    self.emit_binary(BINARY_FAST_FAST, operation, left_slot, right_slot)
+                    return
+                if left_slot is None and right_slot is None:
+                    self.emit_binary(BINARY_NAME_NAME, operation, left.name, right.name)
+                    return
+        self.compile_node(left)
+        if value is not _NOT_CONSTANT:
+            self.emit_binary(BINARY_CONST, operation, None, value)
+        elif type(right) is IdentifierNode:
+            right_slot = self._locals.get(right.name)
+            if right_slot is None:
+                self.emit_binary(BINARY_NAME, operation, None, right.name)
+            else:
+                self.emit_binary(BINARY_FAST, operation, None, right_slot)
+        else:
+            self.compile_node(right)
+            self.emit_binary(BINARY_OP, operation, None, None)
+
+    def emit_binary(self, opcode: int, operation: Any, left: Any, right: Any) -> None:
+        """Emit a binary instruction; the next instruction may consume its result"""
+        operand = (operation, left, right, False)
+        self._binary = self.emit(opcode, self.constant(operand, shared=False))
+
+    def compile_unary_op(self, node: UnaryOpNode) -> None:
+        """Compile unary operation"""
+        self.compile_node(node.operand)
+        opcode = UNARY_OPCODES.get(node.operator)
+        if opcode is None:
+            raise RuntimeError(f"Unknown unary operator: {node.operator}")
+        self.emit(opcode)
+
+    def _compile_elements(self, opcode: int, elements: List[ASTNode]) -> None:
+        for element in elements:
+            self.compile_node(element)
+        self.emit(opcode, len(elements))
+
+    def compile_list(self, node: ListNode) -> None:
+        """Compile list literal"""
+        self._compile_elements(BUILD_LIST, node.elements)
+
+    def compile_tuple(self, node: TupleNode) -> None:
+        """Compile tuple literal"""
+        self._compile_elements(BUILD_TUPLE, node.elements)
+
+    def compile_set(self, node: SetNode) -> None:
+        """Compile set literal"""
+        self._compile_elements(BUILD_SET, node.elements)
+
+    def compile_dict(self, node: DictNode) -> None:
+        """Compile dictionary literal"""
+        for key, value in node.pairs:
+            self.compile_node(key)
+            self.compile_node(value)
+        self.emit(BUILD_DICT, len(node.pairs))
+
+    def compile_index(self, node: IndexNode) -> None:
+        """Compile list indexing"""
+        self.compile_node(node.list_expr)
+        self.compile_node(node.index_expr)
+        self.emit(INDEX)
+
+    def compile_dict_access(self, node: DictAccessNode) -> None:
+        """Compile dictionary access"""
+        self.compile_node(node.dict_expr)
+        self.compile_node(node.key_expr)
+        self.emit(DICT_ACCESS)
+
+    def compile_dict_operation(self, node: DictOperationNode) -> None:
+        """Compile ADD, REMOVE or HAS, checking the dictionary before the value"""
+        if node.operation == "ADD" and node.value_expr is None:
+            # Let the interpreter raise its error for the missing value
+            self.emit(EVAL_NODE, self.constant(node))
+            return
+        self.compile_node(node.dict_expr)
+        self.compile_node(node.key_expr)
+        self.emit(CHECK_DICT)
+        if node.operation == "ADD":
+            self.compile_node(node.value_expr)
+        self.emit(DICT_OPERATION, self.constant(node.operation))
+
+    def _compile_call(self, opcode: int, name: str, arguments: List[ASTNode]) -> None:
+        """Compile arguments followed by a call instruction"""
+        for argument in arguments:
+            self.compile_node(argument)
+        self.emit(opcode, self.constant((name, len(arguments))))
+
+    def compile_call(self, node: CallNode) -> None:
+        """Compile function call"""
+        self._compile_call(CALL_FUNCTION, node.name, node.arguments)
+
+    def compile_new_instance(self, node: NewNode) -> None:
+        """Compile object creation"""
+        self._compile_call(NEW_INSTANCE, node.class_name, node.arguments)
+
+    def compile_call_method(self, node: CallMethodNode) -> None:
+        """Compile method call; each call site gets its own inline cache"""
+        self.compile_node(node.object_expr)
+        for argument in node.arguments:
+            self.compile_node(argument)
+        site = MethodCallSite(node.method_name, len(node.arguments))
+        self.emit(CALL_METHOD, self.constant(site, shared=False))
+
+    def compile_access(self, node: AccessNode) -> None:
+        """Compile property access"""
+        self.compile_node(node.object_expr)
+        self.emit(GET_PROPERTY, self.name(node.property_name))
+
+    def compile_property_assignment(self, node: PropertyAssignmentNode) -> None:
+        """Compile property assignment"""
+        self.compile_node(node.object_expr)
+        self.compile_node(node.value_expr)
+        self.emit(SET_PROPERTY, self.name(node.property_name))
+
+    def compile_builtin_function(self, node: BuiltinFunctionNode) -> None:
+        """Compile built-in function call"""
+        for argument in node.args:
+            self.compile_node(argument)
+        self.emit(BUILTIN_FUNCTION, self.constant((node.function, len(node.args))))
+
+    def compile_string_method(self, node: StringMethodNode) -> None:
+        """Compile string method call"""
+        self.compile_node(node.string)
+        for argument in node.args:
+            self.compile_node(argument)
+        self.emit(STRING_METHOD, self.constant((node.method, len(node.args))))
+
+    def compile_file_operation(self, node: FileOperationNode) -> None:
+        """Compile file operation"""
+        self.compile_node(node.filename)
+        has_content = node.content is not None
+        if has_content:
+            self.compile_node(node.content)
+        self.emit(FILE_OPERATION, self.constant((node.operation, has_content)))
+
+    def compile_input(self, node: InputNode) -> None:
+        """Compile input statement"""
+        if node.prompt:
+            self.compile_node(node.prompt)
+        self.emit(INPUT, 1 if node.prompt else 0)
@@ -0,0 +1,585 @@
+"""
+Ge-ez Execution Engine
+Compiles the Abstract Syntax Tree (AST) into Python closures
+"""
+
+import operator
+from functools import partial
+from sys import getsizeof
+from typing import Any, Callable, Dict, List, Tuple
+from .parser import (
+    ASTNode,
+    NumberNode,
+    StringNode,
+    BooleanNode,
+    IdentifierNode,
+    BinaryOpNode,
+    UnaryOpNode,
+    AssignmentNode,
+    PrintNode,
+    IfNode,
+    WhileNode,
+    ForNode,
+    ReturnNode,
+    ListNode,
+    DictNode,
+    TupleNode,
+    SetNode,
+    BreakNode,
+    ContinueNode,
+    ConstantNode,
+    CallMethodNode,
+)
+from .errors import AmharicErrorMessages
+from .interpreter import BreakException, ContinueException, ReturnException
+from .limits import SIZED_TYPES, allocates
+from .objects import GeEzObject
+from .resolver import UNBOUND, walk
+
+# Operators whose semantics map directly onto a Python operator
+_SIMPLE_OPERATORS = {
+    "-": operator.sub,
+    "*": operator.mul,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
+def _none() -> None:
+    """Closure for an empty block"""
+    return None
+
+
+def _may_complete(statements: List[ASTNode]) -> bool:
+    """Check if running statements can leave a break, continue or return pending"""
+    return any(
+        isinstance(node, (BreakNode, ContinueNode, ReturnNode))
+        for node in walk(statements)
+    )
+
+
+class ClosureCompiler:
+    """Compiles AST nodes into specialized closures bound to an interpreter
+
+    Each node is compiled once into a zero-argument callable; running a
+    program is then a matter of calling those callables. Node types without
+    a specialized builder fall back to the interpreter's dispatch table.
+    """
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        # id(node) -> (node, closure); the node is kept so its id stays unique
+        self._compiled: Dict[int, Tuple[ASTNode, Callable[[], Any]]] = {}
+        self._builders = {
+            NumberNode: self.compile_constant,
+            StringNode: self.compile_constant,
+            BooleanNode: self.compile_constant,
+            IdentifierNode: self.compile_identifier,
+            BinaryOpNode: self.compile_binary_op,
+            UnaryOpNode: self.compile_unary_op,
+            AssignmentNode: self.compile_assignment,
+            PrintNode: self.compile_print,
+            IfNode: self.compile_if,
+            WhileNode: self.compile_while,
+            ForNode: self.compile_for,
+            ReturnNode: self.compile_return,
+            ListNode: self.compile_list,
+            DictNode: self.compile_dict,
+            TupleNode: self.compile_tuple,
+            SetNode: self.compile_set,
+            BreakNode: self.compile_break,
+            ContinueNode: self.compile_continue,
+            ConstantNode: self.compile_precomputed,
+            CallMethodNode: self.compile_method_call,
+        }
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def clear(self) -> None:
+        """Drop all compiled closures"""
+        self._compiled.clear()
+
+    def discard(self, node: ASTNode) -> None:
+        """Drop the closures of a statement that will not run again"""
+        for child in walk([node]):
+            self._compiled.pop(id(child), None)
+
+    def release(self, statements: List[ASTNode]) -> None:
+        """Drop the closures of statements that will not run again
+
+        Function and method bodies are not entered: they are released when
+        a new declaration replaces theirs.
+        """
+        for statement in statements:
+            self.discard(statement)
+
+    def compile(self, node: ASTNode) -> Callable[[], Any]:
+        """Compile a node, reusing the closure if it was compiled before"""
+        entry = self._compiled.get(id(node))
+        if entry is not None:
+            return entry[1]
+
+        builder = self._builders.get(type(node))
+        if builder is not None:
+            closure = builder(node)
+        else:
+            handler = self.interpreter._node_handlers.get(type(node))
+            if handler is None:
+                raise RuntimeError(f"Unknown node type: {type(node)}")
+            closure = partial(handler, node)
+
+        if self.interpreter.governor is not None:
+            closure = self.govern(node, closure)
+        if node.line and self.interpreter.profiler is not None:
+            closure = self.trace_line(node.line, closure)
+
+        self._compiled[id(node)] = (node, closure)
+        return closure
+
+    def trace_line(self, line: int, closure: Callable[[], Any]) -> Callable[[], Any]:
+        """Report a statement's line to the profiler before running it"""
+        line_event = self.interpreter.profiler.line
+
+        def traced():
+            line_event(line)
+            return closure()
+
+        return traced
+
+    def govern(self, node: ASTNode, closure: Callable[[], Any]) -> Callable[[], Any]:
+        """Count a statement as a step and the values an expression creates"""
+        governor = self.interpreter.governor
+        limits = governor.limits
+
+        if limits.counts_memory and allocates(node):
+            allocate = closure
+
+            def charged():
+                value = allocate()
+                if type(value) in SIZED_TYPES:
+                    governor.memory += getsizeof(value)
+                    if governor.memory > governor.memory_limit:
+                        governor.check_memory()
+                return value
+
+            closure = charged
+
+        if limits.counts_steps and node.line:
+            statement = closure
+
+            def counted():
+                governor.countdown -= 1
+                if governor.countdown < 0:
+                    governor.check()
+                return statement()
+
+            closure = counted
+
+        return closure
+
+    def compile_block(self, statements: List[ASTNode]) -> Callable[[], Any]:
+        """Compile a list of statements into one closure returning the last value"""
+        closures = [self.compile(statement) for statement in statements]
+        if not closures:
+            governor = self.interpreter.governor
+            if governor is not None and governor.limits.counts_steps:
+                # An empty loop body still counts a step per iteration
+                return governor.step
+            return _none
+        if len(closures) == 1:
+            return closures[0]
+
+        if _may_complete(statements):
+            interpreter = self.interpreter
+
+            def block_until_completion():
+                result = None
+                for closure in closures:
+                    result = closure()
+                    if interpreter.completion is not None:
+                        break
+                return result
+
+            return block_until_completion
+
+        def block():
+            result = None
+            for closure in closures:
+                result = closure()
+            return result
+
+        return block
+
+    def compile_constant(self, node: ASTNode) -> Callable[[], Any]:
+        """Compile number, string and boolean literals"""
+        value = node.value
+        return lambda: value
+
+    def compile_precomputed(self, node: ConstantNode) -> Callable[[], Any]:
+        """Compile precomputed constant; lists and sets are copied each time"""
+        value = node.value
+        if isinstance(value, set):
+            return partial(set, node.elements)
+        if isinstance(value, list):
+            return value.copy
+        return lambda: value
+
+    def compile_identifier(self, node: IdentifierNode) -> Callable[[], Any]:
+        """Compile variable lookup"""
+        interpreter = self.interpreter
+        get_variable = interpreter.get_variable
+        name = node.name
+        slot = interpreter.resolver.slot_of(node)
+        if slot is None:
+            if not interpreter._cache_enabled:
+                return lambda: get_variable(name)
+            return self.compile_cached_lookup(name)
+
+        def load_local():
+            value = interpreter.frame.values[slot]
+            if value is UNBOUND:
+                # Not assigned yet: fall back to the enclosing scope
+                return get_variable(name)
+            return value
+
+        return load_local
+
+    def compile_cached_lookup(self, name: str) -> Callable[[], Any]:
+        """Compile a lookup of a name that is not a local, with an inline cache
+
+        The cache remembers the slot layout of the last frame in which the
+        name turned out not to be a local. Layouts never change once
+        resolved, so while the current frame has that layout the slots can
+        be skipped and only the enclosing scope and the globals are read.
+        Values themselves are never cached, so nothing can go stale.
+        """
+        interpreter = self.interpreter
+        get_variable = interpreter.get_variable
+        variables = interpreter.variables
+        stats = interpreter.lookup_stats
+        layout = None
+
+        def load_name():
+            nonlocal layout
+            frame = interpreter.frame
+            if frame is None:
+                # No locals at the top level
+                if name in variables:
+                    stats[0] += 1
+                    return variables[name]
+            elif frame.names is layout:
+                enclosing = frame.enclosing
+                if enclosing is not None and name in enclosing:
+                    stats[0] += 1
+                    return enclosing[name]
+                if name in variables:
+                    stats[0] += 1
+                    return variables[name]
+
+            stats[1] += 1
+            value = get_variable(name)
+            if frame is not None and name not in frame.names:
+                layout = frame.names
+            return value
+
+        return load_name
+
+    def compile_binary_op(self, node: BinaryOpNode) -> Callable[[], Any]:
+        """Compile binary operation into an operator-specific closure"""
+        left = self.compile(node.left)
+        right = self.compile(node.right)
+        op = node.operator
+
+        if op == "+":
+
+            def add():
+                lhs = left()
+                rhs = right()
+                # Handle string concatenation
+                if isinstance(lhs, str) or isinstance(rhs, str):
+                    return str(lhs) + str(rhs)
+                return lhs + rhs
+
+            return add
+
+        if op == "/":
+
+            def divide():
+                lhs = left()
+                rhs = right()
+                if rhs == 0:
+                    error_msg = AmharicErrorMessages.format_error_with_suggestion(
+                        "division_by_zero",
+                        AmharicErrorMessages.get_interpreter_error("division_by_zero"),
+                    )
+                    raise RuntimeError(error_msg)
+                return lhs / rhs
+
+            return divide
+
+        # Both operands are always evaluated, even for logical operators
+        if op == "እና":  # AND
+
+            def logical_and():
+                lhs = left()
+                rhs = right()
+                return lhs and rhs
+
+            return logical_and
+
+        if op == "ወይም":  # OR
+
+            def logical_or():
+                lhs = left()
+                rhs = right()
+                return lhs or rhs
+
+            return logical_or
+
+        function = _SIMPLE_OPERATORS.get(op)
+        if function is None:
+
+            def unknown():
+                raise RuntimeError(f"Unknown binary operator: {op}")
+
+            return unknown
+
+        return lambda: function(left(), right())
+
+    def compile_unary_op(self, node: UnaryOpNode) -> Callable[[], Any]:
+        """Compile unary operation"""
+        operand = self.compile(node.operand)
+        op = node.operator
+
+        if op == "-":
+            return lambda: -operand()
+        if op == "አይደለም":  # NOT
+            return lambda: not operand()
+
+        def unknown():
+            operand()
+            raise RuntimeError(f"Unknown unary operator: {op}")
+
+        return unknown
+
+    def compile_assignment(self, node: AssignmentNode) -> Callable[[], Any]:
+        """Compile assignment"""
+        value = self.compile(node.value)
+        interpreter = self.interpreter
+        set_variable = interpreter.set_variable
+        name = node.identifier
+        slot = interpreter.resolver.slot_of(node)
+
+        if slot is not None:
+
+            def assign_local():
+                result = value()
+                interpreter.frame.values[slot] = result
+                return result
+
+            return assign_local
+
+        def assign():
+            result = value()
+            set_variable(name, result)
+            return result
+
+        return assign
+
+    def compile_method_call(self, node: CallMethodNode) -> Callable[[], Any]:
+        """Compile method call with a monomorphic inline cache
+
+        The call site remembers the last method table it looked up and the
+        method found in it. While receivers keep sharing that table (the
+        same class), the method is reused without a lookup.
+        """
+        receiver = self.compile(node.object_expr)
+        interpreter = self.interpreter
+        invoke_method = interpreter.invoke_method
+        arguments = node.arguments
+        method_name = node.method_name
+        cached_methods = None
+        cached_method = None
+
+        def method_call():
+            nonlocal cached_methods, cached_method
+            object_value = receiver()
+            if type(object_value) is GeEzObject:
+                methods = object_value.shape.methods
+                if methods is not cached_methods:
+                    cached_method = interpreter.find_method(object_value, method_name)
+                    cached_methods = methods
+                return invoke_method(object_value, cached_method, arguments)
+            return interpreter.dispatch_method_call(object_value, node)
+
+        return method_call
+
+    def compile_print(self, node: PrintNode) -> Callable[[], Any]:
+        """Compile print statement"""
+        interpreter = self.interpreter
+        expression = self.compile(node.expression)
+
+        def print_value():
+            value = expression()
+            interpreter.output.print(value)
+            return value
+
+        return print_value
+
+    def compile_if(self, node: IfNode) -> Callable[[], Any]:
+        """Compile if statement with elif and else blocks"""
+        condition = self.compile(node.condition)
+        then_block = self.compile_block(node.then_block)
+        elif_blocks = [
+            (self.compile(elif_condition), self.compile_block(elif_block))
+            for elif_condition, elif_block in node.elif_blocks
+        ]
+        else_block = self.compile_block(node.else_block) if node.else_block else None
+
+        def if_statement():
+            if condition():
+                then_block()
+            else:
+                for elif_condition, elif_block in elif_blocks:
+                    if elif_condition():
+                        elif_block()
+                        break
+                else:
+                    if else_block is not None:
+                        else_block()
+            return None
+
+        return if_statement
+
+    def compile_while(self, node: WhileNode) -> Callable[[], Any]:
+        """Compile while loop"""
+        condition = self.compile(node.condition)
+        body = self.compile_block(node.block)
+        interpreter = self.interpreter
+        leave_loop = interpreter.leave_loop
+
+        def while_loop():
+            while condition():
+                try:
+                    body()
+                except BreakException:
+                    break
+                except ContinueException:
+                    continue
+                if interpreter.completion is not None and leave_loop():
+                    break
+            return None
+
+        return while_loop
+
+    def compile_for(self, node: ForNode) -> Callable[[], Any]:
+        """Compile for loop"""
+        iterable_value = self.compile(node.iterable)
+        body = self.compile_block(node.body)
+        interpreter = self.interpreter
+        iterate = interpreter.iterate
+        set_variable = interpreter.set_variable
+        leave_loop = interpreter.leave_loop
+        variable = node.variable
+        slot = interpreter.resolver.slot_of(node)
+
+        if slot is not None:
+
+            def for_loop_local():
+                # Calls made by the body restore the frame before returning
+                values = interpreter.frame.values
+                for i in iterate(iterable_value()):
+                    values[slot] = i
+                    try:
+                        body()
+                    except BreakException:
+                        break
+                    except ContinueException:
+                        continue
+                    if interpreter.completion is not None and leave_loop():
+                        break
+                return None
+
+            return for_loop_local
+
+        def for_loop():
+            for i in iterate(iterable_value()):
+                set_variable(variable, i)
+                try:
+                    body()
+                except BreakException:
+                    break
+                except ContinueException:
+                    continue
+                if interpreter.completion is not None and leave_loop():
+                    break
+            return None
+
+        return for_loop
+
+    def compile_return(self, node: ReturnNode) -> Callable[[], Any]:
+        """Compile return statement"""
+        value = self.compile(node.value) if node.value else _none
+        interpreter = self.interpreter
+
+        def return_value():
+            interpreter.return_value = value()
+            interpreter.completion = ReturnException
+            return None
+
+        return return_value
+
+    def compile_list(self, node: ListNode) -> Callable[[], Any]:
+        """Compile list literal"""
+        elements = [self.compile(element) for element in node.elements]
+        return lambda: [element() for element in elements]
+
+    def compile_tuple(self, node: TupleNode) -> Callable[[], Any]:
+        """Compile tuple literal"""
+        elements = [self.compile(element) for element in node.elements]
+        return lambda: tuple([element() for element in elements])
+
+    def compile_set(self, node: SetNode) -> Callable[[], Any]:
+        """Compile set literal"""
+        elements = [self.compile(element) for element in node.elements]
+        return lambda: set([element() for element in elements])
+
+    def compile_dict(self, node: DictNode) -> Callable[[], Any]:
+        """Compile dictionary literal"""
+        pairs = [(self.compile(key), self.compile(value)) for key, value in node.pairs]
+
+        def build_dict():
+            result = {}
+            for key, value in pairs:
+                k = key()
+                result[k] = value()
+            return result
+
+        return build_dict
+
+    def compile_break(self, node: BreakNode) -> Callable[[], Any]:
+        """Compile break statement"""
+
+        interpreter = self.interpreter
+
+        def break_loop():
+            interpreter.completion = BreakException
+            return None
+
+        return break_loop
+
+    def compile_continue(self, node: ContinueNode) -> Callable[[], Any]:
+        """Compile continue statement"""
+
+        interpreter = self.interpreter
+
+        def continue_loop():
+            interpreter.completion = ContinueException
+            return None
+
+        return continue_loop
@@ -67,6 +67,9 @@ class AmharicErrorMessages:
         "type_error_method_call": "ንብብ አይነት እንደ ንብብ መጠቀም አለበት፣ {type} አይደለም",
         "invalid_object": "የማይቻል ነገር: {object}",
         "method_not_found": "ዘዴ '{method}' በክፍል '{class_name}' ውስጥ አልተገኘም",
+        "step_limit_exceeded": "የደረጃ ገደብ አልፏል: ፕሮግራሙ ከ {limit} መግለጫዎች በላይ ሰርቷል",
+        "memory_limit_exceeded": "የማህደረ ትውስታ ገደብ አልፏል: ፕሮግራሙ ከ {limit} ባይት በላይ ፈጥሯል",
+        "time_limit_exceeded": "የጊዜ ገደብ አልፏል: ፕሮግራሙ ከ {limit} ሰከንድ በላይ ሰርቷል",
     }
 
     # Context-aware suggestions
@@ -0,0 +1,191 @@
+"""
+Ge-ez Files
+Lazy views of files and directories for reading large inputs
+
+አንብብ reads a whole file into one string. The views here read as they
+are iterated instead, so a ለ loop over a file of any size runs in
+constant memory.
+"""
+
+import mmap
+import os
+from typing import Any, Iterator, List, Optional
+
+# Characters per block of ቁርጥራጮች when no size is given
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+# Built-in functions that read files, so calls to them are never pure
+FILE_FUNCTIONS = ("LINES", "CHUNKS", "MAPPED_READ")
+
+
+class FileLines:
+    """Lines of a text file, for መስመሮች
+
+    Every iteration opens the file again and reads it a buffer at a time.
+    Lines are given without their line ending.
+    """
+
+    __slots__ = ("path",)
+
+    def __init__(self, path: str):
+        os.stat(path)  # fail now rather than in the loop
+        self.path = path
+
+    def __iter__(self) -> Iterator[str]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield line[:-1] if line.endswith("\n") else line
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class FileChunks:
+    """Blocks of at most block_size characters of a text file, for ቁርጥራጮች"""
+
+    __slots__ = ("path", "block_size")
+
+    def __init__(self, path: str, block_size: int = DEFAULT_BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError("ቁርጥራጮች block size must be at least 1")
+        os.stat(path)
+        self.path = path
+        self.block_size = block_size
+
+    def __iter__(self) -> Iterator[str]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            while True:
+                block = f.read(self.block_size)
+                if not block:
+                    return
+                yield block
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class MappedFile:
+    """Read-only memory map of a file, for ትውስታ_አንብብ
+
+    Nothing is copied until text is taken: iterating decodes one line at
+    a time, text() and slices decode only their byte range, and searching
+    with `in` runs on the mapping itself. The operating system pages in
+    the parts that are touched. len() is the size in bytes.
+    """
+
+    __slots__ = ("path", "_map")
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                self._map: Any = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._map = b""  # empty files cannot be mapped
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def text(self, start: int = 0, length: Optional[int] = None) -> str:
+        """Decode length bytes from start (to the end by default)"""
+        end = len(self._map) if length is None else start + length
+        return self._map[start:end].decode("utf-8", "replace")
+
+    def __getitem__(self, index: slice) -> str:
+        if not isinstance(index, slice):
+            raise TypeError("ትውስታ_አንብብ results are sliced by byte ranges")
+        return self._map[index].decode("utf-8", "replace")
+
+    def __iter__(self) -> Iterator[str]:
+        data = self._map
+        size = len(data)
+        start = 0
+        while start < size:
+            end = data.find(b"\n", start)
+            if end < 0:
+                end = size
+            line = data[start:end]
+            start = end + 1
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            yield line.decode("utf-8", "replace")
+
+    def __contains__(self, text: Any) -> bool:
+        return self._map.find(str(text).encode("utf-8")) >= 0
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, str):
+            return self.text() + other
+        return NotImplemented
+
+    def __radd__(self, other: Any) -> Any:
+        if isinstance(other, str):
+            return other + self.text()
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return self.text()
+
+    def __repr__(self) -> str:
+        return repr(self.text())
+
+
+class DirectoryListing:
+    """Lazy result of ዝርዝር: the names in a directory
+
+    A ለ loop reads the directory entry by entry with os.scandir. Indexing,
+    len(), comparing, adding or printing lists it once and keeps the
+    names, so it behaves like the list os.listdir would return.
+    """
+
+    __slots__ = ("path", "_names")
+
+    def __init__(self, path: str):
+        self.path = path
+        self._names: Optional[List[str]] = None
+
+    @property
+    def names(self) -> List[str]:
+        """The names in the directory, listed on first use"""
+        if self._names is None:
+            self._names = os.listdir(self.path)
+        return self._names
+
+    def __iter__(self) -> Iterator[str]:
+        if self._names is not None:
+            yield from self._names
+            return
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                yield entry.name
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self.names
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.names[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, DirectoryListing):
+            return self.names == other.names
+        if isinstance(other, list):
+            return self.names == other
+        return NotImplemented
+
+    __hash__ = None  # unhashable, like the list it stands for
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, (list, DirectoryListing)):
+            return self.names + list(other)
+        return NotImplemented
+
+    def __radd__(self, other: Any) -> Any:
+        if isinstance(other, list):
+            return other + self.names
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self.names)
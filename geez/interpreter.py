@@ -3,7 +3,8 @@ Ge-ez Interpreter
 Executes the Abstract Syntax Tree (AST)
 """
 
-from typing import Any, Dict, List
+from sys import getsizeof
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from .parser import (
     ASTNode,
     NumberNode,
@@ -14,12 +15,9 @@ from .parser import (
     UnaryOpNode,
     AssignmentNode,
     PrintNode,
-    IfNode,
-    WhileNode,
     FunctionNode,
     CallNode,
     ReturnNode,
-    ForNode,
     ListNode,
     IndexNode,
     InputNode,
@@ -44,25 +42,63 @@ from .parser import (
     SetNode,
     BreakNode,
     ContinueNode,
+    ConstantNode,
 )
 from .errors import AmharicErrorMessages
+from .files import (
+    DEFAULT_BLOCK_SIZE,
+    DirectoryListing,
+    FileChunks,
+    FileLines,
+    MappedFile,
+)
+from .limits import Governor, Limits
+from .memo import LRUCache, MISSING, is_cacheable, is_pure, memo_key
+from .modules import find_module, module_registry
+from .objects import ClassTable, GeEzObject, UNSET
+from .output import OutputSink, StdoutSink
+from .resolver import Frame, Resolver, SELF_NAMES, UNBOUND
 
 
 class GeEzInterpreter:
     """Interpreter for Ge-ez Amharic programming language"""
 
-    def __init__(self):
-        self.variables: Dict[str, Any] = {}
+    def __init__(
+        self, output: Optional[OutputSink] = None, limits: Optional[Limits] = None
+    ):
+        self.variables: Dict[str, Any] = {}  # Global scope
+        self.frame: Optional[Frame] = None  # Current call frame, None at top level
+        self.resolver = Resolver()  # Slot layouts of function and method bodies
         self.functions: Dict[str, FunctionNode] = {}
         self.classes: Dict[str, ClassNode] = {}  # Store class definitions
+        self.class_tables: Dict[str, ClassTable] = {}  # Methods and shape per class
         self.modules: Dict[str, Dict[str, Any]] = {}  # Store imported modules
         self.in_try_catch = False  # Flag to track if we're in try-catch context
 
+        # Pending break/continue/return, named by the exception class that
+        # carries it through try blocks and call boundaries; None when running
+        self.completion: Optional[type] = None
+        self.return_value: Any = None
+
         # Performance optimizations
         self._expression_cache: Dict[str, Any] = {}  # Cache for computed expressions
-        self._variable_cache: Dict[str, Any] = {}  # Cache for variable lookups
         self._function_cache: Dict[str, FunctionNode] = {}  # Cache for function lookups
         self._cache_enabled = True  # Enable/disable caching
+        # Hits and misses of the name lookup caches compiled into identifiers
+        self.lookup_stats: List[int] = [0, 0]
+        self.use_geezc_cache = True  # Reuse parsed files from __geezcache__
+        self.share_modules = True  # Reuse modules other interpreters loaded
+        self.use_optimizer = False  # Fold constants before running
+        self.profiler = None  # geez.profiler.Profiler told about calls and lines
+        # Enforces the limits of a run; None runs without limits
+        self.governor: Optional[Governor] = None if limits is None else Governor(limits)
+        self.memoize = False  # Cache results of pure functions in self.memo
+        self.memo = LRUCache(1024)
+        self._purity: Dict[int, Tuple[FunctionNode, bool]] = {}
+        # Worker processes of ትይዩ_ካርታ; None uses one per CPU, 1 none
+        self.parallel_jobs: Optional[int] = None
+        # Where ማተም writes; flushed before input and when a program ends
+        self.output: OutputSink = output if output is not None else StdoutSink()
 
         # Dispatch table for faster node execution
         self._node_handlers = {
@@ -85,9 +121,6 @@ class GeEzInterpreter:
             UnaryOpNode: self.execute_unary_op,
             AssignmentNode: self.execute_assignment,
             PrintNode: self.execute_print,
-            IfNode: self.execute_if,
-            WhileNode: self.execute_while,
-            ForNode: self.execute_for,
             FunctionNode: self.execute_function_declaration,
             CallNode: self.execute_function_call,
             ReturnNode: self.execute_return,
@@ -104,13 +137,21 @@ class GeEzInterpreter:
             SetNode: self.execute_set,
             BreakNode: self.execute_break,
             ContinueNode: self.execute_continue,
+            ConstantNode: self.execute_constant,
         }
 
+        # Closure-compiling engine; falls back to the handlers above
+        from .engine import ClosureCompiler
+
+        self._engine = ClosureCompiler(self)
+
     def clear_cache(self) -> None:
         """Clear all caches for memory management"""
         self._expression_cache.clear()
-        self._variable_cache.clear()
         self._function_cache.clear()
+        self.forget_functions()
+        self._engine.clear()
+        self.resolver.clear()
 
     def enable_cache(self, enabled: bool = True) -> None:
         """Enable or disable caching"""
@@ -118,186 +159,207 @@ class GeEzInterpreter:
         if not enabled:
             self.clear_cache()
 
+    def set_profiler(self, profiler) -> None:
+        """Report calls and lines to a profiler, or stop with None
+
+        Compiled code is dropped so it is rebuilt with (or without) the
+        profiler's hooks.
+        """
+        self.profiler = profiler
+        self.clear_cache()
+
+    def set_limits(self, limits: Optional[Limits]) -> None:
+        """Enforce resource limits on runs, or stop with None
+
+        Compiled code is dropped so it is rebuilt with (or without) the
+        step and allocation counting the limits need.
+        """
+        self.governor = None if limits is None else Governor(limits)
+        self.clear_cache()
+
+    def enter_call(self, name: str, frame: Frame) -> Optional[Frame]:
+        """Make frame current and tell the profiler; returns the caller's frame"""
+        if self.profiler is not None:
+            self.profiler.enter(name)
+        old_frame = self.frame
+        self.frame = frame
+        return old_frame
+
+    def leave_call(self, old_frame: Optional[Frame]) -> None:
+        """Restore the caller's frame after enter_call"""
+        self.frame = old_frame
+        if self.profiler is not None:
+            self.profiler.leave()
+
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics for performance monitoring"""
         return {
             "expression_cache_size": len(self._expression_cache),
-            "variable_cache_size": len(self._variable_cache),
+            "variable_lookup_hits": self.lookup_stats[0],
+            "variable_lookup_misses": self.lookup_stats[1],
             "function_cache_size": len(self._function_cache),
+            "memo_size": len(self.memo),
+            "memo_hits": self.memo.hits,
+            "memo_misses": self.memo.misses,
+            "memo_evictions": self.memo.evictions,
+            "shared_module_count": len(module_registry),
+            "shared_module_hits": module_registry.hits,
+            "shared_module_misses": module_registry.misses,
+            "compiled_node_count": len(self._engine),
+            "resolved_function_count": len(self.resolver),
             "cache_enabled": self._cache_enabled,
         }
 
-    def interpret(self, code: str) -> Any:
-        """Interpret Ge-ez code"""
-        from .lexer import GeEzLexer
-        from .parser import GeEzParser, TryCatchNode
-
+    def interpret(self, code: str, filename: Optional[str] = None) -> Any:
+        """Interpret Ge-ez code, using the .geezc cache when a filename is given"""
         try:
-            # Tokenize
-            lexer = GeEzLexer()
-            tokens = lexer.tokenize(code)
-
-            # Parse
-            parser = GeEzParser(tokens)
-            ast = parser.parse()
-
-            # Execute
-            result = None
-            for statement in ast:
-                # Special handling for try-catch statements
-                if isinstance(statement, TryCatchNode):
-                    result = self.execute_try_catch(statement)
-                else:
-                    result = self.execute(statement)
-
-            return result
-
+            return self.run_source(code, filename)
         except Exception as e:
-            # Only catch exceptions if we're not in a try-catch context
-            if not self.in_try_catch:
-                error_msg = AmharicErrorMessages.format_error_with_suggestion(
-                    "runtime_error", str(e)
-                )
-                print(error_msg)
-            else:
-                # Re-raise the exception so it can be caught by try-catch blocks
-                raise e
+            self.report_error(e)
             return None
+        finally:
+            self.output.flush()
 
-    def execute(self, node: ASTNode) -> Any:
-        """Execute an AST node"""
-        if isinstance(node, NumberNode):
-            return node.value
-
-        elif isinstance(node, StringNode):
-            return node.value
-
-        elif isinstance(node, BooleanNode):
-            return node.value
-
-        elif isinstance(node, IdentifierNode):
-            return self.get_variable(node.name)
-
-        elif isinstance(node, ListNode):
-            return self.execute_list(node)
-
-        elif isinstance(node, IndexNode):
-            return self.execute_index(node)
-
-        elif isinstance(node, InputNode):
-            return self.execute_input(node)
-
-        elif isinstance(node, StringMethodNode):
-            return self.execute_string_method(node)
-
-        elif isinstance(node, BuiltinFunctionNode):
-            return self.execute_builtin_function(node)
-
-        elif isinstance(node, TryCatchNode):
-            return self.execute_try_catch(node)
-
-        elif isinstance(node, ThrowNode):
-            return self.execute_throw(node)
-
-        elif isinstance(node, FileOperationNode):
-            return self.execute_file_operation(node)
-
-        elif isinstance(node, DictNode):
-            return self.execute_dict(node)
-
-        elif isinstance(node, DictAccessNode):
-            return self.execute_dict_access(node)
-
-        elif isinstance(node, DictOperationNode):
-            return self.execute_dict_operation(node)
-
-        elif isinstance(node, ClassNode):
-            return self.execute_class_declaration(node)
-
-        elif isinstance(node, MethodNode):
-            return self.execute_method_declaration(node)
-
-        elif isinstance(node, PropertyNode):
-            return self.execute_property_declaration(node)
-
-        elif isinstance(node, NewNode):
-            return self.execute_new_instance(node)
-
-        elif isinstance(node, AccessNode):
-            return self.execute_property_access(node)
-
-        elif isinstance(node, CallMethodNode):
-            return self.execute_method_call(node)
-
-        elif isinstance(node, PropertyAssignmentNode):
-            return self.execute_property_assignment(node)
-
-        elif isinstance(node, ImportNode):
-            return self.execute_import(node)
-
-        elif isinstance(node, FromImportNode):
-            return self.execute_from_import(node)
+    def run_source(self, code: str, filename: Optional[str] = None) -> Any:
+        """Parse and run Ge-ez code, raising its errors instead of reporting them"""
+        from .cache import parse_file, parse_source
 
-        elif isinstance(node, TupleNode):
-            return self.execute_tuple(node)
+        if self.governor is not None:
+            self.governor.start()
 
-        elif isinstance(node, SetNode):
-            return self.execute_set(node)
+        # Tokenize and parse
+        if filename is None:
+            ast = parse_source(code)
+        else:
+            ast = parse_file(filename, code, self.use_geezc_cache)
+        ast = self.optimize(ast)
 
-        elif isinstance(node, BreakNode):
-            return self.execute_break(node)
+        # Execute
+        try:
+            return self.run(ast)
+        finally:
+            # The program's own closures are not run again
+            self._engine.release(ast)
 
-        elif isinstance(node, ContinueNode):
-            return self.execute_continue(node)
+    def interpret_stream(self, source: Any) -> Any:
+        """Interpret code from a file object, mmap or iterator of chunks
 
-        elif isinstance(node, BinaryOpNode):
-            return self.execute_binary_op(node)
+        Statements run as soon as they are parsed, so memory is bounded by
+        the largest statement rather than by the program. A syntax error
+        only stops the program once it is reached.
+        """
+        from .lexer import GeEzLexer
+        from .parser import GeEzParser
 
-        elif isinstance(node, UnaryOpNode):
-            return self.execute_unary_op(node)
+        if self.governor is not None:
+            self.governor.start()
+        try:
+            parser = GeEzParser(GeEzLexer().iter_tokens(source))
+            result = None
+            for statement in parser.iter_statements():
+                statements = self.optimize([statement])
+                result = self.run(statements)
+                # Top-level statements run once; their closures are not reused
+                self._engine.release(statements)
+            return result
 
-        elif isinstance(node, AssignmentNode):
-            return self.execute_assignment(node)
+        except Exception as e:
+            self.report_error(e)
+            return None
+        finally:
+            self.output.flush()
 
-        elif isinstance(node, PrintNode):
-            return self.execute_print(node)
+    def optimize(self, ast: List[ASTNode]) -> List[ASTNode]:
+        """Run the optimizer over parsed statements when it is enabled"""
+        if not self.use_optimizer:
+            return ast
+        from .optimizer import Optimizer
 
-        elif isinstance(node, IfNode):
-            return self.execute_if(node)
+        return Optimizer(self).optimize(ast)
 
-        elif isinstance(node, WhileNode):
-            return self.execute_while(node)
+    def report_error(self, error: Exception) -> None:
+        """Print an uncaught error in Amharic"""
+        # Only catch exceptions if we're not in a try-catch context
+        if not self.in_try_catch:
+            error_msg = AmharicErrorMessages.format_error_with_suggestion(
+                "runtime_error", str(error)
+            )
+            self.output.print(error_msg)
+        else:
+            # Re-raise the exception so it can be caught by try-catch blocks
+            raise error
 
-        elif isinstance(node, ForNode):
-            return self.execute_for(node)
+    def run(self, ast: List[ASTNode]) -> Any:
+        """Execute statements and return the value of the last one
 
-        elif isinstance(node, FunctionNode):
-            return self.execute_function_declaration(node)
+        A break, continue or return that is not consumed by an enclosing
+        loop or function here is raised as its exception, so try blocks,
+        methods and the top level see it exactly as before.
+        """
+        result = None
+        for statement in ast:
+            result = self.execute(statement)
+            if self.completion is not None:
+                self.raise_completion()
+        return result
 
-        elif isinstance(node, CallNode):
-            return self.execute_function_call(node)
+    def run_block(self, statements: List[ASTNode]) -> Any:
+        """Execute statements until one leaves a break, continue or return pending"""
+        result = None
+        for statement in statements:
+            result = self.execute(statement)
+            if self.completion is not None:
+                break
+        return result
 
-        elif isinstance(node, ReturnNode):
-            return self.execute_return(node)
+    def raise_completion(self) -> None:
+        """Turn the pending break, continue or return into its exception"""
+        completion = self.completion
+        self.completion = None
+        if completion is ReturnException:
+            value = self.return_value
+            self.return_value = None
+            raise ReturnException(value)
+        raise completion()
+
+    def leave_loop(self) -> bool:
+        """Consume a pending break or continue; True if the loop must stop"""
+        completion = self.completion
+        if completion is ReturnException:
+            # Stays pending for the enclosing function
+            return True
+        self.completion = None
+        return completion is BreakException
+
+    def take_return_value(self) -> Any:
+        """Consume a pending return and get its value"""
+        value = self.return_value
+        self.completion = None
+        self.return_value = None
+        return value
 
-        else:
-            raise RuntimeError(f"Unknown node type: {type(node)}")
+    def execute(self, node: ASTNode) -> Any:
+        """Execute an AST node through its compiled closure"""
+        return self._engine.compile(node)()
 
     def execute_binary_op(self, node: BinaryOpNode) -> Any:
         """Execute binary operation"""
         left = self.execute(node.left)
         right = self.execute(node.right)
+        return self.binary_operation(node.operator, left, right)
 
-        if node.operator == "+":
+    def binary_operation(self, operator: str, left: Any, right: Any) -> Any:
+        """Apply a binary operator to evaluated operands"""
+        if operator == "+":
             # Handle string concatenation
             if isinstance(left, str) or isinstance(right, str):
                 return str(left) + str(right)
             return left + right
-        elif node.operator == "-":
+        elif operator == "-":
             return left - right
-        elif node.operator == "*":
+        elif operator == "*":
             return left * right
-        elif node.operator == "/":
+        elif operator == "/":
             if right == 0:
                 error_msg = AmharicErrorMessages.format_error_with_suggestion(
                     "division_by_zero",
@@ -305,35 +367,38 @@ class GeEzInterpreter:
                 )
                 raise RuntimeError(error_msg)
             return left / right
-        elif node.operator == "==":
+        elif operator == "==":
             return left == right
-        elif node.operator == "!=":
+        elif operator == "!=":
             return left != right
-        elif node.operator == "<":
+        elif operator == "<":
             return left < right
-        elif node.operator == ">":
+        elif operator == ">":
             return left > right
-        elif node.operator == "<=":
+        elif operator == "<=":
             return left <= right
-        elif node.operator == ">=":
+        elif operator == ">=":
             return left >= right
-        elif node.operator == "እና":  # AND
+        elif operator == "እና":  # AND
             return left and right
-        elif node.operator == "ወይም":  # OR
+        elif operator == "ወይም":  # OR
             return left or right
         else:
-            raise RuntimeError(f"Unknown binary operator: {node.operator}")
+            raise RuntimeError(f"Unknown binary operator: {operator}")
 
     def execute_unary_op(self, node: UnaryOpNode) -> Any:
         """Execute unary operation"""
         right = self.execute(node.operand)
-
-        if node.operator == "-":
-            return -right
-        elif node.operator == "አይደለም":  # NOT
-            return not right
+        return self.unary_operation(node.operator, right)
+
+    def unary_operation(self, operator: str, operand: Any) -> Any:
+        """Apply a unary operator to an evaluated operand"""
+        if operator == "-":
+            return -operand
+        elif operator == "አይደለም":  # NOT
+            return not operand
         else:
-            raise RuntimeError(f"Unknown unary operator: {node.operator}")
+            raise RuntimeError(f"Unknown unary operator: {operator}")
 
     def execute_assignment(self, node: AssignmentNode) -> Any:
         """Execute assignment with optimized variable setting"""
@@ -344,86 +409,38 @@ class GeEzInterpreter:
     def execute_print(self, node: PrintNode) -> Any:
         """Execute print statement"""
         value = self.execute(node.expression)
-        print(value)
+        self.output.print(value)
         return value
 
-    def execute_if(self, node: IfNode) -> Any:
-        """Execute if statement with elif support"""
-        condition = self.execute(node.condition)
-
-        if condition:
-            for statement in node.then_block:
-                self.execute(statement)
-        else:
-            # Check elif blocks
-            elif_executed = False
-            for elif_condition, elif_block in node.elif_blocks:
-                if self.execute(elif_condition):
-                    for statement in elif_block:
-                        self.execute(statement)
-                    elif_executed = True
-                    break
-
-            # Execute else block if no elif was executed
-            if not elif_executed and node.else_block:
-                for statement in node.else_block:
-                    self.execute(statement)
-
-        return None
-
-    def execute_while(self, node: WhileNode) -> Any:
-        """Execute while loop"""
-        while self.execute(node.condition):
-            try:
-                for statement in node.block:
-                    self.execute(statement)
-            except BreakException:
-                # Break out of the loop
-                break
-            except ContinueException:
-                # Continue to next iteration
-                continue
-
-        return None
-
-    def execute_for(self, node: ForNode) -> Any:
-        """Execute for loop"""
-        # For now, we'll implement a simple range-based for loop
-        # Later we can extend this to work with lists and other iterables
-
-        iterable = self.execute(node.iterable)
+    def iterate(self, iterable: Any) -> Iterator[Any]:
+        """Get an iterator over the values a for loop binds
 
+        Numbers count from zero; lists, tuples, sets, ranges, dictionary
+        keys, string characters and the lazy file views of geez.files are
+        iterated in place without being copied.
+        """
         # Simple range implementation for numbers
         if isinstance(iterable, (int, float)):
-            for i in range(int(iterable)):
-                self.variables[node.variable] = i
-                try:
-                    for statement in node.body:
-                        self.execute(statement)
-                except BreakException:
-                    # Break out of the loop
-                    break
-                except ContinueException:
-                    # Continue to next iteration
-                    continue
-        else:
+            return iter(range(int(iterable)))
+        try:
+            return iter(iterable)
+        except TypeError:
             raise RuntimeError(f"Cannot iterate over {type(iterable)}")
 
-        return None
-
     def get_variable(self, name: str) -> Any:
-        """Get variable value with caching optimization"""
-        # Check cache first if enabled
-        if self._cache_enabled and name in self._variable_cache:
-            return self._variable_cache[name]
+        """Get variable value: call locals, the enclosing scope, then globals"""
+        # Locals of the current call, then its enclosing scope
+        frame = self.frame
+        if frame is not None:
+            slot = frame.names.get(name)
+            if slot is not None and frame.values[slot] is not UNBOUND:
+                return frame.values[slot]
+            if frame.enclosing is not None and name in frame.enclosing:
+                return frame.enclosing[name]
 
         # Check variables dictionary
         if name in self.variables:
-            value = self.variables[name]
-            # Cache the result if caching is enabled
-            if self._cache_enabled:
-                self._variable_cache[name] = value
-            return value
+            return self.variables[name]
         else:
             error_msg = AmharicErrorMessages.format_error_with_suggestion(
                 "undefined_variable",
@@ -435,11 +452,15 @@ class GeEzInterpreter:
             raise RuntimeError(error_msg)
 
     def set_variable(self, name: str, value: Any) -> None:
-        """Set variable value with cache update"""
+        """Set variable value in the current call's locals or the globals"""
+        frame = self.frame
+        if frame is not None:
+            slot = frame.names.get(name)
+            if slot is not None:
+                frame.values[slot] = value
+                return
+
         self.variables[name] = value
-        # Update cache if enabled
-        if self._cache_enabled:
-            self._variable_cache[name] = value
 
     def clear_variables(self) -> None:
         """Clear all variables"""
@@ -447,58 +468,122 @@ class GeEzInterpreter:
 
     def execute_function_declaration(self, node: FunctionNode) -> None:
         """Execute function declaration"""
-        self.functions[node.name] = node
+        self.declare_function(node)
         return None
 
+    def declare_function(self, node: FunctionNode) -> None:
+        """Define a function, releasing the closures of the one it replaces"""
+        previous = self.functions.get(node.name)
+        if previous is not None and previous is not node:
+            self._engine.release(previous.body)
+        self.functions[node.name] = node
+        self.forget_functions()
+
+    def forget_functions(self) -> None:
+        """Drop memoized results and purity checks once functions change"""
+        if self._purity:
+            self._purity.clear()
+            self.memo.clear()
+
+    def is_pure_function(self, function: FunctionNode) -> bool:
+        """Check if a function is pure, remembering the answer until functions change"""
+        entry = self._purity.get(id(function))
+        if entry is None:
+            pure = is_pure(function, self.functions, self.resolver)
+            entry = self._purity[id(function)] = (function, pure)
+        return entry[1]
+
+    def memo_key_for(self, function: FunctionNode, args: List[Any]) -> Any:
+        """Key of a call in the memo cache, or None if the call must run"""
+        if not self.is_pure_function(function):
+            return None
+        key = memo_key(tuple(args))
+        return None if key is None else (function, key)
+
     def execute_function_call(self, node: CallNode) -> Any:
         """Execute function call"""
-        if node.name not in self.functions:
+        function = self.functions.get(node.name)
+        if function is not None and len(node.arguments) == len(function.parameters):
+            # Evaluate arguments in the caller's scope
+            args = [self.execute(arg) for arg in node.arguments]
+        else:
+            # Reported before the arguments are evaluated
+            args = [UNBOUND] * len(node.arguments)
+        return self.call_function(node.name, args)
+
+    def call_function(self, name: str, args: List[Any]) -> Any:
+        """Call a user-defined function with evaluated arguments"""
+        function = self.functions.get(name)
+        if function is None:
             error_msg = AmharicErrorMessages.format_error_with_suggestion(
                 "undefined_function",
                 AmharicErrorMessages.get_interpreter_error(
-                    "undefined_function", function=node.name
+                    "undefined_function", function=name
                 ),
-                function=node.name,
+                function=name,
             )
             raise RuntimeError(error_msg)
 
-        function = self.functions[node.name]
-
         # Check argument count
-        if len(node.arguments) != len(function.parameters):
+        if len(args) != len(function.parameters):
             error_msg = AmharicErrorMessages.get_interpreter_error(
                 "argument_count_mismatch",
-                function=node.name,
+                function=name,
                 expected=len(function.parameters),
-                actual=len(node.arguments),
+                actual=len(args),
             )
             raise RuntimeError(error_msg)
 
-        # Save current scope
-        old_variables = self.variables.copy()
+        # Pure functions called with the same arguments return the same result
+        key = self.memo_key_for(function, args) if self.memoize else None
+        if key is not None:
+            result = self.memo.get(key)
+            if result is not MISSING:
+                return result
 
-        # Create new scope with parameters
-        self.variables = {}
-        for param, arg in zip(function.parameters, node.arguments):
-            self.variables[param] = self.execute(arg)
+        # Create new frame with parameters
+        frame = Frame(self.resolver.resolve(function))
+        for param, arg in zip(function.parameters, args):
+            frame.values[frame.names[param]] = arg
 
         # Execute function body
+        old_frame = self.enter_call(function.name, frame)
+        try:
+            result = self.run_body(function.body)
+        finally:
+            # Restore old frame
+            self.leave_call(old_frame)
+
+        if key is not None and is_cacheable(result):
+            self.memo.put(key, result)
+        return result
+
+    def run_body(self, statements: List[ASTNode]) -> Any:
+        """Run the body of a function, method or constructor in the current frame
+
+        A return ends the body with its value; otherwise the value of the
+        last statement is the result.
+        """
         result = None
         try:
-            for statement in function.body:
+            for statement in statements:
                 result = self.execute(statement)
+                if self.completion is ReturnException:
+                    return self.take_return_value()
+                if self.completion is not None:
+                    # A break or continue leaves the function as before
+                    self.raise_completion()
         except ReturnException as e:
-            result = e.value
-
-        # Restore old scope
-        self.variables = old_variables
-
+            # A return from inside a try block
+            return e.value
         return result
 
     def execute_return(self, node: ReturnNode) -> Any:
         """Execute return statement"""
         value = self.execute(node.value) if node.value else None
-        raise ReturnException(value)
+        self.return_value = value
+        self.completion = ReturnException
+        return None
 
     def execute_list(self, node: ListNode) -> List[Any]:
         """Execute list creation: [expr1, expr2, ...]"""
@@ -508,8 +593,11 @@ class GeEzInterpreter:
         """Execute list indexing: list[index]"""
         list_value = self.execute(node.list_expr)
         index_value = self.execute(node.index_expr)
+        return self.index_value(list_value, index_value)
 
-        if not isinstance(list_value, list):
+    def index_value(self, list_value: Any, index_value: Any) -> Any:
+        """Index an evaluated list with an evaluated index"""
+        if not isinstance(list_value, (list, GeEzRange, DirectoryListing)):
             raise TypeError(f"Can only index lists, not {type(list_value).__name__}")
 
         if not isinstance(index_value, (int, float)):
@@ -532,49 +620,53 @@ class GeEzInterpreter:
     def execute_input(self, node: InputNode) -> str:
         """Execute input function: ግብአት() or ግብአት(prompt)"""
         if node.prompt:
-            prompt_value = self.execute(node.prompt)
-            if isinstance(prompt_value, str):
-                user_input = input(prompt_value)
-            else:
-                user_input = input(str(prompt_value))
-        else:
-            user_input = input()
+            return self.read_input(self.execute(node.prompt))
+        return self.read_input()
 
-        return user_input
+    def read_input(self, prompt: Any = None) -> str:
+        """Read a line of input after writing out pending output"""
+        self.output.flush()
+        if prompt is None:
+            return input()
+        return input(prompt if isinstance(prompt, str) else str(prompt))
 
     def execute_string_method(self, node: StringMethodNode) -> Any:
         """Execute string methods"""
         string_value = self.execute(node.string)
+        args = [self.execute(arg) for arg in node.args]
+        return self.string_method(node.method, string_value, args)
 
+    def string_method(self, method: str, string_value: Any, args: List[Any]) -> Any:
+        """Apply a string method to evaluated arguments"""
         # Convert to string if not already (except for JOIN method)
-        if node.method != "JOIN" and not isinstance(string_value, str):
+        if method != "JOIN" and not isinstance(string_value, str):
             string_value = str(string_value)
 
-        if node.method == "LENGTH":
+        if method == "LENGTH":
             return len(string_value)
 
-        elif node.method == "UPPER":
+        elif method == "UPPER":
             return string_value.upper()
 
-        elif node.method == "LOWER":
+        elif method == "LOWER":
             return string_value.lower()
 
-        elif node.method == "SPLIT":
-            if node.args:
-                separator = self.execute(node.args[0])
+        elif method == "SPLIT":
+            if args:
+                separator = args[0]
                 if not isinstance(separator, str):
                     separator = str(separator)
                 return string_value.split(separator)
             else:
                 return string_value.split()
 
-        elif node.method == "JOIN":
-            if node.args:
-                separator = self.execute(node.args[0])
+        elif method == "JOIN":
+            if args:
+                separator = args[0]
                 if not isinstance(separator, str):
                     separator = str(separator)
                 # For JOIN, the string_value should be a list
-                if isinstance(string_value, list):
+                if isinstance(string_value, (list, GeEzRange, DirectoryListing)):
                     return separator.join(str(item) for item in string_value)
                 else:
                     raise ValueError(
@@ -583,17 +675,17 @@ class GeEzInterpreter:
                     )
             else:
                 # Default join with space
-                if isinstance(string_value, list):
+                if isinstance(string_value, (list, GeEzRange, DirectoryListing)):
                     return " ".join(str(item) for item in string_value)
                 else:
                     raise ValueError(
                         "አገናኝ method requires a list as the first argument"
                     )
 
-        elif node.method == "REPLACE":
-            if len(node.args) >= 2:
-                old_str = self.execute(node.args[0])
-                new_str = self.execute(node.args[1])
+        elif method == "REPLACE":
+            if len(args) >= 2:
+                old_str = args[0]
+                new_str = args[1]
                 if not isinstance(old_str, str):
                     old_str = str(old_str)
                 if not isinstance(new_str, str):
@@ -605,27 +697,24 @@ class GeEzInterpreter:
                 )
 
         else:
-            raise ValueError(f"Unknown string method: {node.method}")
+            raise ValueError(f"Unknown string method: {method}")
 
     def execute_builtin_function(self, node: BuiltinFunctionNode) -> Any:
         """Execute built-in functions"""
         # Evaluate all arguments first
         args = [self.execute(arg) for arg in node.args]
-
-        if node.function == "RANGE":
-            if len(args) == 1:
-                # range(stop)
-                return list(range(int(args[0])))
-            elif len(args) == 2:
-                # range(start, stop)
-                return list(range(int(args[0]), int(args[1])))
-            elif len(args) == 3:
-                # range(start, stop, step)
-                return list(range(int(args[0]), int(args[1]), int(args[2])))
+        return self.builtin_function(node.function, args)
+
+    def builtin_function(self, function: str, args: List[Any]) -> Any:
+        """Apply a built-in function to evaluated arguments"""
+        if function == "RANGE":
+            if 1 <= len(args) <= 3:
+                # range(stop), range(start, stop) or range(start, stop, step)
+                return GeEzRange(*[int(arg) for arg in args])
             else:
                 raise ValueError("ወሰን function requires 1-3 arguments")
 
-        elif node.function == "TYPE":
+        elif function == "TYPE":
             if len(args) != 1:
                 raise ValueError("ዓይነት function requires exactly 1 argument")
             value = args[0]
@@ -635,14 +724,14 @@ class GeEzInterpreter:
                 return "integer"
             elif isinstance(value, float):
                 return "number"
-            elif isinstance(value, str):
+            elif isinstance(value, (str, MappedFile)):
                 return "string"
-            elif isinstance(value, list):
+            elif isinstance(value, (list, GeEzRange, DirectoryListing)):
                 return "list"
             else:
                 return "unknown"
 
-        elif node.function == "INT":
+        elif function == "INT":
             if len(args) != 1:
                 raise ValueError("ቁጥር function requires exactly 1 argument")
             try:
@@ -650,12 +739,12 @@ class GeEzInterpreter:
             except (ValueError, TypeError):
                 raise ValueError(f"Cannot convert '{args[0]}' to integer")
 
-        elif node.function == "STR":
+        elif function == "STR":
             if len(args) != 1:
                 raise ValueError("ጽሑፍ function requires exactly 1 argument")
             return str(args[0])
 
-        elif node.function == "MAX":
+        elif function == "MAX":
             if len(args) < 1:
                 raise ValueError("ከፍተኛ function requires at least 1 argument")
             try:
@@ -663,7 +752,7 @@ class GeEzInterpreter:
             except TypeError:
                 raise ValueError("ከፍተኛ function requires comparable values")
 
-        elif node.function == "MIN":
+        elif function == "MIN":
             if len(args) < 1:
                 raise ValueError("ዠቅተኛ function requires at least 1 argument")
             try:
@@ -671,8 +760,60 @@ class GeEzInterpreter:
             except TypeError:
                 raise ValueError("ዠቅተኛ function requires comparable values")
 
+        elif function == "LINES":
+            if len(args) != 1:
+                raise ValueError("መስመሮች function requires exactly 1 argument")
+            return FileLines(str(args[0]))
+
+        elif function == "CHUNKS":
+            if not 1 <= len(args) <= 2:
+                raise ValueError("ቁርጥራጮች function requires 1-2 arguments")
+            block_size = int(args[1]) if len(args) == 2 else DEFAULT_BLOCK_SIZE
+            return FileChunks(str(args[0]), block_size)
+
+        elif function == "MAPPED_READ":
+            if not 1 <= len(args) <= 3:
+                raise ValueError("ትውስታ_አንብብ function requires 1-3 arguments")
+            mapped = MappedFile(str(args[0]))
+            if len(args) == 1:
+                return mapped
+            # ትውስታ_አንብብ(file, start, length) decodes only that byte range
+            length = int(args[2]) if len(args) == 3 else None
+            return mapped.text(int(args[1]), length)
+
+        elif function == "PARALLEL_MAP":
+            if len(args) != 2:
+                raise ValueError("ትይዩ_ካርታ function requires exactly 2 arguments")
+            return self.parallel_map(str(args[0]), args[1])
+
         else:
-            raise ValueError(f"Unknown built-in function: {node.function}")
+            raise ValueError(f"Unknown built-in function: {function}")
+
+    def parallel_map(self, name: str, iterable: Any) -> List[Any]:
+        """Call a one-parameter function on each item, in order
+
+        Pure functions run on worker processes (see geez.parallel). Other
+        functions, runs with limits or a profiler, and single items or
+        workers run in this process, exactly like a loop of calls.
+        """
+        items = list(self.iterate(iterable))
+        function = self.functions.get(name)
+        if (
+            function is None
+            or len(function.parameters) != 1
+            or len(items) < 2
+            or self.governor is not None
+            or self.profiler is not None
+            or not self.is_pure_function(function)
+        ):
+            return [self.call_function(name, [item]) for item in items]
+
+        from .parallel import parallel_map, worker_count
+
+        workers = worker_count(self.parallel_jobs)
+        if workers < 2:
+            return [self.call_function(name, [item]) for item in items]
+        return parallel_map(type(self), name, self.functions, items, workers)
 
     def execute_try_catch(self, node: TryCatchNode) -> Any:
         """Execute try-catch-finally block"""
@@ -681,14 +822,15 @@ class GeEzInterpreter:
         self.in_try_catch = True
 
         try:
-            # Execute try block
-            for statement in node.try_block:
-                self.execute(statement)
+            # Execute try block; break, continue and return are matched
+            # against the catch blocks as exceptions
+            self.run(node.try_block)
         except Exception as e:
             # Find matching catch block
             caught = False
             for exception_type, variable_name, catch_block in node.catch_blocks:
-                # Catch all exceptions if no specific type is specified, or if it matches
+                # Catch all exceptions if no specific type is specified, or if it
+                # matches
                 # Remove quotes from exception_type if it's a string literal
                 clean_exception_type = exception_type
                 if (
@@ -706,11 +848,10 @@ class GeEzInterpreter:
                 ):
                     # Store exception in variable if specified
                     if variable_name:
-                        self.variables[variable_name] = str(e)
+                        self.set_variable(variable_name, str(e))
 
                     # Execute catch block
-                    for statement in catch_block:
-                        self.execute(statement)
+                    self.run(catch_block)
                     caught = True
                     break
 
@@ -721,8 +862,7 @@ class GeEzInterpreter:
         finally:
             # Execute finally block if present
             if node.finally_block:
-                for statement in node.finally_block:
-                    self.execute(statement)
+                self.run(node.finally_block)
 
             # Restore the flag
             self.in_try_catch = old_flag
@@ -734,65 +874,78 @@ class GeEzInterpreter:
 
     def execute_file_operation(self, node: FileOperationNode) -> Any:
         """Execute file operation"""
-        import os
-
         filename = self.execute(node.filename)
-        if not isinstance(filename, str):
-            filename = str(filename)
 
         try:
-            if node.operation == "READ":
-                # Read file content
-                with open(filename, "r", encoding="utf-8") as f:
-                    return f.read()
-
-            elif node.operation == "WRITE":
-                # Write content to file
-                if node.content is None:
-                    raise ValueError("ጻፍ operation requires content to write")
+            content = None
+            if node.operation in ("WRITE", "APPEND") and node.content is not None:
                 content = self.execute(node.content)
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(str(content))
-                return True
+            return self.file_operation(
+                node.operation, filename, content, node.content is not None
+            )
+        except Exception as e:
+            raise RuntimeError(f"File operation failed: {str(e)}")
 
-            elif node.operation == "APPEND":
-                # Append content to file
-                if node.content is None:
-                    raise ValueError("ጨምር operation requires content to append")
-                content = self.execute(node.content)
-                with open(filename, "a", encoding="utf-8") as f:
-                    f.write(str(content))
-                return True
+    def file_operation(
+        self,
+        operation: str,
+        filename: Any,
+        content: Any = None,
+        has_content: bool = False,
+    ) -> Any:
+        """Perform a file operation on evaluated arguments"""
+        import os
 
-            elif node.operation == "EXISTS":
-                # Check if file exists
-                return os.path.exists(filename)
+        if not isinstance(filename, str):
+            filename = str(filename)
 
-            elif node.operation == "DELETE":
-                # Delete file
-                if os.path.exists(filename):
-                    os.remove(filename)
-                    return True
-                else:
-                    return False
+        if operation == "READ":
+            # Read file content
+            with open(filename, "r", encoding="utf-8") as f:
+                return f.read()
+
+        elif operation == "WRITE":
+            # Write content to file
+            if not has_content:
+                raise ValueError("ጻፍ operation requires content to write")
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(str(content))
+            return True
 
-            elif node.operation == "LIST":
-                # List directory contents
-                if os.path.isdir(filename):
-                    return os.listdir(filename)
-                else:
-                    raise ValueError(f"Directory not found: {filename}")
+        elif operation == "APPEND":
+            # Append content to file
+            if not has_content:
+                raise ValueError("ጨምር operation requires content to append")
+            with open(filename, "a", encoding="utf-8") as f:
+                f.write(str(content))
+            return True
 
-            elif node.operation == "CREATE":
-                # Create directory
-                os.makedirs(filename, exist_ok=True)
+        elif operation == "EXISTS":
+            # Check if file exists
+            return os.path.exists(filename)
+
+        elif operation == "DELETE":
+            # Delete file
+            if os.path.exists(filename):
+                os.remove(filename)
                 return True
+            else:
+                return False
 
+        elif operation == "LIST":
+            # List directory contents, lazily
+            if os.path.isdir(filename):
+                return DirectoryListing(filename)
             else:
-                raise ValueError(f"Unknown file operation: {node.operation}")
+                raise ValueError(f"Directory not found: {filename}")
 
-        except Exception as e:
-            raise RuntimeError(f"File operation failed: {str(e)}")
+        elif operation == "CREATE":
+            # Create directory
+            os.makedirs(filename, exist_ok=True)
+            return True
+
+        else:
+            raise ValueError(f"Unknown file operation: {operation}")
 
     def execute_dict(self, node: DictNode) -> Any:
         """Execute dictionary creation"""
@@ -807,8 +960,11 @@ class GeEzInterpreter:
         """Execute dictionary access: dict[key]"""
         dict_value = self.execute(node.dict_expr)
         key = self.execute(node.key_expr)
+        return self.dict_access(dict_value, key)
 
-        if not isinstance(dict_value, dict):
+    def dict_access(self, dict_value: Any, key: Any) -> Any:
+        """Look up an evaluated key in an evaluated dictionary"""
+        if not isinstance(dict_value, (dict, GeEzObject)):
             error_msg = AmharicErrorMessages.get_interpreter_error(
                 "type_error_dict_access", type=type(dict_value).__name__
             )
@@ -826,13 +982,9 @@ class GeEzInterpreter:
         """Execute dictionary operation: ADD, REMOVE, HAS"""
         dict_value = self.execute(node.dict_expr)
         key = self.execute(node.key_expr)
+        self.check_dict_operand(dict_value)
 
-        if not isinstance(dict_value, dict):
-            error_msg = AmharicErrorMessages.get_interpreter_error(
-                "type_error_dict_operation", type=type(dict_value).__name__
-            )
-            raise TypeError(error_msg)
-
+        value = None
         if node.operation == "ADD":
             if node.value_expr is None:
                 error_msg = AmharicErrorMessages.get_interpreter_error(
@@ -840,30 +992,62 @@ class GeEzInterpreter:
                 )
                 raise ValueError(error_msg)
             value = self.execute(node.value_expr)
-            dict_value[key] = value
+        return self.dict_operation(node.operation, dict_value, key, value)
+
+    def check_dict_operand(self, dict_value: Any) -> None:
+        """Raise the Amharic error if a dictionary operation gets another type"""
+        if not isinstance(dict_value, (dict, GeEzObject)):
+            error_msg = AmharicErrorMessages.get_interpreter_error(
+                "type_error_dict_operation", type=type(dict_value).__name__
+            )
+            raise TypeError(error_msg)
+
+    def dict_operation(
+        self, operation: str, dict_value: Any, key: Any, value: Any = None
+    ) -> Any:
+        """Apply ADD, REMOVE or HAS to an evaluated, checked dictionary"""
+        if operation == "ADD":
+            self.store_entry(dict_value, key, value)
             return True
 
-        elif node.operation == "REMOVE":
+        elif operation == "REMOVE":
             if key in dict_value:
                 del dict_value[key]
                 return True
             else:
                 return False
 
-        elif node.operation == "HAS":
+        elif operation == "HAS":
             return key in dict_value
 
         else:
             error_msg = AmharicErrorMessages.get_interpreter_error(
-                "unknown_dict_operation", operation=node.operation
+                "unknown_dict_operation", operation=operation
             )
             raise ValueError(error_msg)
 
     def execute_class_declaration(self, node: ClassNode) -> Any:
         """Execute class declaration"""
-        self.classes[node.name] = node
+        self.declare_class(node)
         return None
 
+    def declare_class(self, class_def: ClassNode) -> None:
+        """Define a class and build its method table"""
+        parent = None
+        if class_def.parent_class is not None:
+            parent = self.class_tables.get(class_def.parent_class)
+            if parent is None:
+                error_msg = AmharicErrorMessages.get_interpreter_error(
+                    "undefined_class", class_name=class_def.parent_class
+                )
+                raise RuntimeError(error_msg)
+        previous = self.classes.get(class_def.name)
+        if previous is not None and previous is not class_def:
+            # Release the closures of the class this one replaces
+            self._engine.release(previous.methods + previous.properties)
+        self.classes[class_def.name] = class_def
+        self.class_tables[class_def.name] = ClassTable(class_def, parent)
+
     def execute_method_declaration(self, node: MethodNode) -> Any:
         """Execute method declaration (within class context)"""
         # Methods are handled within class context
@@ -876,82 +1060,91 @@ class GeEzInterpreter:
 
     def execute_new_instance(self, node: NewNode) -> Any:
         """Execute new instance creation"""
-        if node.class_name not in self.classes:
+        table = self.class_tables.get(node.class_name)
+        if table is None:
             error_msg = AmharicErrorMessages.get_interpreter_error(
                 "undefined_class", class_name=node.class_name
             )
             raise RuntimeError(error_msg)
 
-        class_def = self.classes[node.class_name]
-
         # Create instance
-        instance = {"__class__": class_def.name, "__parent__": class_def.parent_class}
+        instance = GeEzObject(table.shape)
 
-        # Initialize properties
-        for property_node in class_def.properties:
+        # Initialize properties, inherited ones included
+        for property_node in table.properties:
             if property_node.initial_value:
-                instance[property_node.name] = self.execute(property_node.initial_value)
+                value = self.execute(property_node.initial_value)
             else:
-                instance[property_node.name] = None
+                value = None
+            instance.set_property(property_node.name, value)
 
         # Execute constructor if exists
-        constructor = None
-        for method in class_def.methods:
-            if isinstance(method, MethodNode) and method.is_constructor:
-                constructor = method
-                break
-
+        constructor = table.constructor
         if constructor:
-            # Create method context
-            old_variables = self.variables.copy()
-            self.variables = instance.copy()
-
-            # Add self reference
-            self.variables["ራሱ"] = instance
-            self.variables["የራሱ"] = instance
+            # Create method frame with self reference
+            frame = Frame(self.resolver.resolve(constructor), instance)
+            for name in SELF_NAMES:
+                frame.values[frame.names[name]] = instance
 
             # Add constructor parameters
             param_index = 0
             for param_name in constructor.parameters:
-                if param_name == "ራሱ" or param_name == "የራሱ":
+                if param_name in SELF_NAMES:
                     # Skip self parameter, it's already set
                     continue
                 if param_index < len(node.arguments):
                     param_value = self.execute(node.arguments[param_index])
-                    self.variables[param_name] = param_value
+                    frame.values[frame.names[param_name]] = param_value
                     param_index += 1
 
+            old_frame = self.enter_call(
+                f"{table.class_def.name}.{constructor.name}", frame
+            )
             try:
                 # Execute constructor body
-                for statement in constructor.body:
-                    self.execute(statement)
+                self.run_body(constructor.body)
             finally:
-                # Restore variables
-                self.variables = old_variables
+                # Restore frame
+                self.leave_call(old_frame)
 
         return instance
 
     def execute_property_access(self, node: AccessNode) -> Any:
         """Execute property access: object.property"""
         object_value = self.execute(node.object_expr)
-
-        if not isinstance(object_value, dict):
+        return self.property_value(object_value, node.property_name)
+
+    def property_value(self, object_value: Any, property_name: str) -> Any:
+        """Read a property from an evaluated object"""
+        if type(object_value) is GeEzObject:
+            slot = object_value.shape.names.get(property_name)
+            if slot is not None:
+                value = object_value.values[slot]
+                if value is not UNSET:
+                    return value
+        elif not isinstance(object_value, dict):
             error_msg = AmharicErrorMessages.get_interpreter_error(
                 "type_error_property_access", type=type(object_value).__name__
             )
             raise TypeError(error_msg)
 
-        if node.property_name not in object_value:
+        if property_name not in object_value:
             error_msg = AmharicErrorMessages.get_interpreter_error(
-                "property_not_found", property=node.property_name
+                "property_not_found", property=property_name
             )
             raise AttributeError(error_msg)
 
-        return object_value[node.property_name]
+        return object_value[property_name]
 
     def execute_method_call(self, node: CallMethodNode) -> Any:
         """Execute method call: object.method(args)"""
-        object_value = self.execute(node.object_expr)
+        return self.dispatch_method_call(self.execute(node.object_expr), node)
+
+    def dispatch_method_call(self, object_value: Any, node: CallMethodNode) -> Any:
+        """Call a method or module function on an evaluated object"""
+        if type(object_value) is GeEzObject:
+            method = self.find_method(object_value, node.method_name)
+            return self.invoke_method(object_value, method, node.arguments)
 
         if not isinstance(object_value, dict):
             error_msg = AmharicErrorMessages.get_interpreter_error(
@@ -964,107 +1157,122 @@ class GeEzInterpreter:
             function_node = object_value[node.method_name]
             if isinstance(function_node, FunctionNode):
                 # This is a module function call
-                return self.execute_module_function_call(function_node, node.arguments)
-
-        # Check if this is a class method call
-        class_name = object_value.get("__class__")
-        if not class_name or class_name not in self.classes:
-            error_msg = AmharicErrorMessages.get_interpreter_error(
-                "invalid_object", object=type(object_value).__name__
-            )
-            raise RuntimeError(error_msg)
-
-        class_def = self.classes[class_name]
+                return self.execute_module_function_call(
+                    function_node, node.arguments, object_value
+                )
 
-        # Find method
-        method = None
-        for m in class_def.methods:
-            if isinstance(m, MethodNode) and m.name == node.method_name:
-                method = m
-                break
+        error_msg = AmharicErrorMessages.get_interpreter_error(
+            "invalid_object", object=type(object_value).__name__
+        )
+        raise RuntimeError(error_msg)
 
-        if not method:
+    def find_method(self, object_value: GeEzObject, method_name: str) -> MethodNode:
+        """Look up a method in the table of an object's class"""
+        method = object_value.shape.methods.get(method_name)
+        if method is None:
             error_msg = AmharicErrorMessages.get_interpreter_error(
-                "method_not_found", method=node.method_name, class_name=class_name
+                "method_not_found",
+                method=method_name,
+                class_name=object_value.shape.class_name,
             )
             raise AttributeError(error_msg)
+        return method
 
-        # Create method context
-        old_variables = self.variables.copy()
-        self.variables = object_value.copy()
-
-        # Add self reference
-        self.variables["ራሱ"] = object_value
-        self.variables["የራሱ"] = object_value
+    def invoke_method(
+        self, object_value: GeEzObject, method: MethodNode, arguments: List[ASTNode]
+    ) -> Any:
+        """Run a method with ራሱ bound to the object"""
+        # Create method frame with self reference
+        frame = Frame(self.resolver.resolve(method), object_value)
+        for name in SELF_NAMES:
+            frame.values[frame.names[name]] = object_value
 
         # Add method parameters
         for i, param_name in enumerate(method.parameters):
-            if i < len(node.arguments):
-                param_value = self.execute(node.arguments[i])
-                self.variables[param_name] = param_value
+            if i < len(arguments):
+                param_value = self.execute(arguments[i])
+                frame.values[frame.names[param_name]] = param_value
 
+        old_frame = self.enter_call(
+            f"{object_value.shape.class_name}.{method.name}", frame
+        )
         try:
             # Execute method body
-            result = None
-            for statement in method.body:
-                result = self.execute(statement)
-            return result
+            return self.run_body(method.body)
         finally:
-            # Restore variables
-            self.variables = old_variables
-
-    def execute_module_function_call(self, function_node: FunctionNode, arguments: List[ASTNode]) -> Any:
+            # Restore frame
+            self.leave_call(old_frame)
+
+    def execute_module_function_call(
+        self,
+        function_node: FunctionNode,
+        arguments: List[ASTNode],
+        module: Optional[Dict[str, Any]] = None,
+    ) -> Any:
         """Execute a function call from a module"""
-        # Create function context
-        old_variables = self.variables.copy()
-        
+        # Create function frame; the module's names are visible from it
+        frame = Frame(self.resolver.resolve(function_node), module)
+
         # Add function parameters
         for i, param_name in enumerate(function_node.parameters):
             if i < len(arguments):
                 param_value = self.execute(arguments[i])
-                self.variables[param_name] = param_value
+                frame.values[frame.names[param_name]] = param_value
 
+        old_frame = self.enter_call(function_node.name, frame)
         try:
             # Execute function body
-            result = None
-            for statement in function_node.body:
-                result = self.execute(statement)
-            return result
+            return self.run_body(function_node.body)
         finally:
-            # Restore variables
-            self.variables = old_variables
+            # Restore frame
+            self.leave_call(old_frame)
 
     def execute_property_assignment(self, node: PropertyAssignmentNode) -> Any:
         """Execute property assignment: object.property = value"""
         object_value = self.execute(node.object_expr)
         value = self.execute(node.value_expr)
 
-        if not isinstance(object_value, dict):
+        if not isinstance(object_value, (dict, GeEzObject)):
             error_msg = AmharicErrorMessages.get_interpreter_error(
                 "type_error_property_access", type=type(object_value).__name__
             )
             raise TypeError(error_msg)
 
         # Set the property
-        object_value[node.property_name] = value
+        self.store_entry(object_value, node.property_name, value)
         return value
 
+    def store_entry(self, container: Any, key: Any, value: Any) -> None:
+        """Set a dictionary entry or object property
+
+        Under a memory ceiling, what the dictionary's table or the object's
+        list of values grows by is charged like a created value.
+        """
+        governor = self.governor
+        if governor is None or not governor.limits.counts_memory:
+            container[key] = value
+            return
+        storage = container.values if type(container) is GeEzObject else container
+        size = getsizeof(storage)
+        container[key] = value
+        governor.charge_growth(storage, size)
+
     def execute_import(self, node: ImportNode) -> Any:
         """Execute import statement: አመጣ module_name"""
         module_name = node.module_name
-        
+
         # Check if module is already imported
         if module_name in self.modules:
             return None
-            
+
         # Try to load the module
         try:
             module_content = self.load_module(module_name)
             self.modules[module_name] = module_content
-            
+
             # Make module available in current scope
             self.variables[module_name] = module_content
-            
+
         except FileNotFoundError:
             error_msg = AmharicErrorMessages.get_interpreter_error(
                 "module_not_found", module=module_name
@@ -1075,14 +1283,14 @@ class GeEzInterpreter:
                 "import_error", module=module_name, error=str(e)
             )
             raise ImportError(error_msg)
-            
+
         return None
 
     def execute_from_import(self, node: FromImportNode) -> Any:
         """Execute from import statement: ከ module_name አመጣ function_name"""
         module_name = node.module_name
         function_name = node.function_name
-        
+
         # Check if module is already imported
         if module_name not in self.modules:
             try:
@@ -1098,72 +1306,73 @@ class GeEzInterpreter:
                     "import_error", module=module_name, error=str(e)
                 )
                 raise ImportError(error_msg)
-        
+
         module_content = self.modules[module_name]
-        
+
         # Check if function exists in module
         if function_name not in module_content:
             error_msg = AmharicErrorMessages.get_interpreter_error(
-                "function_not_found_in_module", 
-                function=function_name, 
-                module=module_name
+                "function_not_found_in_module",
+                function=function_name,
+                module=module_name,
             )
             raise ImportError(error_msg)
-        
+
         # Import the function to current scope
         imported_item = module_content[function_name]
         self.variables[function_name] = imported_item
-        
+
         # If it's a function, also add it to the functions dictionary
         if isinstance(imported_item, FunctionNode):
             self.functions[function_name] = imported_item
-            
+            self.forget_functions()
+
         return None
 
     def load_module(self, module_name: str) -> Dict[str, Any]:
-        """Load a module from file system"""
-        import os
-        
-        # Look for .geez files
-        module_file = f"{module_name}.geez"
-        
-        if not os.path.exists(module_file):
-            raise FileNotFoundError(f"Module file '{module_file}' not found")
-        
+        """Load a module from the search path, reusing it if already loaded"""
+        # Look for .geez files in the working directory, then GEEZPATH
+        module_file = find_module(module_name)
+        if module_file is None:
+            raise FileNotFoundError(f"Module file '{module_name}.geez' not found")
+
+        if self.share_modules:
+            module_content = module_registry.get(module_file)
+            if module_content is not None:
+                return module_content
+
         # Read and parse the module
-        with open(module_file, 'r', encoding='utf-8') as f:
+        with open(module_file, "r", encoding="utf-8") as f:
             module_code = f.read()
-        
-        # Create a new interpreter for the module
-        from .lexer import GeEzLexer
-        from .parser import GeEzParser
-        
-        lexer = GeEzLexer()
-        tokens = lexer.tokenize(module_code)
-        
-        parser = GeEzParser(tokens)
-        ast = parser.parse()
-        
+
+        from .cache import parse_file
+
+        ast = self.optimize(parse_file(module_file, module_code, self.use_geezc_cache))
+
         # Execute the module in a new interpreter context
-        module_interpreter = GeEzInterpreter()
-        for statement in ast:
-            module_interpreter.execute(statement)
-        
+        module_interpreter = GeEzInterpreter(self.output)
+        module_interpreter.governor = self.governor  # modules count against the run
+        module_interpreter.use_geezc_cache = self.use_geezc_cache
+        module_interpreter.share_modules = self.share_modules
+        module_interpreter.run(ast)
+
         # Return the module's exported content
         module_content = {}
-        
+
         # Export functions
         for func_name, func_node in module_interpreter.functions.items():
             module_content[func_name] = func_node
-        
+
         # Export variables (for constants, etc.)
         for var_name, var_value in module_interpreter.variables.items():
             module_content[var_name] = var_value
-        
+
         # Export classes
         for class_name, class_node in module_interpreter.classes.items():
             module_content[class_name] = class_node
-        
+
+        if self.share_modules:
+            module_registry.put(module_file, module_content)
         return module_content
 
     def execute_tuple(self, node: TupleNode) -> tuple:
@@ -1182,22 +1391,35 @@ class GeEzInterpreter:
             elements.append(element_value)
         return set(elements)
 
+    def execute_constant(self, node: ConstantNode) -> Any:
+        """Execute precomputed constant, copying lists and sets"""
+        value = node.value
+        if isinstance(value, set):
+            return set(node.elements)
+        if isinstance(value, list):
+            return value.copy()
+        return value
+
     def execute_break(self, node: BreakNode) -> Any:
         """Execute break statement: ተሰብር"""
-        raise BreakException()
+        self.completion = BreakException
+        return None
 
     def execute_continue(self, node: ContinueNode) -> Any:
         """Execute continue statement: ቀጥል"""
-        raise ContinueException()
+        self.completion = ContinueException
+        return None
 
 
 class BreakException(Exception):
     """Exception used for break statements"""
+
     pass
 
 
 class ContinueException(Exception):
     """Exception used for continue statements"""
+
     pass
 
 
@@ -1206,3 +1428,55 @@ class ReturnException(Exception):
 
     def __init__(self, value: Any):
         self.value = value
+
+
+class GeEzRange:
+    """Lazy result of ወሰን: a range that indexes, compares and prints like a list
+
+    Iterating it does not build the list, so a loop over ወሰን(10000000)
+    runs in constant memory.
+    """
+
+    __slots__ = ("range",)
+
+    def __init__(self, *args: int):
+        self.range = range(*args)
+
+    def __len__(self) -> int:
+        return len(self.range)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.range)
+
+    def __reversed__(self) -> Iterator[int]:
+        return reversed(self.range)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.range
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return list(self.range[index])
+        return self.range[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, GeEzRange):
+            return self.range == other.range
+        if isinstance(other, list):
+            return len(other) == len(self.range) and list(self.range) == other
+        return NotImplemented
+
+    __hash__ = None  # unhashable, like the list it stands for
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, (list, GeEzRange)):
+            return list(self.range) + list(other)
+        return NotImplemented
+
+    def __radd__(self, other: Any) -> Any:
+        if isinstance(other, list):
+            return other + list(self.range)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self.range))
@@ -3,14 +3,21 @@ Ge-ez Lexer (Tokenizer)
 Handles lexical analysis for Amharic programming language
 """
 
+import codecs
 import re
-from typing import List
+from array import array
+from typing import Any, Iterator, List, Tuple
 from .errors import AmharicErrorMessages
 
+# Characters read at a time from file objects and mmaps
+CHUNK_SIZE = 64 * 1024
+
 
 class Token:
     """Represents a token in the Amharic language"""
 
+    __slots__ = ("type", "value", "line", "column")
+
     def __init__(self, type_: str, value: str, line: int = 1, column: int = 1):
         self.type = type_
         self.value = value
@@ -21,6 +28,60 @@ class Token:
         return f"Token({self.type}, {self.value!r})"
 
 
+def _read_chunks(source: Any, chunk_size: int) -> Iterator[str]:
+    """Turn a lexer source into an iterator of non-empty text chunks"""
+    if isinstance(source, str):
+        chunks = [source]
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        chunks = [bytes(source)]
+    elif hasattr(source, "read"):
+        # File objects (text or binary) and mmaps
+        chunks = _read_file(source, chunk_size)
+    else:
+        chunks = source
+
+    decoder = None
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if not isinstance(chunk, str):
+            # Multi-byte characters may be split across chunks
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+            chunk = decoder.decode(bytes(chunk))
+            if not chunk:
+                continue
+        yield chunk
+
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+def _read_file(file: Any, chunk_size: int) -> Iterator[Any]:
+    """Read a file object or mmap until it is exhausted"""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _needs_more_input(match: "re.Match", buffer: str) -> bool:
+    """Check whether a match could change if the buffer were longer"""
+    end = match.end()
+    if end == len(buffer):
+        return True
+    token_type = match.lastgroup
+    # An unclosed string or /* comment may be closed by the next chunk
+    if token_type == "MISMATCH" and match.group() == '"':
+        return True
+    if token_type == "DIVIDE" and buffer.startswith("*", end):
+        return True
+    return False
+
+
 class GeEzLexer:
     """Lexical analyzer for Ge-ez Amharic programming language"""
 
@@ -114,6 +175,19 @@ class GeEzLexer:
         ("WHITESPACE", r"\s+"),  # Whitespace
     ]
 
+    # All patterns as one alternation, tried in order at each position. The
+    # trailing catch-all makes every character match, so a single finditer
+    # pass covers the whole input.
+    MASTER_PATTERN = re.compile(
+        "|".join(
+            f"(?P<{name}>{pattern})"
+            for name, pattern in TOKEN_PATTERNS + [("MISMATCH", r"[\s\S]")]
+        )
+    )
+
+    # Token types that only advance the position
+    SKIPPED_TYPES = frozenset(("WHITESPACE", "COMMENT", "MULTILINE_COMMENT"))
+
     def __init__(self):
         self.tokens = []
         self.current_line = 1
@@ -121,74 +195,165 @@ class GeEzLexer:
 
     def tokenize(self, text: str) -> List[Token]:
         """Tokenize the input text"""
-        self.tokens = []
-        self.current_line = 1
-        self.current_column = 1
+        self.tokens = list(self.iter_tokens(text))
+        return self.tokens
+
+    def tokenize_buffer(self, text: str) -> "TokenBuffer":
+        """Tokenize the input text into compact array storage"""
+        tokens = TokenBuffer(text)
+        append = tokens.append
+        codes = TOKEN_CODES
+        for token_type, value, start, line, column in self._scan(text, CHUNK_SIZE):
+            append(codes[token_type], start, start + len(value), line, column)
+        return tokens
+
+    def iter_tokens(self, source: Any, chunk_size: int = CHUNK_SIZE) -> Iterator[Token]:
+        """Lazily tokenize a string, file object, mmap or iterator of chunks
+
+        Chunks may be str or UTF-8 bytes. Tokens, comments and strings that
+        cross chunk boundaries are handled by holding back the unfinished
+        tail of the buffer until more input arrives.
+        """
+        for token_type, value, _, line, column in self._scan(source, chunk_size):
+            yield Token(token_type, value, line, column)
+
+    def _scan(
+        self, source: Any, chunk_size: int
+    ) -> Iterator[Tuple[str, str, int, int, int]]:
+        """Yield (type, value, offset in the whole text, line, column) per token"""
+        pattern = self.MASTER_PATTERN
+        keywords = self.KEYWORDS
+        skipped_types = self.SKIPPED_TYPES
+        line = self.current_line = 1
+        column = self.current_column = 1
 
-        # Compile regex patterns
-        patterns = [
-            (name, re.compile(pattern)) for name, pattern in self.TOKEN_PATTERNS
-        ]
-
-        position = 0
-        while position < len(text):
-            matched = False
-
-            for token_type, pattern in patterns:
-                match = pattern.match(text, position)
-                if match:
-                    value = match.group(0)
-
-                    # Skip whitespace and comments but track position
-                    if token_type in ("WHITESPACE", "COMMENT", "MULTILINE_COMMENT"):
-                        if "\n" in value:
-                            self.current_line += value.count("\n")
-                            self.current_column = 1
-                        else:
-                            self.current_column += len(value)
-                        position = match.end()
-                        matched = True
-                        break
-
-                    # Handle newlines
-                    if token_type == "NEWLINE":
-                        self.current_line += 1
-                        self.current_column = 1
-                        position = match.end()
-                        matched = True
-                        break
-
-                    # Check if it's an Amharic keyword
-                    if token_type == "AMHARIC_ID" and value in self.KEYWORDS:
-                        token_type = self.KEYWORDS[value]
-
-                    # Create token
-                    token = Token(
-                        token_type, value, self.current_line, self.current_column
-                    )
-                    self.tokens.append(token)
-
-                    # Update position
-                    self.current_column += len(value)
-                    position = match.end()
-                    matched = True
+        chunks = _read_chunks(source, chunk_size)
+        buffer = ""
+        base = 0  # offset of the buffer in the whole text
+        held = 0  # length of the tail the last scan held back
+        at_end = False
+        while not at_end:
+            chunk = next(chunks, None)
+            if chunk is None:
+                at_end = True
+            else:
+                buffer += chunk
+                if len(buffer) < 2 * held:
+                    # A token longer than a chunk is still open; scanning
+                    # again once the buffer has doubled keeps it linear
+                    continue
+
+            position = 0
+            for match in pattern.finditer(buffer):
+                if not at_end and _needs_more_input(match, buffer):
                     break
+                position = match.end()
+                token_type = match.lastgroup
+                value = match.group()
 
-            if not matched:
-                # Handle unknown characters
-                char = text[position]
-                if char.strip():  # Only error on non-whitespace
-                    error_msg = AmharicErrorMessages.get_lexer_error(
-                        "unknown_character",
-                        char=char,
-                        line=self.current_line,
-                        column=self.current_column,
-                    )
-                    raise SyntaxError(error_msg)
-                position += 1
+                # Skip whitespace and comments but track position
+                if token_type in skipped_types:
+                    if "\n" in value:
+                        line += value.count("\n")
+                        column = 1
+                    else:
+                        column += len(value)
+                    continue
 
-        return self.tokens
+                # Handle newlines
+                if token_type == "NEWLINE":
+                    line += 1
+                    column = 1
+                    continue
+
+                if token_type == "MISMATCH":
+                    # Handle unknown characters
+                    if value.strip():  # Only error on non-whitespace
+                        self.current_line = line
+                        self.current_column = column
+                        error_msg = AmharicErrorMessages.get_lexer_error(
+                            "unknown_character",
+                            char=value,
+                            line=line,
+                            column=column,
+                        )
+                        raise SyntaxError(error_msg)
+                    continue
+
+                # Check if it's an Amharic keyword
+                if token_type == "AMHARIC_ID":
+                    token_type = keywords.get(value, token_type)
+
+                yield token_type, value, base + match.start(), line, column
+                column += len(value)
+
+            # Keep only the unfinished tail
+            buffer = buffer[position:]
+            base += position
+            held = len(buffer)
+
+        self.current_line = line
+        self.current_column = column
 
     def get_tokens(self) -> List[Token]:
         """Get the list of tokens"""
         return self.tokens
+
+
+# Integer codes of token types, for compact storage and fast comparisons
+TOKEN_TYPES: List[str] = (
+    [name for name, _ in GeEzLexer.TOKEN_PATTERNS]
+    + sorted(set(GeEzLexer.KEYWORDS.values()))
+    + ["EOF"]
+)
+TOKEN_CODES = {token_type: code for code, token_type in enumerate(TOKEN_TYPES)}
+
+
+class TokenBuffer:
+    """Compact token storage: parallel arrays instead of one object per token
+
+    Kinds are TOKEN_CODES, values are sliced from the source on demand and
+    indexing builds a Token, so callers that need objects still get them.
+    """
+
+    __slots__ = ("source", "kinds", "starts", "ends", "lines", "columns")
+
+    def __init__(self, source: str):
+        self.source = source
+        self.kinds = array("B")
+        # 64-bit offsets, so sources over 4 GB can be indexed
+        self.starts = array("Q")
+        self.ends = array("Q")
+        self.lines = array("I")
+        self.columns = array("I")
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> Token:
+        return Token(
+            TOKEN_TYPES[self.kinds[index]],
+            self.source[self.starts[index] : self.ends[index]],
+            self.lines[index],
+            self.columns[index],
+        )
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.kinds)):
+            yield self[index]
+
+    def append(self, kind: int, start: int, end: int, line: int, column: int) -> None:
+        """Add a token"""
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def type(self, index: int) -> str:
+        """Type of the token at index"""
+        return TOKEN_TYPES[self.kinds[index]]
+
+    def value(self, index: int) -> str:
+        """Source text of the token at index"""
+        return self.source[self.starts[index] : self.ends[index]]
@@ -0,0 +1,195 @@
+"""
+Ge-ez Limits
+Step budget, memory ceiling and deadline of a run
+"""
+
+import time
+from sys import getsizeof
+from typing import Any, Optional
+from .errors import AmharicErrorMessages
+from .parser import (
+    ASTNode,
+    BinaryOpNode,
+    ListNode,
+    TupleNode,
+    SetNode,
+    DictNode,
+    ConstantNode,
+    StringMethodNode,
+    BuiltinFunctionNode,
+    FileOperationNode,
+    InputNode,
+)
+
+# Steps run between two checks of the deadline
+CHECK_INTERVAL = 1000
+
+# Steps and bytes a program gets to handle the first limit it goes over
+GRACE_STEPS = 1000
+GRACE_MEMORY = 64 * 1024
+
+# Values whose size is charged against the memory ceiling
+SIZED_TYPES = frozenset((str, list, tuple, set, dict))
+
+# Expressions that create a new string, list, tuple, set or dictionary
+_ALLOCATING_NODES = (
+    ListNode,
+    TupleNode,
+    SetNode,
+    DictNode,
+    StringMethodNode,
+    BuiltinFunctionNode,
+    FileOperationNode,
+    InputNode,
+)
+
+
+def allocates(node: ASTNode) -> bool:
+    """Check if evaluating a node may create a string or container"""
+    if isinstance(node, BinaryOpNode):
+        return node.operator in ("+", "*")
+    if isinstance(node, ConstantNode):
+        # Precomputed lists and sets are copied each time they are evaluated
+        return isinstance(node.value, (list, set))
+    return isinstance(node, _ALLOCATING_NODES)
+
+
+class Limits:
+    """Resources a run may use; None leaves a resource unlimited
+
+    max_steps counts statements run (an empty loop body counts one step
+    per iteration), max_memory the bytes of the strings, lists, tuples,
+    sets and dictionaries the program creates plus what its dictionaries
+    and objects grow by, and timeout the seconds of wall-clock time.
+    """
+
+    __slots__ = ("max_steps", "max_memory", "timeout")
+
+    def __init__(
+        self,
+        max_steps: Optional[int] = None,
+        max_memory: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.max_steps = max_steps
+        self.max_memory = max_memory
+        self.timeout = timeout
+
+    @property
+    def counts_steps(self) -> bool:
+        """Check if statements have to be counted"""
+        return self.max_steps is not None or self.timeout is not None
+
+    @property
+    def counts_memory(self) -> bool:
+        """Check if allocations have to be counted"""
+        return self.max_memory is not None
+
+    def __repr__(self) -> str:
+        return (
+            f"Limits(max_steps={self.max_steps}, max_memory={self.max_memory}, "
+            f"timeout={self.timeout})"
+        )
+
+
+class ResourceLimitError(RuntimeError):
+    """A run went over one of its limits"""
+
+
+class Governor:
+    """Usage of a run, checked against its limits
+
+    Compiled code counts a statement by decrementing countdown and calls
+    check() once it goes negative, which happens every CHECK_INTERVAL
+    steps or exactly when the step budget runs out. The first limit a run
+    goes over raises a ResourceLimitError the program may catch, and
+    leaves it GRACE_STEPS more steps and GRACE_MEMORY more bytes to do so;
+    after that every step or allocation over a limit raises again.
+    """
+
+    __slots__ = (
+        "limits",
+        "steps",
+        "memory",
+        "countdown",
+        "deadline",
+        "step_limit",
+        "memory_limit",
+        "exceeded",
+        "_batch",
+    )
+
+    def __init__(self, limits: Limits):
+        self.limits = limits
+        self.start()
+
+    def start(self) -> None:
+        """Reset usage and start the clock, at the beginning of a run"""
+        limits = self.limits
+        self.steps = 0
+        self.memory = 0
+        self.deadline = None
+        if limits.timeout is not None:
+            self.deadline = time.monotonic() + limits.timeout
+        self.step_limit = limits.max_steps
+        self.memory_limit = limits.max_memory
+        self.exceeded = False
+        self._next_batch()
+
+    @property
+    def steps_used(self) -> int:
+        """Statements run so far"""
+        return self.steps + self._batch - self.countdown
+
+    def step(self) -> None:
+        """Count one step"""
+        self.countdown -= 1
+        if self.countdown < 0:
+            self.check()
+
+    def check(self) -> None:
+        """Count the steps of the last batch and check the budget and deadline"""
+        self.steps += self._batch - self.countdown
+        self._batch = self.countdown = 0
+        if self.step_limit is not None and self.steps > self.step_limit:
+            self._exceed("step_limit_exceeded", self.limits.max_steps)
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self._exceed("time_limit_exceeded", self.limits.timeout)
+        self._next_batch()
+
+    def charge(self, value: Any) -> Any:
+        """Count the size of a value the program created; returns the value"""
+        if type(value) in SIZED_TYPES:
+            self.memory += getsizeof(value)
+            if self.memory > self.memory_limit:
+                self.check_memory()
+        return value
+
+    def charge_growth(self, container: Any, size: int) -> None:
+        """Count what a container grew by since its size was size bytes"""
+        self.memory += getsizeof(container) - size
+        if self.memory > self.memory_limit:
+            self.check_memory()
+
+    def check_memory(self) -> None:
+        """Raise when the memory counted so far is over the ceiling"""
+        if self.memory > self.memory_limit:
+            self._exceed("memory_limit_exceeded", self.limits.max_memory)
+
+    def _exceed(self, error: str, limit: Any) -> None:
+        """Raise the error of a limit, granting the grace period the first time"""
+        if not self.exceeded:
+            self.exceeded = True
+            if self.step_limit is not None:
+                self.step_limit = self.steps + GRACE_STEPS
+            if self.memory_limit is not None:
+                self.memory_limit = self.memory + GRACE_MEMORY
+            self._next_batch(GRACE_STEPS)
+        raise ResourceLimitError(
+            AmharicErrorMessages.get_interpreter_error(error, limit=limit)
+        )
+
+    def _next_batch(self, batch: int = CHECK_INTERVAL) -> None:
+        if self.step_limit is not None:
+            batch = max(0, min(batch, self.step_limit - self.steps))
+        self._batch = self.countdown = batch
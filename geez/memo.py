@@ -0,0 +1,248 @@
+"""
+Ge-ez Memoization
+Detects pure functions and caches their results in a bounded LRU
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Set
+from .parser import (
+    StringNode,
+    IdentifierNode,
+    AssignmentNode,
+    IfNode,
+    WhileNode,
+    ForNode,
+    TryCatchNode,
+    PrintNode,
+    InputNode,
+    FileOperationNode,
+    CallNode,
+    FunctionNode,
+    ClassNode,
+    NewNode,
+    CallMethodNode,
+    PropertyAssignmentNode,
+    DictOperationNode,
+    ImportNode,
+    FromImportNode,
+    BuiltinFunctionNode,
+)
+from .files import FILE_FUNCTIONS
+from .resolver import Resolver, walk
+
+# Nodes with effects outside the call: output, input, files, declarations,
+# imports and mutation of objects or dictionaries passed in
+_IMPURE_NODES = (
+    PrintNode,
+    InputNode,
+    FileOperationNode,
+    FunctionNode,
+    ClassNode,
+    NewNode,
+    CallMethodNode,
+    PropertyAssignmentNode,
+    DictOperationNode,
+    ImportNode,
+    FromImportNode,
+)
+
+# Values a cached result may be, since every caller shares it
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str)
+
+# Returned by LRUCache.get for missing keys
+MISSING = object()
+
+
+class LRUCache:
+    """Mapping of bounded size that evicts the least recently used entry"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Get the value for key and mark it as recently used, or MISSING"""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        return MISSING
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        if self.maxsize <= 0:
+            return
+        entries = self._entries
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry; the counters are kept"""
+        self._entries.clear()
+
+
+def is_pure(
+    function: FunctionNode,
+    functions: Dict[str, FunctionNode],
+    resolver: Resolver,
+    checked: Optional[Dict[int, bool]] = None,
+) -> bool:
+    """Check if a function's result depends only on its arguments
+
+    A pure function prints nothing, reads no input, touches no files,
+    declares and imports nothing, mutates no objects, reads only its own
+    locals and calls only pure functions. Assignments inside a function
+    always bind locals, so it cannot write globals. A local read before
+    it is assigned falls back to the globals, so every local must be
+    assigned on every path to a read of it.
+    """
+    if checked is None:
+        checked = {}
+    if id(function) in checked:
+        # Recursive calls are assumed pure until proven otherwise
+        return checked[id(function)]
+    checked[id(function)] = True
+
+    resolver.resolve(function)
+    pure = True
+    for node in walk(function.body):
+        if isinstance(node, _IMPURE_NODES):
+            pure = False
+        elif isinstance(node, BuiltinFunctionNode) and node.function in FILE_FUNCTIONS:
+            pure = False
+        elif isinstance(node, IdentifierNode):
+            pure = resolver.slot_of(node) is not None
+        elif isinstance(node, CallNode):
+            callee = functions.get(node.name)
+            pure = callee is not None and is_pure(callee, functions, resolver, checked)
+        elif isinstance(node, BuiltinFunctionNode) and node.function == "PARALLEL_MAP":
+            # ትይዩ_ካርታ calls the function it names, which must be pure too
+            callee = None
+            if node.args and isinstance(node.args[0], StringNode):
+                callee = functions.get(node.args[0].value)
+            pure = callee is not None and is_pure(callee, functions, resolver, checked)
+        if not pure:
+            break
+    if pure:
+        pure = _check_block(function.body, set(function.parameters)) is not None
+
+    checked[id(function)] = pure
+    return pure
+
+
+def _check_block(statements: List[Any], assigned: Set[str]) -> Optional[Set[str]]:
+    """Locals assigned after a block on every path through it
+
+    Returns None if the block may read a name before assigning it.
+    """
+    for statement in statements:
+        assigned = _check_statement(statement, assigned)
+        if assigned is None:
+            return None
+    return assigned
+
+
+def _check_statement(node: Any, assigned: Set[str]) -> Optional[Set[str]]:
+    """Locals assigned after a statement, or None if it may read an unassigned one
+
+    Loop bodies may not run and try blocks may stop anywhere, so only
+    assignments outside them, in both branches of an if, or in a finally
+    block count afterwards.
+    """
+    if isinstance(node, AssignmentNode):
+        if not _reads_assigned(node.value, assigned):
+            return None
+        return assigned | {node.identifier}
+
+    if isinstance(node, IfNode):
+        outcomes = []
+        for condition, block in [(node.condition, node.then_block)] + list(
+            node.elif_blocks
+        ):
+            if not _reads_assigned(condition, assigned):
+                return None
+            after = _check_block(block, assigned)
+            if after is None:
+                return None
+            outcomes.append(after)
+        if node.else_block is None:
+            outcomes.append(assigned)
+        else:
+            after = _check_block(node.else_block, assigned)
+            if after is None:
+                return None
+            outcomes.append(after)
+        return set.intersection(*outcomes)
+
+    if isinstance(node, WhileNode):
+        if not _reads_assigned(node.condition, assigned):
+            return None
+        if _check_block(node.block, assigned) is None:
+            return None
+        return assigned
+
+    if isinstance(node, ForNode):
+        if not _reads_assigned(node.iterable, assigned):
+            return None
+        if _check_block(node.body, assigned | {node.variable}) is None:
+            return None
+        return assigned
+
+    if isinstance(node, TryCatchNode):
+        if _check_block(node.try_block, assigned) is None:
+            return None
+        for _, variable, block in node.catch_blocks:
+            caught = assigned | {variable} if variable else assigned
+            if _check_block(block, caught) is None:
+                return None
+        if node.finally_block:
+            return _check_block(node.finally_block, assigned)
+        return assigned
+
+    return assigned if _reads_assigned(node, assigned) else None
+
+
+def _reads_assigned(node: Any, assigned: Set[str]) -> bool:
+    """Check if every name a statement or expression reads is assigned"""
+    return all(
+        child.name in assigned
+        for child in walk([node])
+        if isinstance(child, IdentifierNode)
+    )
+
+
+def memo_key(value: Any) -> Optional[Hashable]:
+    """Hashable key telling apart values that compare equal across types
+
+    1, 1.0 and እውነት are equal in Python but print differently, so each
+    value is keyed with its type. Returns None for values that cannot be
+    keyed (lists, dictionaries, objects).
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return (type(value), value)
+    if isinstance(value, tuple):
+        keys = tuple(memo_key(item) for item in value)
+        if None in keys:
+            return None
+        return (tuple, keys)
+    return None
+
+
+def is_cacheable(value: Any) -> bool:
+    """Check if a result can be shared between callers"""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, tuple):
+        return all(is_cacheable(item) for item in value)
+    return False
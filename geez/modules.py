@@ -0,0 +1,137 @@
+"""
+Ge-ez Modules
+Finds module files on the search path and shares loaded modules per process
+"""
+
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Environment variable listing extra module directories, separated like PATH
+GEEZPATH_VARIABLE = "GEEZPATH"
+
+MODULE_SUFFIX = ".geez"
+
+
+def search_path() -> List[str]:
+    """Directories searched for modules: the working directory, then GEEZPATH"""
+    directories = [os.getcwd()]
+    for entry in os.environ.get(GEEZPATH_VARIABLE, "").split(os.pathsep):
+        if entry:
+            directory = os.path.abspath(entry)
+            if directory not in directories:
+                directories.append(directory)
+    return directories
+
+
+class ModuleIndex:
+    """Module files of each directory on the search path, listed once
+
+    A directory is listed the first time a module is looked up in it. A
+    module that is not in the listing only causes a new listing when the
+    directory was modified since, so files added while running are found.
+    """
+
+    def __init__(self):
+        # directory -> (modification time, module name -> file path)
+        self._directories: Dict[str, Tuple[int, Dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._directories)
+
+    def clear(self) -> None:
+        """Forget every directory listing"""
+        with self._lock:
+            self._directories.clear()
+
+    def find(self, module_name: str, directories: List[str]) -> Optional[str]:
+        """Path of the first file for a module in the directories, or None"""
+        for directory in directories:
+            path = self._modules_in(directory, refresh=False).get(module_name)
+            if path is None:
+                path = self._modules_in(directory, refresh=True).get(module_name)
+            if path is not None:
+                return path
+        return None
+
+    def _modules_in(self, directory: str, refresh: bool) -> Dict[str, str]:
+        """Module files of a directory, listing it again if it changed"""
+        entry = self._directories.get(directory)
+        if entry is not None and not refresh:
+            return entry[1]
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return {}
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        modules: Dict[str, str] = {}
+        try:
+            with os.scandir(directory) as scanned:
+                for item in scanned:
+                    if item.name.endswith(MODULE_SUFFIX) and item.is_file():
+                        modules[item.name[: -len(MODULE_SUFFIX)]] = item.path
+        except OSError:
+            return {}
+        with self._lock:
+            self._directories[directory] = (mtime, modules)
+        return modules
+
+
+class ModuleRegistry:
+    """Loaded modules shared by every interpreter of the process
+
+    Modules are keyed by file path and dropped when the file's size or
+    modification time changes. Importers get their own copy of a module's
+    names, so rebinding one does not affect the others.
+    """
+
+    def __init__(self):
+        # path -> (modification time, size, module content)
+        self._modules: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def clear(self) -> None:
+        """Drop every loaded module"""
+        with self._lock:
+            self._modules.clear()
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Copy of the content of a module loaded from path, or None"""
+        entry = self._modules.get(path)
+        if entry is not None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == entry[:2]:
+                self.hits += 1
+                return dict(entry[2])
+        self.misses += 1
+        return None
+
+    def put(self, path: str, content: Dict[str, Any]) -> None:
+        """Remember the content of a module loaded from path"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        with self._lock:
+            self._modules[path] = (stat.st_mtime_ns, stat.st_size, dict(content))
+
+
+# Shared by all interpreters of the process
+module_index = ModuleIndex()
+module_registry = ModuleRegistry()
+
+
+def find_module(module_name: str) -> Optional[str]:
+    """Path of a module's file on the search path, or None"""
+    return module_index.find(module_name, search_path())
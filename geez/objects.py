@@ -0,0 +1,216 @@
+"""
+Ge-ez Objects
+Class instances stored as property slots laid out by a per-class shape
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .parser import (
+    ASTNode,
+    IdentifierNode,
+    FunctionNode,
+    ClassNode,
+    MethodNode,
+    PropertyNode,
+    PropertyAssignmentNode,
+)
+from .resolver import SELF_NAMES
+
+# Value of a property slot that has not been assigned yet
+UNSET = object()
+
+# Keys every instance answers with its class, as dictionaries used to
+_CLASS_KEYS = ("__class__", "__parent__")
+
+
+class Shape:
+    """Property layout shared by the instances of a class
+
+    A class's shape has a slot for each declared property and each
+    property its constructor assigns through ራሱ, so instances are a list
+    of values indexed by slot. Assigning a property outside the layout
+    moves the instance to a shape with one more slot; those shapes are
+    cached, so instances that grow the same way keep sharing one.
+    """
+
+    __slots__ = ("class_name", "parent_class", "names", "methods", "_transitions")
+
+    def __init__(
+        self,
+        class_name: str,
+        parent_class: Optional[str] = None,
+        names: Optional[Dict[str, int]] = None,
+        methods: Optional[Dict[str, MethodNode]] = None,
+    ):
+        self.class_name = class_name
+        self.parent_class = parent_class
+        self.names: Dict[str, int] = names or {}
+        # Method table of the class, shared by every shape of its instances
+        self.methods: Dict[str, MethodNode] = methods if methods is not None else {}
+        self._transitions: Dict[str, "Shape"] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def with_property(self, name: str) -> "Shape":
+        """Shape of an instance after a property outside this layout is added"""
+        shape = self._transitions.get(name)
+        if shape is None:
+            names = dict(self.names)
+            names[name] = len(names)
+            shape = self._transitions[name] = Shape(
+                self.class_name, self.parent_class, names, self.methods
+            )
+        return shape
+
+
+class ClassTable:
+    """Methods, properties and instance shape of a declared class
+
+    Built once when the class is declared. The method table maps names to
+    methods, including those inherited through ተወላጅ that the class does
+    not override, so finding a method is a single dictionary lookup.
+    Declared properties are inherited the same way, and a class without a
+    constructor uses its parent's.
+    """
+
+    __slots__ = ("class_def", "methods", "constructor", "properties", "shape")
+
+    def __init__(self, class_def: ClassNode, parent: Optional["ClassTable"] = None):
+        self.class_def = class_def
+        self.methods: Dict[str, MethodNode] = dict(parent.methods) if parent else {}
+        self.constructor: Optional[MethodNode] = None
+        properties: Dict[str, PropertyNode] = (
+            {p.name: p for p in parent.properties} if parent else {}
+        )
+
+        own: Dict[str, MethodNode] = {}
+        for method in class_def.methods:
+            if isinstance(method, MethodNode):
+                # The first of several methods with one name wins
+                own.setdefault(method.name, method)
+                if method.is_constructor and self.constructor is None:
+                    self.constructor = method
+        self.methods.update(own)
+        if self.constructor is None and parent is not None:
+            self.constructor = parent.constructor
+
+        for property_node in class_def.properties:
+            properties[property_node.name] = property_node
+        self.properties: List[PropertyNode] = list(properties.values())
+
+        names: Dict[str, int] = {}
+        for name in properties:
+            names[name] = len(names)
+        if self.constructor is not None:
+            for name in _self_assignments(self.constructor.body):
+                names.setdefault(name, len(names))
+        self.shape = Shape(class_def.name, class_def.parent_class, names, self.methods)
+
+
+def _self_assignments(value: Any) -> List[str]:
+    """Properties assigned through ራሱ in a block, in source order"""
+    found: List[str] = []
+    if isinstance(value, PropertyAssignmentNode):
+        target = value.object_expr
+        if isinstance(target, IdentifierNode) and target.name in SELF_NAMES:
+            found.append(value.property_name)
+    if isinstance(value, ASTNode):
+        if not isinstance(value, (FunctionNode, ClassNode)):
+            for child in vars(value).values():
+                found.extend(_self_assignments(child))
+    elif isinstance(value, (list, tuple)):
+        for child in value:
+            found.extend(_self_assignments(child))
+    return found
+
+
+class GeEzObject:
+    """Instance of a Ge-ez class
+
+    Property values live in a list laid out by the class's shape. Objects
+    also behave as a read/write mapping of their properties, plus the
+    __class__ and __parent__ keys, so they can still serve as a method's
+    enclosing scope and be used with the dictionary operations.
+    """
+
+    __slots__ = ("shape", "values")
+
+    def __init__(self, shape: Shape):
+        self.shape = shape
+        self.values: List[Any] = [UNSET] * len(shape.names)
+
+    def get_property(self, name: str, default: Any = UNSET) -> Any:
+        """Value of a property, or default when it has not been assigned"""
+        slot = self.shape.names.get(name)
+        if slot is None:
+            return default
+        value = self.values[slot]
+        return default if value is UNSET else value
+
+    def set_property(self, name: str, value: Any) -> None:
+        """Assign a property, extending the shape if it has no slot for it"""
+        slot = self.shape.names.get(name)
+        if slot is None:
+            self.shape = self.shape.with_property(name)
+            self.values.append(value)
+        else:
+            self.values[slot] = value
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Class keys and assigned properties, in layout order"""
+        shape = self.shape
+        for key, value in zip(_CLASS_KEYS, (shape.class_name, shape.parent_class)):
+            if key not in shape.names:
+                yield key, value
+        for name, value in zip(shape.names, self.values):
+            if value is not UNSET:
+                yield name, value
+
+    def keys(self) -> Iterator[str]:
+        return (key for key, _ in self.items())
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
+
+    def __contains__(self, key: Any) -> bool:
+        if self.get_property(key) is not UNSET:
+            return True
+        return key in _CLASS_KEYS and key not in self.shape.names
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.get_property(key)
+        if value is not UNSET:
+            return value
+        if key == "__class__" and key not in self.shape.names:
+            return self.shape.class_name
+        if key == "__parent__" and key not in self.shape.names:
+            return self.shape.parent_class
+        raise KeyError(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.set_property(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        slot = self.shape.names.get(key)
+        if slot is None or self.values[slot] is UNSET:
+            raise KeyError(key)
+        self.values[slot] = UNSET
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (GeEzObject, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # mutable, like the dictionaries objects used to be
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
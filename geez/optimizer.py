@@ -0,0 +1,172 @@
+"""
+Ge-ez Optimizer
+Folds constant expressions and removes dead branches from the AST
+"""
+
+from typing import Any, List, Optional
+from .parser import (
+    ASTNode,
+    NumberNode,
+    StringNode,
+    BooleanNode,
+    BinaryOpNode,
+    UnaryOpNode,
+    IfNode,
+    ListNode,
+    TupleNode,
+    SetNode,
+    ConstantNode,
+)
+
+# Nodes whose value is known before the program runs
+_CONSTANT_NODES = (NumberNode, StringNode, BooleanNode, ConstantNode)
+
+# Values that can be shared between evaluations without copying
+_IMMUTABLE_TYPES = (bool, int, float, str, tuple)
+
+
+def constant_node(value: Any) -> Optional[ASTNode]:
+    """Node producing a precomputed value, or None if it has no literal form"""
+    if isinstance(value, bool):
+        return BooleanNode(value)
+    if isinstance(value, (int, float)):
+        return NumberNode(value)
+    if isinstance(value, str):
+        return StringNode(value)
+    if isinstance(value, (list, tuple)):
+        # Elements are shared by every copy, so they must not be mutable
+        if all(isinstance(element, _IMMUTABLE_TYPES) for element in value):
+            return ConstantNode(value)
+    return None
+
+
+class Optimizer:
+    """Rewrites a program before it runs
+
+    Operators applied to constants are evaluated once with the
+    interpreter's own semantics; anything that would raise (division by
+    zero, mismatched types) is left in place so the error happens at run
+    time as before. If statements whose conditions are constant keep only
+    the branch that can run, and list, tuple and set literals of constants
+    are precomputed.
+    """
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self._folders = {
+            BinaryOpNode: self.fold_binary_op,
+            UnaryOpNode: self.fold_unary_op,
+            IfNode: self.fold_if,
+            ListNode: self.fold_collection,
+            TupleNode: self.fold_collection,
+            SetNode: self.fold_collection,
+        }
+
+    def optimize(self, statements: List[ASTNode]) -> List[ASTNode]:
+        """Optimize a list of statements, rewriting nested blocks in place"""
+        return self.fold_list(statements)
+
+    def fold(self, node: ASTNode) -> ASTNode:
+        """Fold the children of a node, then the node itself"""
+        for name, value in vars(node).items():
+            setattr(node, name, self.fold_value(value))
+        folder = self._folders.get(type(node))
+        return node if folder is None else folder(node)
+
+    def fold_value(self, value: Any) -> Any:
+        """Fold a node attribute: a node, a block, or a tuple such as an elif branch"""
+        if isinstance(value, ASTNode):
+            return self.fold(value)
+        if isinstance(value, list):
+            return self.fold_list(value)
+        if isinstance(value, tuple):
+            return tuple(self.fold_value(item) for item in value)
+        return value
+
+    def fold_list(self, nodes: List[Any]) -> List[Any]:
+        """Fold a list of nodes, inlining if statements reduced to one block"""
+        result = []
+        last = len(nodes) - 1
+        for index, node in enumerate(nodes):
+            node = self.fold_value(node)
+            # An if statement evaluates to None, so one ending a block stays
+            # in place to keep the value of the block unchanged
+            if index != last and self.is_decided(node):
+                result.extend(node.then_block)
+            else:
+                result.append(node)
+        return result
+
+    def is_decided(self, node: Any) -> bool:
+        """Check if a node is an if statement that always runs its first block"""
+        return (
+            isinstance(node, IfNode)
+            and isinstance(node.condition, BooleanNode)
+            and node.condition.value is True
+            and not node.elif_blocks
+            and not node.else_block
+        )
+
+    def fold_binary_op(self, node: BinaryOpNode) -> ASTNode:
+        """Evaluate a binary operation on two constants"""
+        if not (
+            isinstance(node.left, _CONSTANT_NODES)
+            and isinstance(node.right, _CONSTANT_NODES)
+        ):
+            return node
+        try:
+            value = self.interpreter.binary_operation(
+                node.operator, node.left.value, node.right.value
+            )
+        except Exception:
+            return node
+        return constant_node(value) or node
+
+    def fold_unary_op(self, node: UnaryOpNode) -> ASTNode:
+        """Evaluate a unary operation on a constant"""
+        if not isinstance(node.operand, _CONSTANT_NODES):
+            return node
+        try:
+            value = self.interpreter.unary_operation(node.operator, node.operand.value)
+        except Exception:
+            return node
+        return constant_node(value) or node
+
+    def fold_if(self, node: IfNode) -> ASTNode:
+        """Drop branches whose conditions are constant"""
+        branches = []
+        else_block = node.else_block
+        for condition, block in [(node.condition, node.then_block)] + node.elif_blocks:
+            if not isinstance(condition, _CONSTANT_NODES):
+                branches.append((condition, block))
+            elif condition.value:
+                # Always taken: later branches can never run
+                else_block = block
+                break
+
+        if not branches:
+            folded = IfNode(BooleanNode(True), else_block or [])
+        else:
+            condition, then_block = branches[0]
+            folded = IfNode(condition, then_block, branches[1:], else_block)
+        folded.line = node.line
+        return folded
+
+    def fold_collection(self, node: ASTNode) -> ASTNode:
+        """Precompute a list, tuple or set literal of constants"""
+        if not all(isinstance(element, _CONSTANT_NODES) for element in node.elements):
+            return node
+        values = [element.value for element in node.elements]
+        if isinstance(node, TupleNode):
+            return constant_node(tuple(values)) or node
+        if isinstance(node, ListNode):
+            return constant_node(values) or node
+
+        if not all(isinstance(value, _IMMUTABLE_TYPES) for value in values):
+            return node
+        try:
+            value = set(values)
+        except TypeError:
+            # Unhashable members (tuples holding lists) fail at run time as before
+            return node
+        return ConstantNode(value, tuple(values))
@@ -0,0 +1,140 @@
+"""
+Ge-ez Output
+Buffered destinations for what programs print with ማተም
+"""
+
+import io
+import sys
+from typing import Any, BinaryIO, List, Optional
+
+# Flush policies: at every newline, when the buffer is full, or only at exit
+FLUSH_POLICIES = ("line", "size", "exit")
+
+DEFAULT_BUFFER_SIZE = 64 * 1024  # characters
+
+
+class OutputSink:
+    """Collects program output and writes it out according to a flush policy
+
+    Text is kept as a list of strings and joined into one string per
+    flush, so a flush costs one encode and one write however many lines
+    were printed. With the "line" policy every write goes straight out,
+    which matches Python's print.
+    """
+
+    def __init__(self, flush: str = "line", buffer_size: int = DEFAULT_BUFFER_SIZE):
+        if flush not in FLUSH_POLICIES:
+            raise ValueError(f"Unknown flush policy: {flush}")
+        self.policy = flush
+        self.buffer_size = buffer_size
+        self._pending: List[str] = []
+        self._size = 0
+
+    def print(self, value: Any) -> None:
+        """Write a value followed by a newline, like Python's print"""
+        self.write(f"{value}\n")
+
+    def write(self, text: str) -> None:
+        """Write text, flushing it when the policy says so"""
+        if self.policy == "line":
+            self._write_out(text)
+            return
+        self._pending.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size and self.policy == "size":
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out everything buffered"""
+        if self._pending:
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._size = 0
+            self._write_out(text)
+
+    def close(self) -> None:
+        """Flush and release the destination"""
+        self.flush()
+
+    def _write_out(self, text: str) -> None:
+        raise NotImplementedError
+
+
+class StdoutSink(OutputSink):
+    """Writes to whatever sys.stdout is at the time of the write
+
+    Buffered text is encoded once with the stream's encoding and written
+    to its binary buffer when it has one.
+    """
+
+    def _write_out(self, text: str) -> None:
+        stream = sys.stdout
+        buffer = getattr(stream, "buffer", None)
+        if buffer is None or self.policy == "line":
+            stream.write(text)
+            return
+        stream.flush()  # keep text written through the stream in order
+        buffer.write(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+        buffer.flush()
+
+
+class FileSink(OutputSink):
+    """Writes UTF-8 to a file opened in binary mode, or to a path it opens"""
+
+    def __init__(
+        self,
+        target: Any,
+        flush: str = "size",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        super().__init__(flush, buffer_size)
+        self._owned = isinstance(target, str)
+        self._file: BinaryIO = open(target, "wb") if self._owned else target
+
+    def _write_out(self, text: str) -> None:
+        self._file.write(text.encode("utf-8"))
+        if self.policy == "line":
+            self._file.flush()
+
+    def flush(self) -> None:
+        super().flush()
+        self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._owned:
+            self._file.close()
+
+
+class MemorySink(OutputSink):
+    """Keeps output in memory, for tests and embedding"""
+
+    def __init__(self, flush: str = "exit", buffer_size: int = DEFAULT_BUFFER_SIZE):
+        super().__init__(flush, buffer_size)
+        self._captured = io.StringIO()
+
+    def _write_out(self, text: str) -> None:
+        self._captured.write(text)
+
+    def getvalue(self) -> str:
+        """Everything written so far, buffered text included"""
+        self.flush()
+        return self._captured.getvalue()
+
+
+def create_output(
+    target: Optional[str] = None,
+    flush: Optional[str] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> OutputSink:
+    """Sink for a target: None or "-" for stdout, "memory", or a file path
+
+    Without a flush policy, a terminal gets "line" and anything else "size".
+    """
+    if target in (None, "-"):
+        if flush is None:
+            flush = "line" if sys.stdout.isatty() else "size"
+        return StdoutSink(flush, buffer_size)
+    if target == "memory":
+        return MemorySink(flush or "exit", buffer_size)
+    return FileSink(target, flush or "size", buffer_size)
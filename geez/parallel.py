@@ -0,0 +1,117 @@
+"""
+Ge-ez Parallel Map
+Runs ትይዩ_ካርታ calls of pure functions on a pool of worker processes
+
+The items are split into contiguous chunks. Each chunk is sent to a
+worker together with the pickled FunctionNode and every function it
+calls, including functions imported from modules; the worker runs them
+on a fresh interpreter of the caller's backend and the chunks' results
+are joined back in order. Pure functions read nothing but their
+arguments, so nothing else has to be sent.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+from .parser import BuiltinFunctionNode, CallNode, FunctionNode, StringNode
+from .resolver import walk
+
+# Chunks per worker, so workers that finish early pick up the slack
+CHUNKS_PER_WORKER = 4
+
+# Pool shared by the interpreters of the process, started on first use
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_pid = 0
+
+
+def worker_count(jobs: Optional[int] = None) -> int:
+    """Workers to use: jobs, or one per CPU"""
+    return jobs or os.cpu_count() or 1
+
+
+def referenced_functions(
+    name: str, functions: Dict[str, FunctionNode]
+) -> Dict[str, FunctionNode]:
+    """A function and every function it calls, directly or not"""
+    needed: Dict[str, FunctionNode] = {}
+    pending = [name]
+    while pending:
+        name = pending.pop()
+        if name in needed or name not in functions:
+            continue
+        function = needed[name] = functions[name]
+        for node in walk(function.body):
+            if isinstance(node, CallNode):
+                pending.append(node.name)
+            elif (
+                isinstance(node, BuiltinFunctionNode)
+                and node.function == "PARALLEL_MAP"
+                and node.args
+                and isinstance(node.args[0], StringNode)
+            ):
+                pending.append(node.args[0].value)
+    return needed
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """The process's pool of workers, started again for another size
+
+    A pool inherited through fork (by a `geez serve` child, for instance)
+    belongs to the parent and is never used.
+    """
+    global _pool, _pool_workers, _pool_pid
+    if _pool is None or _pool_workers != workers or _pool_pid != os.getpid():
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(workers)
+        _pool_workers = workers
+        _pool_pid = os.getpid()
+    return _pool
+
+
+def _map_chunk(
+    backend: type, name: str, functions: Dict[str, FunctionNode], items: List[Any]
+) -> List[Any]:
+    """Call a function on each item of a chunk, in a worker"""
+    interpreter = backend()
+    interpreter.parallel_jobs = 1  # nested ትይዩ_ካርታ calls run in the worker
+    interpreter.functions.update(functions)
+    call = interpreter.call_function
+    return [call(name, [item]) for item in items]
+
+
+def parallel_map(
+    backend: type,
+    name: str,
+    functions: Dict[str, FunctionNode],
+    items: List[Any],
+    workers: int,
+) -> List[Any]:
+    """Call a pure one-parameter function on each item on worker processes
+
+    Results come back in the order of the items; the first error a
+    worker raises is raised here.
+    """
+    global _pool
+    needed = referenced_functions(name, functions)
+    size = -(-len(items) // (workers * CHUNKS_PER_WORKER))
+    chunks = [items[start : start + size] for start in range(0, len(items), size)]
+    pool = get_pool(workers)
+    try:
+        mapped = pool.map(
+            _map_chunk,
+            [backend] * len(chunks),
+            [name] * len(chunks),
+            [needed] * len(chunks),
+            chunks,
+        )
+        results: List[Any] = []
+        for chunk in mapped:
+            results.extend(chunk)
+        return results
+    except BrokenProcessPool:
+        # Start a new pool next time
+        _pool = None
+        raise
@@ -3,15 +3,17 @@ Ge-ez Parser
 Builds Abstract Syntax Tree (AST) from tokens
 """
 
-from typing import List, Optional
-from .lexer import Token
+from array import array
+from typing import Iterable, Iterator, List, Optional
+from .lexer import Token, TokenBuffer, TOKEN_CODES, TOKEN_TYPES
 from .errors import AmharicErrorMessages
 
 
 class ASTNode:
     """Base class for AST nodes"""
 
-    pass
+    # Source line of a statement; expressions inside it leave this at 0
+    line = 0
 
 
 class NumberNode(ASTNode):
@@ -392,26 +394,108 @@ class ContinueNode(ASTNode):
         return "Continue()"
 
 
+class ConstantNode(ASTNode):
+    """Precomputed constant list, tuple or set (produced by geez.optimizer)"""
+
+    def __init__(self, value, elements: Optional[tuple] = None):
+        self.value = value
+        # Members of a set in source order, so copies iterate in the same order
+        self.elements = elements
+
+    def __repr__(self):
+        return f"Constant({self.value!r})"
+
+
+# Kind codes the parser compares against directly
+_EOF = TOKEN_CODES["EOF"]
+_LPAREN = TOKEN_CODES["LPAREN"]
+_RPAREN = TOKEN_CODES["RPAREN"]
+_COMMA = TOKEN_CODES["COMMA"]
+
+# Prefix operator kinds; they bind tighter than any binary operator
+_PREFIX_KINDS = frozenset((TOKEN_CODES["MINUS"], TOKEN_CODES["NOT"]))
+
+# Binding power of each binary operator kind, loosest first
+_BINARY_POWERS = {
+    TOKEN_CODES["OR"]: 1,
+    TOKEN_CODES["AND"]: 2,
+    TOKEN_CODES["EQUAL"]: 3,
+    TOKEN_CODES["NOT_EQUAL"]: 3,
+    TOKEN_CODES["LESS"]: 4,
+    TOKEN_CODES["GREATER"]: 4,
+    TOKEN_CODES["LESS_EQUAL"]: 4,
+    TOKEN_CODES["GREATER_EQUAL"]: 4,
+    TOKEN_CODES["PLUS"]: 5,
+    TOKEN_CODES["MINUS"]: 5,
+    TOKEN_CODES["MULTIPLY"]: 6,
+    TOKEN_CODES["DIVIDE"]: 6,
+}
+
+
 class GeEzParser:
     """Parser for Ge-ez Amharic programming language"""
 
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
+    def __init__(self, tokens: Iterable[Token]):
+        # Token kind codes parallel to self.tokens; Token objects are only
+        # looked at when their value or position is needed
+        if isinstance(tokens, TokenBuffer):
+            self.tokens = tokens
+            self.kinds = tokens.kinds
+            self._stream = None
+            self._streaming = False
+        elif isinstance(tokens, list):
+            self.tokens = tokens
+            self.kinds = array("B", [TOKEN_CODES[token.type] for token in tokens])
+            self._stream = None
+            self._streaming = False
+        else:
+            # Tokens are pulled on demand and released once parsed
+            self.tokens = []
+            self.kinds = array("B")
+            self._stream = iter(tokens)
+            self._streaming = True
         self.current = 0
 
     def parse(self) -> List[ASTNode]:
         """Parse tokens into AST"""
-        statements = []
+        return list(self.iter_statements())
 
+    def iter_statements(self) -> Iterator[ASTNode]:
+        """Parse and yield one top-level statement at a time"""
         while not self.is_at_end():
             statement = self.parse_statement()
+            if self._streaming:
+                # Statements never look back, so parsed tokens can go
+                del self.tokens[: self.current]
+                del self.kinds[: self.current]
+                self.current = 0
             if statement:
-                statements.append(statement)
-
-        return statements
+                yield statement
+
+    def fill(self, index: int) -> bool:
+        """Check whether tokens[index] exists, pulling tokens from the stream"""
+        kinds = self.kinds
+        while index >= len(kinds):
+            if self._stream is None:
+                return False
+            token = next(self._stream, None)
+            if token is None:
+                self._stream = None
+                return False
+            self.tokens.append(token)
+            kinds.append(TOKEN_CODES[token.type])
+        return True
 
     def parse_statement(self) -> Optional[ASTNode]:
-        """Parse a single statement"""
+        """Parse a single statement, recording the line it starts on"""
+        line = self.peek().line
+        statement = self.parse_statement_body()
+        if statement is not None:
+            statement.line = line
+        return statement
+
+    def parse_statement_body(self) -> Optional[ASTNode]:
+        """Parse the statement starting at the current token"""
         if self.match("VAR"):
             return self.parse_variable_declaration()
         elif self.match("PRINT"):
@@ -627,80 +711,29 @@ class GeEzParser:
             # Error: can't assign to this type
             raise SyntaxError("Can only assign to variables or properties")
 
-    def parse_expression(self) -> ASTNode:
-        """Parse expression"""
-        return self.parse_logical_or()
-
-    def parse_logical_or(self) -> ASTNode:
-        """Parse logical OR: expression ወይም expression"""
-        left = self.parse_logical_and()
-
-        while self.match("OR"):
-            operator = self.previous().value
-            right = self.parse_logical_and()
-            left = BinaryOpNode(left, operator, right)
-
-        return left
-
-    def parse_logical_and(self) -> ASTNode:
-        """Parse logical AND: expression እና expression"""
-        left = self.parse_equality()
-
-        while self.match("AND"):
-            operator = self.previous().value
-            right = self.parse_equality()
-            left = BinaryOpNode(left, operator, right)
-
-        return left
-
-    def parse_equality(self) -> ASTNode:
-        """Parse equality: expression == expression or expression != expression"""
-        left = self.parse_comparison()
-
-        while self.match("EQUAL", "NOT_EQUAL"):
-            operator = self.previous().value
-            right = self.parse_comparison()
-            left = BinaryOpNode(left, operator, right)
-
-        return left
-
-    def parse_comparison(self) -> ASTNode:
-        """Parse comparison: expression < > <= >= expression"""
-        left = self.parse_term()
-
-        while self.match("LESS", "GREATER", "LESS_EQUAL", "GREATER_EQUAL"):
-            operator = self.previous().value
-            right = self.parse_term()
-            left = BinaryOpNode(left, operator, right)
-
-        return left
-
-    def parse_term(self) -> ASTNode:
-        """Parse term: expression + - expression"""
-        left = self.parse_factor()
-
-        while self.match("PLUS", "MINUS"):
-            operator = self.previous().value
-            right = self.parse_factor()
-            left = BinaryOpNode(left, operator, right)
-
-        return left
-
-    def parse_factor(self) -> ASTNode:
-        """Parse factor: expression * / expression"""
+    def parse_expression(self, min_power: int = 0) -> ASTNode:
+        """Parse expression by precedence climbing over binary operators"""
         left = self.parse_unary()
+        kinds = self.kinds
 
-        while self.match("MULTIPLY", "DIVIDE"):
-            operator = self.previous().value
-            right = self.parse_unary()
+        while self.current < len(kinds) or self.fill(self.current):
+            power = _BINARY_POWERS.get(kinds[self.current])
+            # Equal power stops too, so operators associate to the left
+            if power is None or power <= min_power:
+                break
+            operator = self.tokens[self.current].value
+            self.current += 1
+            right = self.parse_expression(power)
             left = BinaryOpNode(left, operator, right)
 
         return left
 
     def parse_unary(self) -> ASTNode:
         """Parse unary: - expression or ! expression"""
-        if self.match("MINUS", "NOT"):
-            operator = self.previous().value
+        current = self.current
+        if self.fill(current) and self.kinds[current] in _PREFIX_KINDS:
+            operator = self.tokens[current].value
+            self.current = current + 1
             right = self.parse_unary()
             return UnaryOpNode(operator, right)
 
@@ -815,7 +848,18 @@ class GeEzParser:
             # Check if this is a function call
             if self.match("LPAREN"):
                 # Check if this is a built-in function
-                if name in ["ወሰን", "ዓይነት", "ቁጥር", "ጽሑፍ", "ከፍተኛ", "ዠቅተኛ"]:
+                if name in [
+                    "ወሰን",
+                    "ዓይነት",
+                    "ቁጥር",
+                    "ጽሑፍ",
+                    "ከፍተኛ",
+                    "ዠቅተኛ",
+                    "ትይዩ_ካርታ",
+                    "መስመሮች",
+                    "ቁርጥራጮች",
+                    "ትውስታ_አንብብ",
+                ]:
                     # Map Amharic names to token types
                     function_map = {
                         "ወሰን": "RANGE",
@@ -824,6 +868,10 @@ class GeEzParser:
                         "ጽሑፍ": "STR",
                         "ከፍተኛ": "MAX",
                         "ዠቅተኛ": "MIN",
+                        "ትይዩ_ካርታ": "PARALLEL_MAP",
+                        "መስመሮች": "LINES",
+                        "ቁርጥራጮች": "CHUNKS",
+                        "ትውስታ_አንብብ": "MAPPED_READ",
                     }
                     function_type = function_map[name]
 
@@ -836,6 +884,14 @@ class GeEzParser:
                                 break
                         self.consume("RPAREN", f"Expected ) after {name}")
 
+                    if (
+                        function_type == "PARALLEL_MAP"
+                        and args
+                        and isinstance(args[0], IdentifierNode)
+                    ):
+                        # The function is named, not evaluated
+                        args[0] = StringNode(args[0].name)
+
                     return BuiltinFunctionNode(function_type, args)
                 else:
                     # Regular function call
@@ -858,29 +914,18 @@ class GeEzParser:
                     return IdentifierNode(name)
 
         if self.match("LPAREN"):
-            # Check if this is a tuple by looking for comma or empty tuple
-            # For nested tuples, we need to look ahead to find a comma
-            if self.peek().type == "RPAREN":
+            if self.check("RPAREN"):
                 # Empty tuple
                 return self.parse_tuple_literal()
-            else:
-                # Look ahead to see if there's a comma before the matching )
-                paren_count = 1
-                i = self.current
-                while i < len(self.tokens) and paren_count > 0:
-                    if self.tokens[i].type == "LPAREN":
-                        paren_count += 1
-                    elif self.tokens[i].type == "RPAREN":
-                        paren_count -= 1
-                    elif self.tokens[i].type == "COMMA" and paren_count == 1:
-                        # Found a comma at the top level - this is a tuple
-                        return self.parse_tuple_literal()
-                    i += 1
-                
-                # No comma found at top level - this is grouping
-                expr = self.parse_expression()
-                self.consume("RPAREN", "Expected )")
-                return expr
+
+            # Parse the first expression; a comma after it makes this a tuple
+            expr = self.parse_expression()
+            if self.check("COMMA"):
+                return self.parse_tuple_literal([expr])
+
+            # Otherwise this is grouping
+            self.consume("RPAREN", "Expected )")
+            return expr
 
         error_msg = AmharicErrorMessages.get_parser_error(
             "unexpected_token",
@@ -892,23 +937,31 @@ class GeEzParser:
 
     def match(self, *token_types: str) -> bool:
         """Check if current token matches any of the given types"""
+        current = self.current
+        if current >= len(self.kinds) and not self.fill(current):
+            return False
+        kind = self.kinds[current]
+        if kind == _EOF:
+            return False
         for token_type in token_types:
-            if self.check(token_type):
-                self.advance()
+            if kind == TOKEN_CODES[token_type]:
+                self.current = current + 1
                 return True
         return False
 
     def check(self, token_type: str) -> bool:
         """Check if current token is of given type"""
-        if self.is_at_end():
+        current = self.current
+        if current >= len(self.kinds) and not self.fill(current):
             return False
-        return self.peek().type == token_type
+        kind = self.kinds[current]
+        return kind != _EOF and kind == TOKEN_CODES[token_type]
 
     def check_next(self, *token_types: str) -> bool:
         """Check if the next token matches any of the given types"""
-        if self.current + 1 >= len(self.tokens):
+        if self.current + 1 >= len(self.kinds) and not self.fill(self.current + 1):
             return False
-        return self.tokens[self.current + 1].type in token_types
+        return TOKEN_TYPES[self.kinds[self.current + 1]] in token_types
 
     def advance(self) -> Token:
         """Move to next token"""
@@ -918,11 +971,13 @@ class GeEzParser:
 
     def is_at_end(self) -> bool:
         """Check if we're at the end of tokens"""
-        return self.peek().type == "EOF" or self.current >= len(self.tokens)
+        if self.current >= len(self.kinds) and not self.fill(self.current):
+            return True
+        return self.kinds[self.current] == _EOF
 
     def peek(self) -> Token:
         """Get current token without advancing"""
-        if self.current >= len(self.tokens):
+        if self.current >= len(self.kinds) and not self.fill(self.current):
             return Token("EOF", "", 0, 0)
         return self.tokens[self.current]
 
@@ -1270,28 +1325,21 @@ class GeEzParser:
         
         return FromImportNode(module_name, function_name)
 
-    def parse_tuple_literal(self) -> ASTNode:
-        """Parse tuple literal: (expr1, expr2, expr3)"""
-        elements = []
-        
-        # Check if this is an empty tuple
-        if self.peek().type == "RPAREN":
-            self.consume("RPAREN", message="Expected )")
-            return TupleNode(elements)
-        
-        # Parse non-empty tuple
-        while True:
-            # Parse expression
-            expr = self.parse_expression()
-            elements.append(expr)
-            
-            if not self.match("COMMA"):
-                break
-            
+    def parse_tuple_literal(self, elements: Optional[List[ASTNode]] = None) -> ASTNode:
+        """Parse tuple literal: (expr1, expr2, expr3), after any elements already parsed"""
+        if elements is None:
+            # Check if this is an empty tuple
+            if self.check("RPAREN"):
+                self.consume("RPAREN", message="Expected )")
+                return TupleNode([])
+            elements = [self.parse_expression()]
+
+        while self.match("COMMA"):
             # Check if there's a trailing comma (comma followed by )
-            if self.peek().type == "RPAREN":
+            if self.check("RPAREN"):
                 break
-        
+            elements.append(self.parse_expression())
+
         self.consume("RPAREN", message="Expected )")
         return TupleNode(elements)
 
@@ -0,0 +1,229 @@
+"""
+Ge-ez Profiler
+Measures where a Ge-ez program spends its time, per function and per line
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Name of the frame that runs top-level statements
+PROGRAM_NAME = "<ፕሮግራም>"
+
+# Collapsed stacks count microseconds, flamegraph tools expect integers
+_MICROSECONDS = 1_000_000
+
+
+class _Frame:
+    """Timing record of one active call"""
+
+    __slots__ = ("name", "start", "children", "line", "line_start")
+
+    def __init__(self, name: str, start: float):
+        self.name = name
+        self.start = start
+        self.children = 0.0  # time spent in calls made from this frame
+        self.line = 0  # line being run, 0 before the first statement
+        self.line_start = start
+
+
+class Profiler:
+    """Deterministic profiler: records every call and every line
+
+    The interpreter reports each function, method and constructor call
+    with enter()/leave() and each statement with line(). Functions get a
+    call count, their cumulative time (counted once for recursive calls)
+    and their own time excluding callees. A line's time runs until the
+    next line of the same call, so it includes the functions it calls.
+    """
+
+    mode = "deterministic"
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        # name -> [calls, cumulative seconds, own seconds]
+        self.functions: Dict[str, List[float]] = {}
+        # (function name, line) -> [hits, seconds]
+        self.lines: Dict[Tuple[str, int], List[float]] = {}
+        # "outer;inner" -> own seconds spent with exactly that call stack
+        self.stacks: Dict[str, float] = {}
+        self._frames: List[_Frame] = []
+        self._active: Dict[str, int] = {}  # calls of each name on the stack
+
+    def start(self) -> None:
+        """Start profiling the top-level program"""
+        self.enter(PROGRAM_NAME)
+
+    def stop(self) -> None:
+        """Close every call still open"""
+        while self._frames:
+            self.leave()
+
+    def enter(self, name: str) -> None:
+        """Record the start of a call"""
+        self._frames.append(_Frame(name, self.clock()))
+        self._active[name] = self._active.get(name, 0) + 1
+
+    def leave(self) -> None:
+        """Record the end of the innermost call"""
+        now = self.clock()
+        frames = self._frames
+        frame = frames[-1]
+        self._charge_line(frame, now)
+        stack = ";".join(f.name for f in frames)
+        frames.pop()
+
+        name = frame.name
+        elapsed = now - frame.start
+        own = elapsed - frame.children
+        stats = self.functions.get(name)
+        if stats is None:
+            stats = self.functions[name] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[2] += own
+        self._active[name] -= 1
+        if not self._active[name]:
+            # Only the outermost of recursive calls adds to the cumulative time
+            stats[1] += elapsed
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + own
+        if frames:
+            frames[-1].children += elapsed
+
+    def line(self, line: int) -> None:
+        """Record that the innermost call started running a line"""
+        now = self.clock()
+        frame = self._frames[-1]
+        self._charge_line(frame, now)
+        frame.line = line
+        frame.line_start = now
+        stats = self.lines.get((frame.name, line))
+        if stats is None:
+            stats = self.lines[(frame.name, line)] = [0, 0.0]
+        stats[0] += 1
+
+    def _charge_line(self, frame: _Frame, now: float) -> None:
+        """Add the time since the frame's line started to that line"""
+        if frame.line:
+            self.lines[(frame.name, frame.line)][1] += now - frame.line_start
+
+    def report(self, limit: Optional[int] = 20) -> str:
+        """Render the hottest functions and lines as a table"""
+        functions = sorted(self.functions.items(), key=lambda item: -item[1][1])
+        lines = sorted(self.lines.items(), key=lambda item: -item[1][1])
+
+        rows = [f"{'ተግባር (function)':<32}{'calls':>10}{'cumulative':>14}{'own':>12}"]
+        for name, (calls, cumulative, own) in functions[:limit]:
+            calls_text = str(calls) if calls else "-"
+            rows.append(f"{name:<32}{calls_text:>10}{cumulative:>13.6f}s{own:>11.6f}s")
+        rows.append("")
+        rows.append(f"{'መስመር (line)':<32}{'hits':>10}{'time':>14}")
+        for (name, line), (hits, seconds) in lines[:limit]:
+            rows.append(f"{f'{name}:{line}':<32}{hits:>10}{seconds:>13.6f}s")
+        return "\n".join(rows)
+
+    def collapsed_stacks(self) -> str:
+        """Own time per call stack in the collapsed format of flamegraph tools"""
+        rows = []
+        for stack, seconds in sorted(self.stacks.items()):
+            weight = round(seconds * _MICROSECONDS)
+            if weight > 0:
+                rows.append(f"{stack} {weight}")
+        return "\n".join(rows) + "\n" if rows else ""
+
+    def write_collapsed(self, path: str) -> None:
+        """Write collapsed stacks to a file"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed_stacks())
+
+
+class SamplingProfiler(Profiler):
+    """Low-overhead profiler that samples the call stack from a thread
+
+    Calls and lines only update a stack of names and current lines; a
+    background thread records that stack every interval and credits the
+    time since its previous sample to it. Results are estimates in the
+    same tables as the deterministic profiler, with samples as line hits
+    and no call counts.
+    """
+
+    mode = "sampling"
+
+    def __init__(self, interval: float = 0.001, clock=time.perf_counter):
+        super().__init__(clock)
+        self.interval = interval
+        self.samples = 0
+        self._names: List[str] = []
+        self._lines: List[int] = []
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the sampling thread and profile the top-level program"""
+        self.enter(PROGRAM_NAME)
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="geez-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._names.clear()
+        self._lines.clear()
+
+    def enter(self, name: str) -> None:
+        self._names.append(name)
+        self._lines.append(0)
+
+    def leave(self) -> None:
+        self._names.pop()
+        self._lines.pop()
+
+    def line(self, line: int) -> None:
+        self._lines[-1] = line
+
+    def _sample_loop(self) -> None:
+        """Take a sample every interval until stopped"""
+        last = self.clock()
+        while not self._stopped.wait(self.interval):
+            now = self.clock()
+            self.sample(now - last)
+            last = now
+
+    def sample(self, seconds: float) -> None:
+        """Credit time to the current call stack"""
+        names = tuple(self._names)
+        lines = tuple(self._lines)
+        if not names or len(names) != len(lines):
+            # Caught between a call's two list updates
+            return
+        self.samples += 1
+
+        leaf = names[-1]
+        for name in set(names):
+            stats = self.functions.get(name)
+            if stats is None:
+                stats = self.functions[name] = [0, 0.0, 0.0]
+            stats[1] += seconds
+        self.functions[leaf][2] += seconds
+
+        if lines[-1]:
+            stats = self.lines.get((leaf, lines[-1]))
+            if stats is None:
+                stats = self.lines[(leaf, lines[-1])] = [0, 0.0]
+            stats[0] += 1
+            stats[1] += seconds
+
+        stack = ";".join(names)
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + seconds
+
+
+def create_profiler(mode: str = "deterministic") -> Profiler:
+    """Create a profiler by mode name: deterministic or sampling"""
+    if mode == "sampling":
+        return SamplingProfiler()
+    return Profiler()
@@ -0,0 +1,127 @@
+"""
+Ge-ez Resolver
+Assigns the local variables of functions and methods fixed frame slots
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from .parser import (
+    ASTNode,
+    IdentifierNode,
+    AssignmentNode,
+    ForNode,
+    TryCatchNode,
+    FunctionNode,
+    ClassNode,
+    MethodNode,
+)
+
+# Names bound to the receiver inside methods and constructors
+SELF_NAMES = ("ራሱ", "የራሱ")
+
+# Value of a slot whose variable has not been assigned yet
+UNBOUND = object()
+
+
+def walk(statements: List[ASTNode]) -> List[ASTNode]:
+    """Collect the nodes of a block, not entering nested declarations"""
+    nodes = []
+    pending = list(statements)
+    while pending:
+        value = pending.pop()
+        if isinstance(value, ASTNode):
+            nodes.append(value)
+            if not isinstance(value, (FunctionNode, ClassNode)):
+                pending.extend(vars(value).values())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+    return nodes
+
+
+class Frame:
+    """Activation record of a call: local slots plus the enclosing scope
+
+    Locals live in a list indexed by the slots the resolver assigned. Names
+    that are not local (or not bound yet) are looked up in the enclosing
+    dictionary — the receiver for methods, the module for module functions —
+    and then in the globals.
+    """
+
+    __slots__ = ("names", "values", "enclosing")
+
+    def __init__(
+        self, names: Dict[str, int], enclosing: Optional[Dict[str, Any]] = None
+    ):
+        self.names = names
+        self.values: List[Any] = [UNBOUND] * len(names)
+        self.enclosing = enclosing
+
+
+class Resolver:
+    """Resolves function and method bodies into slot layouts
+
+    A layout maps each local name (parameters, assigned variables, loop and
+    catch variables) to its slot index. Identifier, assignment and for-loop
+    nodes that refer to a local are recorded so the engines can compile
+    them into direct slot accesses.
+    """
+
+    def __init__(self):
+        # id(node) -> (node, ...); the node is kept so its id stays unique
+        self._layouts: Dict[int, Tuple[ASTNode, Dict[str, int]]] = {}
+        self._slots: Dict[int, Tuple[ASTNode, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._layouts)
+
+    def clear(self) -> None:
+        """Drop all layouts"""
+        self._layouts.clear()
+        self._slots.clear()
+
+    def slot_of(self, node: ASTNode) -> Optional[int]:
+        """Slot of the local a node refers to, or None if it is not local"""
+        entry = self._slots.get(id(node))
+        return None if entry is None else entry[1]
+
+    def resolve(self, node: ASTNode) -> Dict[str, int]:
+        """Get the slot layout of a function or method, resolving it once"""
+        entry = self._layouts.get(id(node))
+        if entry is not None:
+            return entry[1]
+
+        names: Dict[str, int] = {}
+        if isinstance(node, MethodNode):
+            for name in SELF_NAMES:
+                names[name] = len(names)
+        for name in node.parameters:
+            names.setdefault(name, len(names))
+
+        body = walk(node.body)
+        for child in body:
+            for name in self._bound_names(child):
+                names.setdefault(name, len(names))
+
+        for child in body:
+            if isinstance(child, IdentifierNode):
+                name = child.name
+            elif isinstance(child, AssignmentNode):
+                name = child.identifier
+            elif isinstance(child, ForNode):
+                name = child.variable
+            else:
+                continue
+            if name in names:
+                self._slots[id(child)] = (child, names[name])
+
+        self._layouts[id(node)] = (node, names)
+        return names
+
+    def _bound_names(self, node: ASTNode) -> List[str]:
+        """Names a node binds in the enclosing function"""
+        if isinstance(node, AssignmentNode):
+            return [node.identifier]
+        if isinstance(node, ForNode):
+            return [node.variable]
+        if isinstance(node, TryCatchNode):
+            return [variable for _, variable, _ in node.catch_blocks if variable]
+        return []
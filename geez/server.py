@@ -0,0 +1,284 @@
+"""
+Ge-ez Server
+Runs programs for `geez run --client` in a warm process listening on a Unix socket
+
+The server imports the whole package, warms both backends up and loads
+the modules given with --preload once. Every request is run in a child
+forked from that warm process, so it starts with everything loaded, can
+change directory and read stdin on its own, and cannot take the server
+down with it.
+
+See geez.client for the protocol.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+from typing import Any, BinaryIO, Dict, List, Optional
+from .client import SOCKET_VARIABLE, default_socket_path, send_frame
+from .interpreter import GeEzInterpreter
+from .limits import Limits
+from .output import create_output
+from .vm import GeEzVM
+
+# Output is sent at each newline, or once this many characters are pending
+_FRAME_SIZE = 8192
+
+# Runs every statement kind the backends compile lazily
+WARM_UP_PROGRAM = """
+ተግባር ካሬ(x) {
+    ተመለስ x * x
+}
+ክፍል ነጥብ {
+    ዘዴ መጀመሪያ(ራሱ, x) {
+        ራሱ.x = x
+    }
+}
+አስተዋውቅ ድምር = 0
+ለ i በ ወሰን(3) {
+    ድምር = ድምር + ካሬ(i) + አዲስ ነጥብ(i).x
+}
+"""
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream sending what is written as JSON frames of one kind"""
+
+    def __init__(self, output: BinaryIO, kind: str):
+        self._output = output
+        self._kind = kind
+        self._pending: List[str] = []
+        self._size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self._pending.append(text)
+            self._size += len(text)
+            if "\n" in text or self._size >= _FRAME_SIZE:
+                self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if self._pending:
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._size = 0
+            send_frame(self._output, {self._kind: text})
+
+
+class _FrameReader(io.TextIOBase):
+    """Text stream asking the client for each line the program reads"""
+
+    def __init__(self, connection: BinaryIO, output: BinaryIO):
+        self._connection = connection
+        self._output = output
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self, size: int = -1) -> str:
+        sys.stdout.flush()
+        send_frame(self._output, {"read": True})
+        answer = self._connection.readline()
+        return json.loads(answer)["stdin"] if answer else ""
+
+    def read(self, size: int = -1) -> str:
+        return "".join(iter(self.readline, ""))
+
+
+class GeEzServer:
+    """Warm process that forks a child to run each request"""
+
+    def __init__(
+        self,
+        path: str,
+        preload: Optional[List[str]] = None,
+        max_jobs: Optional[int] = None,
+    ):
+        self.path = path
+        self.preload = preload or []
+        self.max_jobs = max_jobs or os.cpu_count() or 1
+        self._children: set = set()
+        self._socket: Optional[socket.socket] = None
+        # One ready interpreter per backend, inherited by every child
+        self._pool: Dict[str, GeEzInterpreter] = {}
+
+    def warm_up(self) -> None:
+        """Run a program on each backend and load the preloaded modules"""
+        with contextlib.redirect_stdout(io.StringIO()):
+            for backend in (GeEzInterpreter, GeEzVM):
+                backend().interpret(WARM_UP_PROGRAM)
+            loader = GeEzInterpreter()
+            for module_name in self.preload:
+                loader.load_module(module_name)
+        self._pool = {"interpreter": GeEzInterpreter(), "vm": GeEzVM()}
+
+    def serve_forever(self) -> None:
+        """Accept requests until interrupted"""
+        self._bind()
+        print(f"Ge-ez server listening on {self.path}", file=sys.stderr)
+        try:
+            while True:
+                connection, _ = self._socket.accept()
+                self._reap(block=len(self._children) >= self.max_jobs)
+                pid = os.fork()
+                if pid == 0:
+                    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                    self._socket.close()
+                    status = 1
+                    try:
+                        status = self.handle(connection)
+                    finally:
+                        os._exit(status)
+                connection.close()
+                self._children.add(pid)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Stop listening and remove the socket file"""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def _bind(self) -> None:
+        """Listen on the socket path, replacing a socket left by a dead server"""
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                os.unlink(self.path)
+            else:
+                raise OSError(f"a server is already listening on {self.path}")
+            finally:
+                probe.close()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.bind(self.path)
+        os.chmod(self.path, 0o600)
+        self._socket.listen()
+
+    def _reap(self, block: bool) -> None:
+        """Collect finished children, waiting for one when block is set"""
+        while self._children:
+            pid, _ = os.waitpid(-1, 0 if block else os.WNOHANG)
+            if pid == 0:
+                return
+            self._children.discard(pid)
+            block = False
+
+    def handle(self, connection: socket.socket) -> int:
+        """Run one request in this (forked) process; returns the exit status"""
+        output = connection.makefile("wb")
+        requests = connection.makefile("rb")
+        try:
+            request = json.loads(requests.readline())
+            status = self.run_request(request, requests, output)
+        except Exception as e:
+            send_frame(output, {"stderr": f"ስህተት: {e}\n"})
+            status = 1
+        send_frame(output, {"exit": status})
+        return status
+
+    def run_request(
+        self, request: Dict[str, Any], requests: BinaryIO, output: BinaryIO
+    ) -> int:
+        """Run the program of a request, sending its output as frames"""
+        if request.get("cwd"):
+            os.chdir(request["cwd"])
+        for name, value in request.get("env", {}).items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+        interpreter = self._pool.get(request.get("backend", "interpreter"))
+        if interpreter is None:
+            raise ValueError(f"Unknown backend: {request.get('backend')}")
+        interpreter.use_geezc_cache = not request.get("no_cache", False)
+        interpreter.use_optimizer = request.get("optimize", False)
+        interpreter.memoize = request.get("memoize", False)
+        interpreter.memo.maxsize = request.get("memo_size", 1024)
+        limits = Limits(
+            request.get("max_steps"), request.get("max_memory"), request.get("timeout")
+        )
+        if limits.counts_steps or limits.counts_memory:
+            interpreter.set_limits(limits)
+
+        sys.stdin = _FrameReader(requests, output)
+        sys.stdout = _FrameWriter(output, "stdout")
+        sys.stderr = _FrameWriter(output, "stderr")
+        interpreter.output = create_output(request.get("output"), request.get("flush"))
+        try:
+            path = request.get("path")
+            try:
+                if path is None:
+                    interpreter.interpret(request.get("source", ""))
+                else:
+                    with open(path, "r", encoding="utf-8") as f:
+                        code = f.read()
+                    interpreter.interpret(code, filename=path)
+            except FileNotFoundError:
+                print(f"ፋይል አልተገኘም: {path}")
+            except Exception as e:
+                print(f"ስህተት: {e}")
+        finally:
+            interpreter.output.close()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        return 0
+
+
+def serve_main(argv: List[str]) -> int:
+    """Entry point of `geez serve`"""
+    parser = argparse.ArgumentParser(
+        prog="geez serve", description="Run Ge-ez programs for `geez run --client`"
+    )
+    parser.add_argument(
+        "--socket",
+        default=default_socket_path(),
+        help=f"Unix socket to listen on (default: ${SOCKET_VARIABLE} or "
+        "geez-<uid>.sock in the temp directory)",
+    )
+    parser.add_argument(
+        "--preload",
+        nargs="+",
+        default=[],
+        metavar="MODULE",
+        help="Modules to load once for every program",
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Programs run at the same time (default: number of CPUs)",
+    )
+    args = parser.parse_args(argv)
+
+    if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+        print("geez serve needs Unix sockets and fork", file=sys.stderr)
+        return 1
+
+    server = GeEzServer(args.socket, args.preload, args.max_jobs)
+    # Leave through serve_forever's cleanup, which removes the socket file
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        server.warm_up()
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"geez serve: {e}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,664 @@
+"""
+Ge-ez Virtual Machine
+Executes bytecode produced by geez.compiler
+"""
+
+from sys import getsizeof
+from typing import Any, Dict, List, Optional, Tuple
+from .compiler import (
+    OPCODE_NAMES,
+    BytecodeCompiler,
+    CodeObject,
+    MethodCallSite,
+    retry_operation,
+    LOAD_CONST,
+    LOAD_NAME,
+    STORE_NAME,
+    POP_TOP,
+    DUP_TOP,
+    BINARY_FAST_CONST,
+    BINARY_OP,
+    BINARY_FAST_FAST,
+    BINARY_NAME_CONST,
+    BINARY_CONST,
+    BINARY_FAST,
+    BINARY_NAME,
+    BINARY_NAME_NAME,
+    UNARY_NEGATIVE,
+    UNARY_NOT,
+    POP_JUMP_IF_FALSE,
+    POP_JUMP_IF_TRUE,
+    GET_ITER,
+    FOR_ITER_FAST,
+    FOR_ITER_NAME,
+    RETURN_VALUE,
+    PRINT,
+    BUILD_LIST,
+    BUILD_TUPLE,
+    BUILD_SET,
+    BUILD_DICT,
+    INDEX,
+    DICT_ACCESS,
+    CALL_FUNCTION,
+    CALL_METHOD,
+    NEW_INSTANCE,
+    GET_PROPERTY,
+    SET_PROPERTY,
+    MAKE_FUNCTION,
+    MAKE_CLASS,
+    BUILTIN_FUNCTION,
+    STRING_METHOD,
+    FILE_OPERATION,
+    INPUT,
+    THROW,
+    SETUP_TRY,
+    POP_TRY,
+    MATCH_EXCEPTION,
+    STORE_EXCEPTION,
+    RERAISE,
+    RAISE_COMPLETION,
+    EVAL_NODE,
+    LOAD_FAST,
+    STORE_FAST,
+    LOAD_CONST_COPY,
+    LINE,
+    STEP,
+    CHARGE,
+    CHECK_DICT,
+    DICT_OPERATION,
+)
+from .errors import AmharicErrorMessages
+from .interpreter import (
+    BreakException,
+    ContinueException,
+    GeEzInterpreter,
+    ReturnException,
+)
+from .limits import SIZED_TYPES, Limits
+from .memo import MISSING, is_cacheable
+from .objects import GeEzObject
+from .output import OutputSink
+from .parser import ASTNode, FunctionNode, MethodNode
+from .resolver import Frame, SELF_NAMES, UNBOUND
+
+# Sentinel returned by next() when a for loop iterator is exhausted
+_EXHAUSTED = object()
+
+
+class _ScopeLookup(dict):
+    """Empty mapping that looks every name up with get_variable
+
+    run_code reads names from it in frames with an enclosing scope, so
+    they are found without a KeyError being raised first.
+    """
+
+    __slots__ = ("get_variable",)
+
+    def __init__(self, get_variable):
+        super().__init__()
+        self.get_variable = get_variable
+
+    def __missing__(self, name: str) -> Any:
+        return self.get_variable(name)
+
+
+class GeEzVM(GeEzInterpreter):
+    """Stack-based bytecode virtual machine for Ge-ez
+
+    A drop-in alternative backend to GeEzInterpreter: programs are compiled
+    to bytecode once and executed by a flat dispatch loop. Frames, classes,
+    modules and the value-level helpers are shared with the interpreter.
+    """
+
+    def __init__(
+        self, output: Optional[OutputSink] = None, limits: Optional[Limits] = None
+    ):
+        super().__init__(output, limits)
+        self.compiler = BytecodeCompiler(self.resolver)
+        self.compiler.count_steps = limits is not None and limits.counts_steps
+        self.compiler.count_memory = limits is not None and limits.counts_memory
+        # id(node) -> (node, code); the node is kept so its id stays unique
+        self._code_objects: Dict[int, Tuple[ASTNode, CodeObject]] = {}
+        self._scope_lookup = _ScopeLookup(self.get_variable)
+
+    def clear_cache(self) -> None:
+        """Clear all caches, including compiled function bodies"""
+        super().clear_cache()
+        self._code_objects.clear()
+
+    def run(self, ast: List[ASTNode]) -> Any:
+        """Compile parsed statements to bytecode and execute them"""
+        return self.run_code(self.compiler.compile_program(ast))
+
+    def code_for(self, node: ASTNode) -> CodeObject:
+        """Compiled code for a function/method body or a standalone expression"""
+        entry = self._code_objects.get(id(node))
+        if entry is not None:
+            return entry[1]
+        if isinstance(node, (FunctionNode, MethodNode)):
+            code = self.compiler.compile_function(node)
+        else:
+            code = self.compiler.compile_expression(node)
+        self._code_objects[id(node)] = (node, code)
+        return code
+
+    def set_profiler(self, profiler) -> None:
+        """Report calls and lines to a profiler; bytecode gets line events"""
+        self.compiler.line_events = profiler is not None
+        super().set_profiler(profiler)
+
+    def set_limits(self, limits: Optional[Limits]) -> None:
+        """Enforce resource limits; bytecode gets step and allocation counting"""
+        self.compiler.count_steps = limits is not None and limits.counts_steps
+        self.compiler.count_memory = limits is not None and limits.counts_memory
+        super().set_limits(limits)
+
+    def run_in_frame(
+        self, code: CodeObject, frame: Frame, name: Optional[str] = None
+    ) -> Any:
+        """Run code with frame as the current call frame, restoring it afterwards
+
+        A return from inside a try block ends the call with its value.
+        """
+        old_frame = self.enter_call(name or code.name, frame)
+        try:
+            return self.run_code(code)
+        except ReturnException as e:
+            return e.value
+        finally:
+            self.leave_call(old_frame)
+
+    def call_function(self, name: str, args: List[Any]) -> Any:
+        """Call a user-defined function with evaluated arguments"""
+        function = self.functions.get(name)
+        if function is None:
+            error_msg = AmharicErrorMessages.format_error_with_suggestion(
+                "undefined_function",
+                AmharicErrorMessages.get_interpreter_error(
+                    "undefined_function", function=name
+                ),
+                function=name,
+            )
+            raise RuntimeError(error_msg)
+
+        if len(args) != len(function.parameters):
+            error_msg = AmharicErrorMessages.get_interpreter_error(
+                "argument_count_mismatch",
+                function=name,
+                expected=len(function.parameters),
+                actual=len(args),
+            )
+            raise RuntimeError(error_msg)
+
+        key = self.memo_key_for(function, args) if self.memoize else None
+        if key is not None:
+            result = self.memo.get(key)
+            if result is not MISSING:
+                return result
+
+        code = self.code_for(function)
+        frame = Frame(code.layout)
+        for param, arg in zip(function.parameters, args):
+            frame.values[frame.names[param]] = arg
+        result = self.run_in_frame(code, frame)
+        if key is not None and is_cacheable(result):
+            self.memo.put(key, result)
+        return result
+
+    def call_method(
+        self,
+        object_value: Any,
+        method_name: str,
+        args: List[Any],
+        site: Optional[MethodCallSite] = None,
+    ) -> Any:
+        """Call a class method or module function with evaluated arguments"""
+        if type(object_value) is GeEzObject:
+            methods = object_value.shape.methods
+            if site is not None and site.methods is methods:
+                method = site.method
+            else:
+                method = self.find_method(object_value, method_name)
+                if site is not None:
+                    site.methods = methods
+                    site.method = method
+            code = self.code_for(method)
+            frame = Frame(code.layout, object_value)
+            for name in SELF_NAMES:
+                frame.values[frame.names[name]] = object_value
+            for param, arg in zip(method.parameters, args):
+                frame.values[frame.names[param]] = arg
+            if self.profiler is None:
+                return self.run_in_frame(code, frame)
+            return self.run_in_frame(
+                code, frame, f"{object_value.shape.class_name}.{method.name}"
+            )
+
+        if not isinstance(object_value, dict):
+            error_msg = AmharicErrorMessages.get_interpreter_error(
+                "type_error_method_call", type=type(object_value).__name__
+            )
+            raise TypeError(error_msg)
+
+        # Module function call: the module's names are visible from its frame
+        function_node = object_value.get(method_name)
+        if isinstance(function_node, FunctionNode):
+            code = self.code_for(function_node)
+            frame = Frame(code.layout, object_value)
+            for param, arg in zip(function_node.parameters, args):
+                frame.values[frame.names[param]] = arg
+            return self.run_in_frame(code, frame)
+
+        error_msg = AmharicErrorMessages.get_interpreter_error(
+            "invalid_object", object=type(object_value).__name__
+        )
+        raise RuntimeError(error_msg)
+
+    def new_instance(self, class_name: str, args: List[Any]) -> GeEzObject:
+        """Create an instance of a class with evaluated constructor arguments"""
+        table = self.class_tables.get(class_name)
+        if table is None:
+            error_msg = AmharicErrorMessages.get_interpreter_error(
+                "undefined_class", class_name=class_name
+            )
+            raise RuntimeError(error_msg)
+
+        instance = GeEzObject(table.shape)
+
+        for property_node in table.properties:
+            if property_node.initial_value:
+                value = self.run_code(self.code_for(property_node.initial_value))
+            else:
+                value = None
+            instance.set_property(property_node.name, value)
+
+        constructor = table.constructor
+        if constructor:
+            code = self.code_for(constructor)
+            frame = Frame(code.layout, instance)
+            for name in SELF_NAMES:
+                frame.values[frame.names[name]] = instance
+            # Self parameters are bound above, the rest take arguments in order
+            parameters = [p for p in constructor.parameters if p not in SELF_NAMES]
+            for param, arg in zip(parameters, args):
+                frame.values[frame.names[param]] = arg
+            self.run_in_frame(code, frame, f"{class_name}.{constructor.name}")
+
+        return instance
+
+    def run_code(self, code: CodeObject) -> Any:
+        """Execute a code object in the current frame and return its result"""
+        instructions = code.program
+        frame = self.frame
+        fast = frame.values if frame is not None else None
+        global_variables = self.variables
+        # Names of an enclosing receiver or module shadow the globals, so
+        # reads inside those frames go through get_variable
+        if frame is None or frame.enclosing is None:
+            variables = global_variables
+        else:
+            variables = self._scope_lookup
+
+        stack: List[Any] = []
+        push = stack.append
+        pop = stack.pop
+        handlers: List[Tuple[int, int]] = []  # (handler pc, stack depth)
+        pc = 0
+
+        while True:
+            try:
+                while True:
+                    opcode, arg, pc = instructions[pc]
+
+                    # The groups of hot instructions run inline, most
+                    # frequent first since each test costs time; the rest
+                    # go through _HANDLERS
+                    if opcode <= BINARY_NAME_NAME:
+                        operation, left, right, consumes = arg
+                        if opcode == BINARY_FAST_CONST:
+                            value = fast[left]
+                            if value is UNBOUND:
+                                value = self.get_variable(code.varnames[left])
+                            left = value
+                        elif opcode == BINARY_OP:
+                            right = pop()
+                            left = pop()
+                        elif opcode == BINARY_FAST_FAST:
+                            value = fast[left]
+                            if value is UNBOUND:
+                                value = self.get_variable(code.varnames[left])
+                            left = value
+                            value = fast[right]
+                            if value is UNBOUND:
+                                value = self.get_variable(code.varnames[right])
+                            right = value
+                        elif opcode == BINARY_NAME_CONST:
+                            try:
+                                left = variables[left]
+                            except KeyError:
+                                left = self.get_variable(left)
+                        elif opcode == BINARY_CONST:
+                            left = pop()
+                        elif opcode == BINARY_FAST:
+                            left = pop()
+                            value = fast[right]
+                            if value is UNBOUND:
+                                value = self.get_variable(code.varnames[right])
+                            right = value
+                        elif opcode == BINARY_NAME:
+                            left = pop()
+                            try:
+                                right = variables[right]
+                            except KeyError:
+                                right = self.get_variable(right)
+                        else:
+                            try:
+                                left = variables[left]
+                            except KeyError:
+                                left = self.get_variable(left)
+                            try:
+                                right = variables[right]
+                            except KeyError:
+                                right = self.get_variable(right)
+                        try:
+                            value = operation(left, right)
+                        except TypeError:
+                            value = retry_operation(operation, left, right)
+                        if consumes:
+                            # Carry out the store or jump that follows
+                            opcode, arg, pc = instructions[pc]
+                            if opcode == STORE_FAST:
+                                fast[arg] = value
+                            elif opcode == STORE_NAME:
+                                global_variables[arg] = value
+                            elif opcode == POP_JUMP_IF_FALSE:
+                                if not value:
+                                    pc = arg
+                            elif value:
+                                pc = arg
+                        else:
+                            push(value)
+                    elif opcode <= FOR_ITER_NAME:
+                        if opcode >= FOR_ITER_FAST:
+                            item = next(stack[-1], _EXHAUSTED)
+                            if item is _EXHAUSTED:
+                                pop()
+                            elif opcode == FOR_ITER_FAST:
+                                _, slot, pc = instructions[arg]
+                                fast[slot] = item
+                            else:
+                                _, name, pc = instructions[arg]
+                                global_variables[name] = item
+                        elif opcode == LOAD_FAST:
+                            value = fast[arg]
+                            if value is UNBOUND:
+                                # Not assigned yet: fall back to the enclosing scope
+                                value = self.get_variable(code.varnames[arg])
+                            push(value)
+                        elif opcode == LOAD_NAME:
+                            try:
+                                push(variables[arg])
+                            except KeyError:
+                                # Enclosing scope, or the Amharic error
+                                push(self.get_variable(arg))
+                        elif opcode == LOAD_CONST:
+                            push(arg)
+                        elif opcode == STORE_FAST:
+                            fast[arg] = pop()
+                        elif opcode == STORE_NAME:
+                            global_variables[arg] = pop()
+                        elif opcode == POP_JUMP_IF_FALSE:
+                            if not pop():
+                                pc = arg
+                        elif opcode == POP_JUMP_IF_TRUE:
+                            if pop():
+                                pc = arg
+                        else:
+                            pc = arg
+                    elif opcode <= POP_TRY:
+                        if opcode == POP_TOP:
+                            pop()
+                        elif opcode == CALL_FUNCTION:
+                            name, count = arg
+                            args = stack[len(stack) - count :]
+                            del stack[len(stack) - count :]
+                            push(self.call_function(name, args))
+                        elif opcode == RETURN_VALUE:
+                            return pop()
+                        elif opcode == CALL_METHOD:
+                            count = arg.count
+                            args = stack[len(stack) - count :]
+                            del stack[len(stack) - count :]
+                            stack[-1] = self.call_method(stack[-1], arg.name, args, arg)
+                        elif opcode == GET_PROPERTY:
+                            stack[-1] = self.property_value(stack[-1], arg)
+                        elif opcode == DICT_ACCESS:
+                            key = pop()
+                            stack[-1] = self.dict_access(stack[-1], key)
+                        elif opcode == INDEX:
+                            index = pop()
+                            stack[-1] = self.index_value(stack[-1], index)
+                        elif opcode == STEP:
+                            governor = self.governor
+                            governor.countdown -= 1
+                            if governor.countdown < 0:
+                                governor.check()
+                        elif opcode == SETUP_TRY:
+                            handlers.append((arg, len(stack)))
+                        else:
+                            handlers.pop()
+                    else:
+                        _HANDLERS[opcode](self, stack, arg)
+
+            except Exception as e:
+                if not handlers:
+                    raise
+                pc, depth = handlers.pop()
+                del stack[depth:]
+                push(e)
+
+
+# Handlers of the instructions run_code does not run inline. Each takes
+# the VM, the stack of the running code and the decoded argument.
+
+
+def _dup_top(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    stack.append(stack[-1])
+
+
+def _load_const_copy(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    factory, elements = arg
+    stack.append(factory(elements))
+
+
+def _charge(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    if type(stack[-1]) in SIZED_TYPES:
+        governor = vm.governor
+        governor.memory += getsizeof(stack[-1])
+        if governor.memory > governor.memory_limit:
+            governor.check_memory()
+
+
+def _get_iter(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    stack[-1] = vm.iterate(stack[-1])
+
+
+def _unary_negative(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    stack[-1] = -stack[-1]
+
+
+def _unary_not(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    stack[-1] = not stack[-1]
+
+
+def _print(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    vm.output.print(stack.pop())
+
+
+def _set_property(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    value = stack.pop()
+    object_value = stack.pop()
+    if isinstance(object_value, (dict, GeEzObject)):
+        vm.store_entry(object_value, arg, value)
+    else:
+        error_msg = AmharicErrorMessages.get_interpreter_error(
+            "type_error_property_access",
+            type=type(object_value).__name__,
+        )
+        raise TypeError(error_msg)
+    stack.append(value)
+
+
+def _new_instance(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    name, count = arg
+    args = stack[len(stack) - count :]
+    del stack[len(stack) - count :]
+    stack.append(vm.new_instance(name, args))
+
+
+def _build_list(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    items = stack[len(stack) - arg :]
+    del stack[len(stack) - arg :]
+    stack.append(items)
+
+
+def _build_tuple(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    items = tuple(stack[len(stack) - arg :])
+    del stack[len(stack) - arg :]
+    stack.append(items)
+
+
+def _build_set(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    items = set(stack[len(stack) - arg :])
+    del stack[len(stack) - arg :]
+    stack.append(items)
+
+
+def _build_dict(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    items = stack[len(stack) - 2 * arg :]
+    del stack[len(stack) - 2 * arg :]
+    stack.append(dict(zip(items[::2], items[1::2])))
+
+
+def _builtin_function(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    function, count = arg
+    args = stack[len(stack) - count :]
+    del stack[len(stack) - count :]
+    stack.append(vm.builtin_function(function, args))
+
+
+def _string_method(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    method, count = arg
+    args = stack[len(stack) - count :]
+    del stack[len(stack) - count :]
+    stack[-1] = vm.string_method(method, stack[-1], args)
+
+
+def _file_operation(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    operation, has_content = arg
+    content = stack.pop() if has_content else None
+    filename = stack.pop()
+    try:
+        stack.append(vm.file_operation(operation, filename, content, has_content))
+    except Exception as e:
+        raise RuntimeError(f"File operation failed: {str(e)}")
+
+
+def _make_function(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    vm.declare_function(arg)
+
+
+def _make_class(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    vm.declare_class(arg)
+
+
+def _input(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    stack.append(vm.read_input(stack.pop()) if arg else vm.read_input())
+
+
+def _throw(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    raise Exception(str(stack.pop()))
+
+
+def _match_exception(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    exception_type = arg
+    raised_type = type(stack[-1]).__name__
+    stack.append(
+        exception_type is None
+        or exception_type == "Exception"
+        or exception_type == "RuntimeError"
+        or exception_type == raised_type
+    )
+
+
+def _store_exception(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    vm.set_variable(arg, str(stack.pop()))
+
+
+def _reraise(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    raise stack.pop()
+
+
+def _raise_completion(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    if arg == 2:
+        raise ReturnException(stack.pop())
+    raise (BreakException, ContinueException)[arg]()
+
+
+def _eval_node(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    stack.append(vm.execute(arg))
+    if vm.completion is not None:
+        # A break or continue outside a loop
+        vm.raise_completion()
+
+
+def _check_dict(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    vm.check_dict_operand(stack[-2])
+
+
+def _dict_operation(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    value = stack.pop() if arg == "ADD" else None
+    key = stack.pop()
+    stack[-1] = vm.dict_operation(arg, stack[-1], key, value)
+
+
+def _line(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    vm.profiler.line(arg)
+
+
+def _unknown_opcode(vm: GeEzVM, stack: List[Any], arg: Any) -> None:
+    raise RuntimeError("Unknown opcode")
+
+
+_HANDLERS = [_unknown_opcode] * (max(OPCODE_NAMES) + 1)
+for _opcode, _handler in {
+    DUP_TOP: _dup_top,
+    LOAD_CONST_COPY: _load_const_copy,
+    CHARGE: _charge,
+    GET_ITER: _get_iter,
+    UNARY_NEGATIVE: _unary_negative,
+    UNARY_NOT: _unary_not,
+    PRINT: _print,
+    SET_PROPERTY: _set_property,
+    NEW_INSTANCE: _new_instance,
+    BUILD_LIST: _build_list,
+    BUILD_TUPLE: _build_tuple,
+    BUILD_SET: _build_set,
+    BUILD_DICT: _build_dict,
+    BUILTIN_FUNCTION: _builtin_function,
+    STRING_METHOD: _string_method,
+    FILE_OPERATION: _file_operation,
+    MAKE_FUNCTION: _make_function,
+    MAKE_CLASS: _make_class,
+    INPUT: _input,
+    THROW: _throw,
+    MATCH_EXCEPTION: _match_exception,
+    STORE_EXCEPTION: _store_exception,
+    RERAISE: _reraise,
+    RAISE_COMPLETION: _raise_completion,
+    EVAL_NODE: _eval_node,
+    CHECK_DICT: _check_dict,
+    DICT_OPERATION: _dict_operation,
+    LINE: _line,
+}.items():
+    _HANDLERS[_opcode] = _handler
@@ -0,0 +1,192 @@
+"""The bytecode VM must print exactly what the interpreter prints"""
+
+import pytest
+
+from geez.interpreter import GeEzInterpreter
+from geez.output import MemorySink
+from geez.vm import GeEzVM
+
+PROGRAMS = {
+    "return_in_try": """
+ተግባር ረ() {
+    ሞክር {
+        ተመለስ 2
+    } ያዝ ("Exception", e) {
+        ማተም "caught return"
+    } በመጨረሻ {
+        ማተም "finally"
+    }
+    ተመለስ 99
+}
+ማተም ረ()
+""",
+    "break_in_try": """
+አስተዋውቅ i = 0
+በመሆኑ i < 4 {
+    i = i + 1
+    ሞክር {
+        ከሆነ i == 1 {
+            ተሰብር
+        }
+    } ያዝ ("Exception", e) {
+        ማተም "caught break"
+    }
+    ማተም i
+}
+""",
+    "uncaught_break_and_continue": """
+ለ x በ 4 {
+    ሞክር {
+        ከሆነ x == 1 {
+            ቀጥል
+        }
+        ከሆነ x == 3 {
+            ተሰብር
+        }
+        ማተም x
+    } ያዝ ("ValueError", e) {
+        ማተም "value"
+    } በመጨረሻ {
+        ማተም "finally"
+    }
+}
+ማተም "done"
+""",
+    "return_through_nested_try": """
+ተግባር ሰ(n) {
+    ለ i በ n {
+        ሞክር {
+            ሞክር {
+                ከሆነ i == 2 {
+                    ተመለስ i * 10
+                }
+            } በመጨረሻ {
+                ማተም "inner"
+            }
+        } ያዝ ("ReturnException", e) {
+            ማተም "outer caught " + e
+        }
+    }
+    ተመለስ -1
+}
+ማተም ሰ(5)
+""",
+    "continue_in_finally": """
+አስተዋውቅ j = 0
+በመሆኑ j < 3 {
+    j = j + 1
+    ሞክር {
+        ማተም j
+    } ያዝ {
+        ማተም "never"
+    } በመጨረሻ {
+        ከሆነ j == 2 {
+            ቀጥል
+        }
+        ማተም "after"
+    }
+}
+""",
+    "return_outside_function": """
+ማተም "a"
+ተመለስ 3
+ማተም "b"
+""",
+    "plain_loops_and_calls": """
+ተግባር ፊ(n) {
+    ከሆነ n < 2 {
+        ተመለስ n
+    }
+    ተመለስ ፊ(n - 1) + ፊ(n - 2)
+}
+ለ k በ 6 {
+    ከሆነ k == 4 {
+        ተሰብር
+    }
+    ማተም ፊ(k + 5)
+}
+""",
+    "return_in_method": """
+ክፍል ቆጣሪ {
+    ዘዴ መጀመሪያ(መነሻ) {
+        ራሱ.እሴት = መነሻ
+        ተመለስ 0
+    }
+    ዘዴ ቀጣይ(x) {
+        ተመለስ x + ራሱ.እሴት
+        ማተም "never"
+    }
+}
+አስተዋውቅ o = አዲስ ቆጣሪ(1)
+ማተም o.ቀጣይ(1)
+ማተም o.ቀጣይ(o.ቀጣይ(2))
+ማተም "after"
+""",
+    "return_in_module_function": """
+አመጣ መሣሪያ
+ማተም መሣሪያ.ድርብ(4)
+ማተም መሣሪያ.መጀመሪያ_ትልቅ(3)
+ማተም "after"
+""",
+}
+
+# Modules the programs import, written to the working directory
+MODULES = {
+    "መሣሪያ": """
+አስተዋውቅ ወሰን_እሴት = 2
+ተግባር ድርብ(x) {
+    ተመለስ x * ወሰን_እሴት
+    ማተም "never"
+}
+ተግባር መጀመሪያ_ትልቅ(n) {
+    ለ i በ n {
+        ሞክር {
+            ከሆነ i > 0 {
+                ተመለስ i * 10
+            }
+        } ያዝ ("ValueError", e) {
+            ማተም "value"
+        }
+    }
+    ተመለስ -1
+}
+""",
+}
+
+
+@pytest.fixture(autouse=True)
+def modules(tmp_path, monkeypatch):
+    for name, source in MODULES.items():
+        (tmp_path / f"{name}.geez").write_text(source, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+
+def run(backend, source):
+    output = MemorySink()
+    backend(output).interpret(source)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize("name", sorted(PROGRAMS))
+def test_vm_matches_interpreter(name):
+    source = PROGRAMS[name]
+    assert run(GeEzVM, source) == run(GeEzInterpreter, source)
+
+
+def test_return_in_method_and_module_function():
+    for backend in (GeEzInterpreter, GeEzVM):
+        assert run(backend, PROGRAMS["return_in_method"]).split("\n")[:3] == [
+            "2.0",
+            "4.0",
+            "after",
+        ]
+        assert run(backend, PROGRAMS["return_in_module_function"]).split("\n")[:3] == [
+            "8.0",
+            "10.0",
+            "after",
+        ]
+
+
+def test_return_in_try_is_caught():
+    output = run(GeEzVM, PROGRAMS["return_in_try"])
+    assert output.split("\n")[:3] == ["caught return", "finally", "99.0"]
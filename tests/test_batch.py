@@ -0,0 +1,24 @@
+"""geez batch runs each program as if it were the only one"""
+
+from geez.batch import run_batch
+
+OPTIONS = {"backend": "interpreter", "no_cache": True}
+
+
+def test_programs_importing_a_module_each_run_it(tmp_path, monkeypatch):
+    (tmp_path / "ጋራ.geez").write_text(
+        'ማተም "module loaded"\nአስተዋውቅ ቁጥር = 1\n', encoding="utf-8"
+    )
+    programs = []
+    for name in ("p1", "p2", "p3"):
+        path = tmp_path / f"{name}.geez"
+        path.write_text("አመጣ ጋራ\nማተም ጋራ.ቁጥር\n", encoding="utf-8")
+        programs.append(str(path))
+    monkeypatch.chdir(tmp_path)
+
+    # One worker runs every program, after the module was loaded once
+    results = run_batch(programs, OPTIONS, jobs=1)
+
+    assert [result["status"] for result in results] == [0, 0, 0]
+    for result in results:
+        assert result["stdout"] == "module loaded\n1.0\n"
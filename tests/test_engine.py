@@ -0,0 +1,46 @@
+"""Closures compiled for a program are released once it has run"""
+
+from geez.interpreter import GeEzInterpreter
+from geez.output import MemorySink
+
+FUNCTION = """
+ተግባር ድርብ(x) {
+    ተመለስ x * 2
+}
+"""
+
+
+def test_top_level_closures_are_released():
+    interpreter = GeEzInterpreter(MemorySink())
+    interpreter.run_source("""
+አስተዋውቅ ድምር = 0
+ለ i በ 10 {
+    ድምር = ድምር + i
+}
+ማተም ድምር
+""")
+    assert len(interpreter._engine) == 0
+
+
+def test_defined_functions_stay_compiled():
+    interpreter = GeEzInterpreter(MemorySink())
+    interpreter.run_source(FUNCTION + "ማተም ድርብ(2)\n")
+    compiled = len(interpreter._engine)
+    assert compiled > 0
+
+    # A later program of the same interpreter still calls it
+    interpreter.run_source("ማተም ድርብ(3)\n")
+    interpreter.output.flush()
+    assert interpreter.output.getvalue() == "4.0\n6.0\n"
+    assert len(interpreter._engine) == compiled
+
+
+def test_replaced_functions_are_released():
+    interpreter = GeEzInterpreter(MemorySink())
+    interpreter.run_source(FUNCTION + "ማተም ድርብ(2)\n")
+    compiled = len(interpreter._engine)
+
+    # The first program's body is dropped once the second replaces it
+    interpreter.run_source(FUNCTION + "ማተም ድርብ(2)\n")
+    interpreter.run_source("ማተም 1\n")
+    assert len(interpreter._engine) == compiled
@@ -0,0 +1,94 @@
+"""Lazy file results behave like the strings and lists they replace"""
+
+import os
+
+import pytest
+
+from geez.files import DirectoryListing, FileChunks, FileLines, MappedFile
+
+
+@pytest.fixture
+def write(tmp_path):
+    def write(content, name="data.txt"):
+        path = tmp_path / name
+        path.write_bytes(content.encode("utf-8"))
+        return str(path)
+
+    return write
+
+
+@pytest.mark.parametrize(
+    "content, lines",
+    [
+        ("", []),
+        ("ሀ\nለ\n", ["ሀ", "ለ"]),
+        # The last line needs no newline
+        ("ሀ\nለ", ["ሀ", "ለ"]),
+        ("ሀ\r\nለ\r\n", ["ሀ", "ለ"]),
+        ("ሀ\r\n\r\nለ", ["ሀ", "", "ለ"]),
+    ],
+)
+def test_lines(write, content, lines):
+    path = write(content)
+    assert list(FileLines(path)) == lines
+    assert list(MappedFile(path)) == lines
+
+
+def test_empty_mapped_file(write):
+    mapped = MappedFile(write(""))
+    assert len(mapped) == 0
+    assert mapped.text() == ""
+    assert mapped[0:10] == ""
+    assert "ሀ" not in mapped
+    assert mapped + "ሀ" == "ሀ"
+    assert repr(mapped) == "''"
+
+
+def test_mapped_file_is_read_by_byte_range(write):
+    mapped = MappedFile(write("ሀለ\nሐ"))
+    assert len(mapped) == 10
+    assert mapped.text(3, 3) == "ለ"
+    assert mapped[:6] == "ሀለ"
+    assert "ለ\nሐ" in mapped
+    assert "ሀ" + mapped == "ሀሀለ\nሐ"
+    with pytest.raises(TypeError):
+        mapped[0]
+
+
+def test_chunks(write):
+    path = write("ሀለሐመ")
+    assert list(FileChunks(path, 3)) == ["ሀለሐ", "መ"]
+    assert list(FileChunks(path, 1)) == ["ሀ", "ለ", "ሐ", "መ"]
+    assert list(FileChunks(write("", "empty.txt"), 3)) == []
+
+
+@pytest.mark.parametrize("block_size", [0, -1])
+def test_chunks_need_a_positive_block_size(write, block_size):
+    with pytest.raises(ValueError):
+        FileChunks(write("ሀ"), block_size)
+
+
+def test_missing_files_fail_when_opened(tmp_path):
+    missing = str(tmp_path / "missing.txt")
+    for result in (FileLines, FileChunks, MappedFile):
+        with pytest.raises(FileNotFoundError):
+            result(missing)
+
+
+def test_directory_listing(tmp_path, write):
+    for name in ("ሀ.txt", "ለ.txt"):
+        write("", name)
+    listing = DirectoryListing(str(tmp_path))
+    names = os.listdir(tmp_path)
+
+    assert sorted(listing) == sorted(names)
+    assert listing == names
+    assert listing == DirectoryListing(str(tmp_path))
+    assert listing != names[:1]
+    assert listing != "ሀ.txt"
+    assert len(listing) == 2 and "ሀ.txt" in listing
+    assert listing + ["x"] == names + ["x"]
+    assert ["x"] + listing == ["x"] + names
+    assert listing + listing == names + names
+    with pytest.raises(TypeError):
+        hash(listing)
@@ -0,0 +1,90 @@
+"""The lexer gives the same tokens however its input is split into chunks"""
+
+import io
+
+import pytest
+
+from geez.lexer import GeEzLexer
+
+SOURCES = {
+    "string": 'አስተዋውቅ ስም = "ሰላም ዓለም"\nማተም ስም\n',
+    "comment": "አስተዋውቅ x = 1 /* ረጅም\nአስተያየት */ ማተም x\n",
+    "geez_identifier": "አስተዋውቅ ረጅምስም = 2\nማተም ረጅምስም + 3\n",
+}
+
+
+def scan(tokens):
+    return [(token.type, token.value, token.line, token.column) for token in tokens]
+
+
+def whole(source):
+    return scan(GeEzLexer().tokenize(source))
+
+
+@pytest.mark.parametrize("name", SOURCES)
+def test_text_chunks_split_anywhere(name):
+    source = SOURCES[name]
+    expected = whole(source)
+    for cut in range(1, len(source)):
+        chunks = [source[:cut], source[cut:]]
+        assert scan(GeEzLexer().iter_tokens(chunks)) == expected, cut
+
+
+@pytest.mark.parametrize("name", SOURCES)
+def test_byte_chunks_split_inside_characters(name):
+    source = SOURCES[name]
+    expected = whole(source)
+    data = source.encode("utf-8")
+    for cut in range(1, len(data)):
+        chunks = [data[:cut], data[cut:]]
+        assert scan(GeEzLexer().iter_tokens(chunks)) == expected, cut
+
+
+@pytest.mark.parametrize("name", SOURCES)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+def test_small_file_reads(name, chunk_size):
+    source = SOURCES[name]
+    expected = whole(source)
+    text = GeEzLexer().iter_tokens(io.StringIO(source), chunk_size=chunk_size)
+    assert scan(text) == expected
+    data = io.BytesIO(source.encode("utf-8"))
+    assert scan(GeEzLexer().iter_tokens(data, chunk_size=chunk_size)) == expected
+
+
+def test_string_longer_than_a_chunk():
+    source = 'ማተም "' + "ሀ" * 100 + '"\n'
+    tokens = scan(GeEzLexer().iter_tokens(io.StringIO(source), chunk_size=4))
+    assert tokens == whole(source)
+    assert tokens[1][:2] == ("STRING", '"' + "ሀ" * 100 + '"')
+
+
+def test_unclosed_comment_is_not_split():
+    # The first chunk ends right after "/" so the "*" decides the token
+    chunks = ["ማተም 1 /", "* ማተም 2 */ ማተም 3\n"]
+    assert scan(GeEzLexer().iter_tokens(chunks)) == whole("".join(chunks))
+
+
+@pytest.mark.parametrize("name", SOURCES)
+def test_token_buffer_round_trips(name):
+    source = SOURCES[name]
+    tokens = GeEzLexer().tokenize_buffer(source)
+    assert len(tokens) == len(whole(source))
+    assert scan(tokens) == whole(source)
+    for index, token in enumerate(tokens):
+        assert tokens.type(index) == token.type
+        assert tokens.value(index) == token.value
+        assert source[tokens.starts[index] : tokens.ends[index]] == token.value
+
+
+def test_token_buffer_offsets_are_in_the_whole_text():
+    source = "ማተም " + "ሀ" * 10 + "\nማተም 1\n"
+    tokens = GeEzLexer().tokenize_buffer(source)
+    assert tokens.value(1) == "ሀ" * 10
+    assert (tokens.starts[1], tokens.ends[1]) == (4, 14)
+    assert (tokens.starts[3], tokens.ends[3]) == (19, 20)
+
+
+def test_token_buffer_holds_offsets_past_4_gb():
+    tokens = GeEzLexer().tokenize_buffer("")
+    tokens.append(0, 2**33, 2**33 + 5, 1, 1)
+    assert (tokens.starts[0], tokens.ends[0]) == (2**33, 2**33 + 5)
@@ -0,0 +1,124 @@
+"""Step budget, memory ceiling and timeout on both backends"""
+
+import time
+
+import pytest
+
+from geez.interpreter import GeEzInterpreter
+from geez.limits import GRACE_STEPS, Limits, ResourceLimitError
+from geez.output import MemorySink
+from geez.vm import GeEzVM
+
+BACKENDS = [GeEzInterpreter, GeEzVM]
+
+ENDLESS_LOOP = """
+አስተዋውቅ i = 0
+በመሆኑ i < 1 {
+    i = i * 1
+}
+"""
+
+
+def run(backend, source, limits):
+    output = MemorySink()
+    interpreter = backend(output, limits)
+    try:
+        interpreter.run_source(source)
+    finally:
+        output.flush()
+    return interpreter, output.getvalue()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_step_limit_stops_an_endless_loop(backend):
+    with pytest.raises(ResourceLimitError):
+        run(backend, ENDLESS_LOOP, Limits(max_steps=5000))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_program_within_the_step_limit_runs(backend):
+    source = """
+ለ i በ ወሰን(10) {
+    ማተም i
+}
+"""
+    _, output = run(backend, source, Limits(max_steps=100))
+    assert output.split() == [str(i) for i in range(10)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_grace_steps_after_the_first_limit_error(backend):
+    # The program catches the error and gets GRACE_STEPS more steps
+    source = "ሞክር {" + ENDLESS_LOOP + """} ያዝ ("Exception", e) {
+    ማተም "caught"
+}
+""" + ENDLESS_LOOP
+    interpreter = backend(MemorySink(), Limits(max_steps=2000))
+    with pytest.raises(ResourceLimitError):
+        interpreter.run_source(source)
+    interpreter.output.flush()
+    assert interpreter.output.getvalue() == "caught\n"
+    steps = interpreter.governor.steps_used
+    assert 2000 + GRACE_STEPS <= steps <= 2000 + GRACE_STEPS + 2
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_memory_limit_counts_created_values(backend):
+    source = """
+አስተዋውቅ ጽሁፍ = ""
+ለ i በ ወሰን(100000) {
+    ጽሁፍ = ጽሁፍ + "ሀሀሀሀሀሀሀሀሀሀ"
+}
+"""
+    with pytest.raises(ResourceLimitError):
+        run(backend, source, Limits(max_memory=100000))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_memory_limit_counts_dictionary_growth(backend):
+    source = """
+አስተዋውቅ መዝገብ = {"a": 0}
+ለ i በ ወሰን(100000) {
+    ጨምር_ወደ መዝገብ i i
+}
+"""
+    with pytest.raises(ResourceLimitError):
+        run(backend, source, Limits(max_memory=100000))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_memory_limit_counts_object_growth(backend):
+    source = """
+ክፍል ቦርሳ {
+    ዘዴ አክል(ስም, እሴት) {
+        ጨምር_ወደ ራሱ ስም እሴት
+    }
+}
+አስተዋውቅ ቦ = አዲስ ቦርሳ()
+ለ i በ ወሰን(5000) {
+    ቦ.አክል(i, i)
+}
+"""
+    with pytest.raises(ResourceLimitError):
+        run(backend, source, Limits(max_memory=10000))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_overwriting_entries_is_not_charged(backend):
+    source = """
+አስተዋውቅ መዝገብ = {"a": 0}
+ለ i በ ወሰን(100000) {
+    ጨምር_ወደ መዝገብ "a" i
+}
+ማተም መዝገብ
+"""
+    _, output = run(backend, source, Limits(max_memory=100000))
+    assert output == "{'a': 99999}\n"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_timeout_stops_an_endless_loop(backend):
+    start = time.monotonic()
+    with pytest.raises(ResourceLimitError):
+        run(backend, ENDLESS_LOOP, Limits(timeout=0.2))
+    assert time.monotonic() - start < 5
@@ -0,0 +1,97 @@
+"""Only functions whose results depend on their arguments alone are memoized"""
+
+import pytest
+
+from geez.interpreter import GeEzInterpreter
+from geez.output import MemorySink
+from geez.vm import GeEzVM
+
+BACKENDS = [GeEzInterpreter, GeEzVM]
+
+PROGRAM = """
+ተግባር ካሬ(n) {
+    አስተዋውቅ m = n * n
+    ተመለስ m
+}
+ተግባር ድምር(n) {
+    ተመለስ ካሬ(n) + ካሬ(n + 1)
+}
+አስተዋውቅ g = 1
+ተግባር ጨምሮ(n) {
+    ተመለስ n + g
+}
+ተግባር ጮኽ(n) {
+    ማተም "called"
+    ተመለስ n
+}
+ተግባር ጥሪ(n) {
+    ተመለስ ጮኽ(n)
+}
+"""
+
+CALLS = """
+ማተም ካሬ(3)
+ማተም ካሬ(3)
+ማተም ድምር(3)
+ማተም ጨምሮ(1)
+g = 10
+ማተም ጨምሮ(1)
+ማተም ጮኽ(5)
+ማተም ጮኽ(5)
+ማተም ጥሪ(5)
+"""
+
+
+def run(backend, source):
+    output = MemorySink()
+    interpreter = backend(output)
+    interpreter.memoize = True
+    interpreter.run_source(source)
+    output.flush()
+    return interpreter, output.getvalue()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_purity(backend):
+    interpreter, _ = run(backend, PROGRAM)
+    pure = {
+        name: interpreter.is_pure_function(function)
+        for name, function in interpreter.functions.items()
+    }
+    assert pure == {
+        "ካሬ": True,
+        "ድምር": True,
+        # Reads a global
+        "ጨምሮ": False,
+        # Prints, directly or through a call
+        "ጮኽ": False,
+        "ጥሪ": False,
+    }
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_pure_calls_are_cached(backend):
+    interpreter, stdout = run(backend, PROGRAM + CALLS)
+    assert stdout == (
+        "9.0\n9.0\n25.0\n2.0\n11.0\ncalled\n5.0\ncalled\n5.0\ncalled\n5.0\n"
+    )
+    # ካሬ(3), ድምር(3) and ካሬ(4) run once; the second ካሬ(3) and the one inside
+    # ድምር(3) are found in the cache
+    assert interpreter.memo.hits == 2
+    assert interpreter.memo.misses == 3
+    assert len(interpreter.memo) == 3
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_redefining_a_function_drops_its_results(backend):
+    interpreter, stdout = run(
+        backend,
+        PROGRAM + """
+ማተም ካሬ(3)
+ተግባር ካሬ(n) {
+    ተመለስ n + n
+}
+ማተም ካሬ(3)
+""",
+    )
+    assert stdout == "9.0\n6.0\n"
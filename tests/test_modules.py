@@ -0,0 +1,79 @@
+"""Modules are found on GEEZPATH and loaded once per process"""
+
+import os
+
+import pytest
+
+from geez.interpreter import GeEzInterpreter
+from geez.modules import find_module, module_index, module_registry, search_path
+from geez.output import MemorySink
+from geez.vm import GeEzVM
+
+BACKENDS = [GeEzInterpreter, GeEzVM]
+
+MODULE = 'ማተም "module loaded"\nአስተዋውቅ ቁጥር = 1\n'
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    """Empty working directory and two library directories on GEEZPATH"""
+    paths = [tmp_path / name for name in ("work", "lib1", "lib2")]
+    for path in paths:
+        path.mkdir()
+    monkeypatch.chdir(paths[0])
+    monkeypatch.setenv("GEEZPATH", os.pathsep.join(["", str(paths[1]), str(paths[2])]))
+    module_index.clear()
+    module_registry.clear()
+    yield paths
+    module_index.clear()
+    module_registry.clear()
+
+
+def run(backend, source):
+    output = MemorySink()
+    backend(output).run_source(source)
+    output.flush()
+    return output.getvalue()
+
+
+def test_search_path(dirs):
+    work, lib1, lib2 = dirs
+    os.environ["GEEZPATH"] += os.pathsep + str(lib1)
+    # Empty entries and repeated directories are skipped
+    assert search_path() == [str(work), str(lib1), str(lib2)]
+
+
+def test_first_directory_wins(dirs):
+    work, lib1, lib2 = dirs
+    assert find_module("ጋራ") is None
+    (lib2 / "ጋራ.geez").write_text(MODULE, encoding="utf-8")
+    assert find_module("ጋራ") == str(lib2 / "ጋራ.geez")
+    (lib1 / "ጋራ.geez").write_text(MODULE, encoding="utf-8")
+    assert find_module("ጋራ") == str(lib1 / "ጋራ.geez")
+    (work / "ጋራ.geez").write_text(MODULE, encoding="utf-8")
+    assert find_module("ጋራ") == str(work / "ጋራ.geez")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_loaded_module_is_shared(dirs, backend):
+    module = dirs[1] / "ጋራ.geez"
+    module.write_text(MODULE, encoding="utf-8")
+    program = "አመጣ ጋራ\nማተም ጋራ.ቁጥር\n"
+    # The counters are process-wide and survive clear()
+    hits, misses = module_registry.hits, module_registry.misses
+
+    assert run(backend, program) == "module loaded\n1.0\n"
+    # Another interpreter reuses the module without running it again
+    assert run(backend, program) == "1.0\n"
+    assert (module_registry.hits - hits, module_registry.misses - misses) == (1, 1)
+    assert len(module_registry) == 1
+
+    # A changed file is loaded again
+    module.write_text(MODULE.replace("1", "22"), encoding="utf-8")
+    assert run(backend, program) == "module loaded\n22.0\n"
+    assert (module_registry.hits - hits, module_registry.misses - misses) == (1, 2)
+
+
+def test_missing_module(dirs):
+    with pytest.raises(ImportError):
+        GeEzInterpreter(MemorySink()).run_source("አመጣ የለም\n")
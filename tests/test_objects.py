@@ -0,0 +1,106 @@
+"""Class instances share shapes and find inherited methods in one lookup"""
+
+import pytest
+
+from geez.interpreter import GeEzInterpreter
+from geez.objects import UNSET, GeEzObject, Shape
+from geez.output import MemorySink
+from geez.vm import GeEzVM
+
+BACKENDS = [GeEzInterpreter, GeEzVM]
+
+PROGRAM = """
+ክፍል ሰው {
+    ባህሪ ዓይነት = "ሰው"
+    ዘዴ መጀመሪያ(ራሱ, ስም) {
+        ራሱ.ስም = ስም
+    }
+    ዘዴ ሰላምታ() {
+        ተመለስ "ሰላም " + ራሱ.ስም
+    }
+    ዘዴ ዓይነቱ() {
+        ተመለስ ራሱ.ዓይነት
+    }
+}
+ክፍል ተማሪ ተወላጅ ሰው {
+    ዘዴ አዘጋጅ(ቁ) {
+        ራሱ.ደረጃ = ቁ
+    }
+    ዘዴ ሰላምታ() {
+        ተመለስ "ተማሪ " + ራሱ.ስም
+    }
+}
+አስተዋውቅ ሀ = አዲስ ሰው("አሊ")
+አስተዋውቅ ተ = አዲስ ተማሪ("ሰላም")
+አስተዋውቅ ቀ = አዲስ ተማሪ("ብርሃን")
+ማተም ሀ.ሰላምታ()
+ማተም ተ.ሰላምታ()
+ማተም ተ.ዓይነቱ()
+አስተዋውቅ ው = ተ.አዘጋጅ(3)
+ው = ቀ.አዘጋጅ(4)
+ማተም ተ
+"""
+
+
+def run(backend):
+    output = MemorySink()
+    interpreter = backend(output)
+    interpreter.run_source(PROGRAM)
+    output.flush()
+    return interpreter, output.getvalue()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_inherited_and_overridden_methods(backend):
+    interpreter, stdout = run(backend)
+    assert stdout.splitlines()[:3] == ["ሰላም አሊ", "ተማሪ ሰላም", "ሰው"]
+
+    person = interpreter.class_tables["ሰው"]
+    student = interpreter.class_tables["ተማሪ"]
+    assert set(student.methods) == {"መጀመሪያ", "ሰላምታ", "ዓይነቱ", "አዘጋጅ"}
+    # Inherited methods are the parent's own nodes; overrides replace them
+    assert student.methods["ዓይነቱ"] is person.methods["ዓይነቱ"]
+    assert student.methods["ሰላምታ"] is not person.methods["ሰላምታ"]
+    assert student.constructor is person.constructor
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_instances_share_shapes(backend):
+    interpreter, stdout = run(backend)
+    student = interpreter.class_tables["ተማሪ"]
+    # Declared properties, then those the constructor assigns
+    assert student.shape.names == {"ዓይነት": 0, "ስም": 1}
+
+    first = interpreter.get_variable("ተ")
+    second = interpreter.get_variable("ቀ")
+    # Both grew the same way, so they moved to the same wider shape
+    assert first.shape is second.shape
+    assert first.shape.names == {"ዓይነት": 0, "ስም": 1, "ደረጃ": 2}
+    assert first.shape.methods is student.methods
+    assert stdout.splitlines()[3] == (
+        "{'__class__': 'ተማሪ', '__parent__': 'ሰው', "
+        "'ዓይነት': 'ሰው', 'ስም': 'ሰላም', 'ደረጃ': 3.0}"
+    )
+
+
+def test_shape_transitions_are_cached():
+    shape = Shape("ነጥብ", names={"x": 0})
+    wider = shape.with_property("y")
+    assert shape.with_property("y") is wider
+    assert wider.names == {"x": 0, "y": 1}
+    assert shape.names == {"x": 0}
+    assert wider.with_property("z") is not shape.with_property("z")
+
+
+def test_object_behaves_as_a_mapping():
+    point = GeEzObject(Shape("ነጥብ", "ቅርጽ", {"x": 0, "y": 1}))
+    point["x"] = 1
+    assert point.get_property("y") is UNSET
+    assert dict(point.items()) == {"__class__": "ነጥብ", "__parent__": "ቅርጽ", "x": 1}
+    assert "y" not in point
+    point["z"] = 3
+    assert point.values == [1, UNSET, 3]
+    assert point == {"__class__": "ነጥብ", "__parent__": "ቅርጽ", "x": 1, "z": 3}
+    del point["x"]
+    with pytest.raises(KeyError):
+        point["x"]
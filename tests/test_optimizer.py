@@ -0,0 +1,97 @@
+"""The optimizer folds constants without changing what a program does"""
+
+import pytest
+
+from geez.interpreter import GeEzInterpreter
+from geez.lexer import GeEzLexer
+from geez.optimizer import Optimizer
+from geez.output import MemorySink
+from geez.parser import GeEzParser
+
+
+def optimize(source):
+    statements = GeEzParser(GeEzLexer().tokenize(source)).parse()
+    return Optimizer(GeEzInterpreter()).optimize(statements)
+
+
+def run(source, use_optimizer):
+    output = MemorySink()
+    interpreter = GeEzInterpreter(output)
+    interpreter.use_optimizer = use_optimizer
+    interpreter.run_source(source)
+    output.flush()
+    return output.getvalue()
+
+
+@pytest.mark.parametrize(
+    "text, folded",
+    [
+        ("1 + 2 * 3", "Number(7.0)"),
+        ("-(2 - 5)", "Number(3.0)"),
+        ('"ሰላም" + " " + "ዓለም"', "String('ሰላም ዓለም')"),
+        ("1 < 2 እና 3 > 4", "Boolean(False)"),
+        ("(1, 2 + 3)", "Constant((1.0, 5.0))"),
+        # Operations that raise are left to fail at run time
+        ("1 / 0", "BinaryOp(Number(1.0), /, Number(0.0))"),
+        ('"a" - 1', "BinaryOp(String('a'), -, Number(1.0))"),
+    ],
+)
+def test_constant_folding(text, folded):
+    assert repr(optimize(f"ማተም {text}\n")[0].expression) == folded
+
+
+def test_dead_branches_are_removed():
+    statements = optimize("""
+ከሆነ ሐሰት {
+    ማተም "never"
+} አለበለዚያ x > 1 {
+    ማተም "maybe"
+} ካልሆነ {
+    ማተም "else"
+}
+ከሆነ 1 < 2 {
+    ማተም "always"
+} ካልሆነ {
+    ማተም "never"
+}
+ማተም "end"
+""")
+    assert repr(statements) == (
+        "[If(BinaryOp(Identifier(x), >, Number(1.0)), [Print(String('maybe'))], "
+        "elif:[], else:[Print(String('else'))]), "
+        "Print(String('always')), Print(String('end'))]"
+    )
+
+
+def test_if_that_ends_a_block_is_kept():
+    # Inlining it would change the value of the block
+    statements = optimize('ከሆነ እውነት {\n    ማተም "always"\n}\n')
+    assert repr(statements) == (
+        "[If(Boolean(True), [Print(String('always'))], elif:[], else:None)]"
+    )
+
+
+PROGRAM = """
+ተግባር ፍ() {
+    ማተም "called"
+    ተመለስ 0
+}
+ማተም ፍ() * 0
+ከሆነ ሐሰት {
+    ማተም "never"
+} አለበለዚያ ፍ() == 0 {
+    ማተም "elif"
+}
+ሞክር {
+    ማተም 1 / 0
+} ያዝ ("Exception", e) {
+    ማተም "caught"
+}
+ማተም 2 * 3
+"""
+
+
+def test_side_effects_are_kept():
+    expected = "called\n0.0\ncalled\nelif\ncaught\n6.0\n"
+    assert run(PROGRAM, use_optimizer=False) == expected
+    assert run(PROGRAM, use_optimizer=True) == expected
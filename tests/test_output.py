@@ -0,0 +1,88 @@
+"""Output sinks write out according to their flush policy"""
+
+import io
+import sys
+
+import pytest
+
+from geez.output import FileSink, MemorySink, StdoutSink, create_output
+
+
+def test_line_policy_writes_every_line():
+    target = io.BytesIO()
+    sink = FileSink(target, flush="line")
+    sink.print("ሰላም")
+    assert target.getvalue() == "ሰላም\n".encode("utf-8")
+    sink.write("ዓለም")
+    assert target.getvalue() == "ሰላም\nዓለም".encode("utf-8")
+
+
+def test_size_policy_writes_when_the_buffer_fills():
+    target = io.BytesIO()
+    sink = FileSink(target, flush="size", buffer_size=5)
+    # Four characters, ten bytes: the size is counted in characters
+    sink.print("ሀሀሀ")
+    assert target.getvalue() == b""
+    sink.print("1")
+    assert target.getvalue() == "ሀሀሀ\n1\n".encode("utf-8")
+    sink.print("2")
+    assert target.getvalue() == "ሀሀሀ\n1\n".encode("utf-8")
+    sink.close()
+    assert target.getvalue() == "ሀሀሀ\n1\n2\n".encode("utf-8")
+
+
+def test_exit_policy_writes_only_when_flushed():
+    target = io.BytesIO()
+    sink = FileSink(target, flush="exit", buffer_size=4)
+    for number in range(100):
+        sink.print(number)
+    assert target.getvalue() == b""
+    sink.flush()
+    assert target.getvalue().splitlines() == [b"%d" % n for n in range(100)]
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        MemorySink(flush="never")
+
+
+def test_memory_sink_includes_buffered_text():
+    sink = MemorySink()
+    sink.print(1.0)
+    sink.write("ሀ")
+    assert sink.getvalue() == "1.0\nሀ"
+
+
+def test_file_sink_owns_the_files_it_opens(tmp_path):
+    path = tmp_path / "out.txt"
+    sink = FileSink(str(path))
+    sink.print("ሰላም")
+    sink.close()
+    assert path.read_text(encoding="utf-8") == "ሰላም\n"
+    assert sink._file.closed
+
+    target = io.BytesIO()
+    FileSink(target).close()
+    assert not target.closed
+
+
+def test_stdout_sink_keeps_text_in_order(monkeypatch):
+    stream = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", stream)
+    sink = StdoutSink(flush="size")
+    stream.write("before\n")
+    sink.print("ሰላም")
+    sink.flush()
+    stream.write("after\n")
+    stream.flush()
+    assert stream.buffer.getvalue().decode("utf-8") == "before\nሰላም\nafter\n"
+
+
+def test_create_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    assert create_output().policy == "size"
+    assert create_output("-", flush="exit").policy == "exit"
+    assert isinstance(create_output("memory"), MemorySink)
+    sink = create_output(str(tmp_path / "out.txt"))
+    assert isinstance(sink, FileSink) and sink.policy == "size"
+    sink.close()
@@ -0,0 +1,109 @@
+"""The parser builds expression trees by precedence and associativity"""
+
+import pytest
+
+from geez.lexer import GeEzLexer
+from geez.parser import GeEzParser, NumberNode, TupleNode
+
+
+def parse_expression(text):
+    source = f"ማተም {text}\n"
+    statements = GeEzParser(GeEzLexer().tokenize(source)).parse()
+    return statements[0].expression
+
+
+@pytest.mark.parametrize(
+    "text, tree",
+    [
+        # Tighter operators group first
+        (
+            "1 + 2 * 3",
+            "BinaryOp(Number(1.0), +, BinaryOp(Number(2.0), *, Number(3.0)))",
+        ),
+        (
+            "1 * 2 + 3",
+            "BinaryOp(BinaryOp(Number(1.0), *, Number(2.0)), +, Number(3.0))",
+        ),
+        (
+            "1 + 2 < 3 * 4",
+            "BinaryOp(BinaryOp(Number(1.0), +, Number(2.0)), <, "
+            "BinaryOp(Number(3.0), *, Number(4.0)))",
+        ),
+        (
+            "1 < 2 == 3 > 4",
+            "BinaryOp(BinaryOp(Number(1.0), <, Number(2.0)), ==, "
+            "BinaryOp(Number(3.0), >, Number(4.0)))",
+        ),
+        (
+            "1 ወይም 2 እና 3",
+            "BinaryOp(Number(1.0), ወይም, BinaryOp(Number(2.0), እና, Number(3.0)))",
+        ),
+        # Prefix operators bind tighter than any binary operator
+        ("-2 * 3", "BinaryOp(UnaryOp(-, Number(2.0)), *, Number(3.0))"),
+        (
+            "አይደለም 1 እና 2",
+            "BinaryOp(UnaryOp(አይደለም, Number(1.0)), እና, Number(2.0))",
+        ),
+        # Parentheses override precedence
+        (
+            "(1 + 2) * 3",
+            "BinaryOp(BinaryOp(Number(1.0), +, Number(2.0)), *, Number(3.0))",
+        ),
+    ],
+)
+def test_precedence(text, tree):
+    assert repr(parse_expression(text)) == tree
+
+
+@pytest.mark.parametrize(
+    "text, tree",
+    [
+        (
+            "10 - 3 - 2",
+            "BinaryOp(BinaryOp(Number(10.0), -, Number(3.0)), -, Number(2.0))",
+        ),
+        (
+            "8 / 4 / 2",
+            "BinaryOp(BinaryOp(Number(8.0), /, Number(4.0)), /, Number(2.0))",
+        ),
+        (
+            "1 ወይም 2 ወይም 3",
+            "BinaryOp(BinaryOp(Number(1.0), ወይም, Number(2.0)), ወይም, Number(3.0))",
+        ),
+    ],
+)
+def test_left_associativity(text, tree):
+    assert repr(parse_expression(text)) == tree
+
+
+def test_parenthesised_expression_is_not_a_tuple():
+    expr = parse_expression("(1)")
+    assert isinstance(expr, NumberNode)
+    assert expr.value == 1.0
+
+
+@pytest.mark.parametrize(
+    "text, elements",
+    [
+        ("()", []),
+        ("(1,)", ["Number(1.0)"]),
+        ("(1, 2)", ["Number(1.0)", "Number(2.0)"]),
+        ("(1, 2 + 3)", ["Number(1.0)", "BinaryOp(Number(2.0), +, Number(3.0))"]),
+        ("((1), 2,)", ["Number(1.0)", "Number(2.0)"]),
+    ],
+)
+def test_tuples(text, elements):
+    expr = parse_expression(text)
+    assert isinstance(expr, TupleNode)
+    assert [repr(element) for element in expr.elements] == elements
+
+
+def test_token_sources_give_the_same_tree():
+    source = "ማተም (1 + 2) * 3 - 4 / (5, 6)\n"
+    lexer = GeEzLexer()
+    trees = [
+        repr(GeEzParser(lexer.tokenize(source)).parse()),
+        repr(GeEzParser(lexer.tokenize_buffer(source)).parse()),
+        repr(GeEzParser(lexer.iter_tokens(source)).parse()),
+    ]
+    assert trees[0] == trees[1] == trees[2]